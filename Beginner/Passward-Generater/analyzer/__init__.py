@@ -1,2 +1,3 @@
 from .strength import PasswordStrengthAnalyzer
 from .breach_check import check_password_breach
+from .audit import audit_file
@@ -0,0 +1,133 @@
+import json
+import os
+import time
+from collections import Counter, deque
+from multiprocessing import Pool
+from .strength import PasswordStrengthAnalyzer
+from utils.export import open_export_file
+from utils.helpers import mask_password
+
+# Passwords per worker task
+CHUNK_SIZE = 5000
+ENTROPY_BIN = 10       # bits per entropy histogram bin
+MAX_LENGTH_BIN = 64    # longer passwords share one length bin
+
+HISTOGRAMS = ("ratings", "entropy", "lengths", "patterns")
+
+_analyzer = PasswordStrengthAnalyzer()
+
+def _entropy_bin(entropy):
+    low = int(entropy // ENTROPY_BIN * ENTROPY_BIN)
+    return f"{low}-{low + ENTROPY_BIN - 1}"
+
+def _length_bin(length):
+    return str(length) if length < MAX_LENGTH_BIN else f"{MAX_LENGTH_BIN}+"
+
+def audit_chunk(chunk):
+    """
+    Analyze a chunk of ``(line_number, password)`` pairs.
+
+    Returns the chunk's JSONL rows as one string, the histogram counters
+    and the sum of the scores. Runs in the worker processes.
+    """
+    histograms = {name: Counter() for name in HISTOGRAMS}
+    rows = []
+    score_total = 0
+
+    for line_number, password in chunk:
+        result = _analyzer.analyze(password)
+        details = result["details"]
+        patterns = details["patterns"]
+        rows.append(json.dumps({
+            "line": line_number,
+            "password": mask_password(password),
+            "length": details["length"],
+            "score": result["score"],
+            "rating": result["rating"],
+            "entropy": result["entropy"],
+            "crack_time": result["crack_time"],
+            "patterns": patterns,
+        }, ensure_ascii=False))
+
+        score_total += result["score"]
+        histograms["ratings"][result["rating"]] += 1
+        histograms["entropy"][_entropy_bin(result["entropy"])] += 1
+        histograms["lengths"][_length_bin(details["length"])] += 1
+        histograms["patterns"].update(patterns)
+
+    return ''.join(row + '\n' for row in rows), histograms, score_total
+
+def _chunks(passwords, size):
+    chunk = []
+    for item in passwords:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def read_passwords(lines):
+    """Yield ``(line_number, password)`` for each non-blank line."""
+    for line_number, line in enumerate(lines, 1):
+        password = line.rstrip('\r\n')
+        if password:
+            yield line_number, password
+
+def audit_passwords(passwords, output, workers=None, chunk_size=CHUNK_SIZE):
+    """
+    Score ``(line_number, password)`` pairs and write one JSON row each.
+
+    Chunks are analyzed in worker processes and written in input order.
+    At most two chunks per worker are in flight, so memory stays bounded
+    however long the input is. ``output`` is compressed by its suffix as
+    in ``export_passwords``. Returns a summary dict with the histograms.
+    """
+    workers = workers or os.cpu_count() or 1
+    histograms = {name: Counter() for name in HISTOGRAMS}
+    total = score_total = 0
+    start = time.perf_counter()
+
+    def collect(text, counters, scores, count):
+        nonlocal total, score_total
+        f.write(text)
+        for name in HISTOGRAMS:
+            histograms[name].update(counters[name])
+        score_total += scores
+        total += count
+
+    with open_export_file(output) as f:
+        if workers == 1:
+            for chunk in _chunks(passwords, chunk_size):
+                collect(*audit_chunk(chunk), len(chunk))
+        else:
+            with Pool(workers) as pool:
+                pending = deque()
+                for chunk in _chunks(passwords, chunk_size):
+                    if len(pending) >= 2 * workers:
+                        result, count = pending.popleft()
+                        collect(*result.get(), count)
+                    pending.append((pool.apply_async(audit_chunk, (chunk,)), len(chunk)))
+                while pending:
+                    result, count = pending.popleft()
+                    collect(*result.get(), count)
+
+    elapsed = time.perf_counter() - start
+    return {
+        "passwords": total,
+        "mean_score": round(score_total / total, 1) if total else 0,
+        "elapsed_s": round(elapsed, 2),
+        "passwords_per_second": round(total / elapsed) if elapsed else 0,
+        "workers": workers,
+        "ratings": dict(histograms["ratings"].most_common()),
+        "entropy": dict(sorted(histograms["entropy"].items(),
+                               key=lambda item: int(item[0].split('-')[0]))),
+        "lengths": dict(sorted(histograms["lengths"].items(),
+                               key=lambda item: int(item[0].rstrip('+')))),
+        "patterns": dict(histograms["patterns"].most_common()),
+    }
+
+def audit_file(filename, output, workers=None, chunk_size=CHUNK_SIZE):
+    """Audit every password in ``filename`` (one per line); see audit_passwords."""
+    with open(filename, encoding='utf-8', errors='replace') as f:
+        return audit_passwords(read_passwords(f), output, workers, chunk_size)
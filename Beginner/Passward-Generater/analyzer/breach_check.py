@@ -1,11 +1,23 @@
 import hashlib
-import requests
+
+try:
+    import requests
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
 
 def check_password_breach(password):
     """
     Check if a password has been found in data breaches.
     Uses the Have I Been Pwned API with k-anonymity.
     """
+    if not HAS_REQUESTS:
+        return {
+            "breached": None,
+            "count": 0,
+            "message": "⚠️  requests not installed. Install with: pip install requests"
+        }
+
     sha1_hash = hashlib.sha1(password.encode('utf-8')).hexdigest().upper()
     prefix = sha1_hash[:5]
     suffix = sha1_hash[5:]
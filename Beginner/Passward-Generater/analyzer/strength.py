@@ -1,7 +1,26 @@
 import math
-import re
+from utils.helpers import character_classes
 from .common_passwords import COMMON_PASSWORDS, KEYBOARD_PATTERNS
 
+def scan_characters(password):
+    """
+    Classify a password's characters and count its runs.
+
+    Returns ``(has_lower, has_upper, has_digit, has_symbol, sequential,
+    repeated)``, where the last two count runs of three ascending
+    (``abc``) or equal (``aaa``) characters.
+    """
+    flags = character_classes(password)[:4]
+    codes = password.encode() if password.isascii() else [ord(c) for c in password]
+
+    sequential = repeated = 0
+    for x, y, z in zip(codes, codes[1:], codes[2:]):
+        if y == x + 1 and z == x + 2:
+            sequential += 1
+        elif x == y == z:
+            repeated += 1
+    return (*flags, sequential, repeated)
+
 class PasswordStrengthAnalyzer:
     """Analyze and score password strength."""
 
@@ -25,11 +44,10 @@ class PasswordStrengthAnalyzer:
         details = {}
 
         length = len(password)
-        has_lower = bool(re.search(r'[a-z]', password))
-        has_upper = bool(re.search(r'[A-Z]', password))
-        has_digit = bool(re.search(r'\d', password))
-        has_symbol = bool(re.search(r'[!@#$%^&*()_+\-=\[\]{}|;:,.<>?/~`\\\'"]', password))
+        (has_lower, has_upper, has_digit, has_symbol,
+         sequential, repeated) = scan_characters(password)
         unique_chars = len(set(password))
+        patterns = []
 
         details["length"] = length
         details["has_lowercase"] = has_lower
@@ -77,33 +95,30 @@ class PasswordStrengthAnalyzer:
         details["uniqueness_ratio"] = round(uniqueness_ratio, 2)
 
         # ── Pattern detection ──
-        if password.lower() in COMMON_PASSWORDS:
+        lower_pass = password.lower()
+        if lower_pass in COMMON_PASSWORDS:
             score -= 30
             feedback.append("🚨 This is a very common password!")
+            patterns.append("common")
 
-        lower_pass = password.lower()
         for pattern in KEYBOARD_PATTERNS:
             if pattern in lower_pass:
                 score -= 10
                 feedback.append(f"⚠️  Contains keyboard pattern: '{pattern}'")
+                patterns.append("keyboard")
                 break
 
-        sequential = 0
-        for i in range(len(password) - 2):
-            if (ord(password[i+1]) == ord(password[i]) + 1 and
-                ord(password[i+2]) == ord(password[i]) + 2):
-                sequential += 1
         if sequential > 0:
             score -= sequential * 5
             feedback.append("⚠️  Contains sequential characters")
+            patterns.append("sequential")
 
-        repeated = 0
-        for i in range(len(password) - 2):
-            if password[i] == password[i+1] == password[i+2]:
-                repeated += 1
         if repeated > 0:
             score -= repeated * 5
             feedback.append("⚠️  Contains repeated characters (e.g., 'aaa')")
+            patterns.append("repeated")
+
+        details["patterns"] = patterns
 
         # ── Calculate entropy ──
         pool_size = 0
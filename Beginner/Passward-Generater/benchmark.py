@@ -0,0 +1,148 @@
+"""
+Throughput benchmark for the password generators.
+
+Times ``generate_password`` called once per password against the bulk
+generator and reports passwords per second for each. With ``--pattern``
+it compares the old per-character pattern parser with a compiled
+pattern's batches:
+
+    python benchmark.py
+    python benchmark.py -n 1000000 -l 24 --json
+    python benchmark.py --pattern "Llll-dddd-ssss"
+"""
+
+import argparse
+import json
+import secrets
+import string
+import sys
+import time
+
+from generators import generate_password, generate_passwords, compile_pattern
+
+def time_generation(generate, count):
+    """Run ``generate(count)`` to exhaustion and return the elapsed seconds."""
+    start = time.perf_counter()
+    for _ in generate(count):
+        pass
+    return time.perf_counter() - start
+
+def run_benchmark(count=100_000, length=16, **options):
+    """
+    Benchmark both generation paths and return a report dict.
+
+    ``options`` are passed to both generators (see ``generate_password``).
+    """
+    def single(n):
+        return (generate_password(length, **options) for _ in range(n))
+
+    def bulk(n):
+        return generate_passwords(n, length, **options)
+
+    report = _compare((("generate_password", single), ("bulk", bulk)), count)
+    report.update(length=length, options=options)
+    return report
+
+def legacy_generate_from_pattern(pattern):
+    """
+    The pattern parser from before patterns were compiled, kept as the
+    baseline. It walks the pattern for every password and knows only the
+    single-character codes and ``\\`` escapes, so patterns with ``[...]``
+    classes or ``{n}`` repeats mean something else to it.
+    """
+    result = []
+    i = 0
+
+    char_map = {
+        'L': string.ascii_uppercase,
+        'l': string.ascii_lowercase,
+        'd': string.digits,
+        's': "!@#$%^&*()_+-=",
+        'a': string.ascii_letters,
+        'A': string.ascii_letters + string.digits,
+        '*': string.ascii_letters + string.digits + "!@#$%^&*",
+        'x': string.hexdigits[:16],  # 0-9, a-f
+    }
+
+    while i < len(pattern):
+        char = pattern[i]
+
+        # Escape character
+        if char == '\\' and i + 1 < len(pattern):
+            result.append(pattern[i + 1])
+            i += 2
+            continue
+
+        if char in char_map:
+            result.append(secrets.choice(char_map[char]))
+        else:
+            result.append(char)
+        i += 1
+
+    return ''.join(result)
+
+def run_pattern_benchmark(pattern, count=100_000):
+    """Benchmark the old per-character parser against compiled batches."""
+    compiled = compile_pattern(pattern)
+
+    def single(n):
+        return (legacy_generate_from_pattern(pattern) for _ in range(n))
+
+    report = _compare((("legacy parser", single),
+                       ("compiled batch", compiled.generate)), count)
+    report.update(length=compiled.length, pattern=pattern,
+                  entropy_bits=round(compiled.entropy, 2))
+    return report
+
+def _compare(paths, count):
+    """Time each ``(name, generate)`` path; the first is the baseline."""
+    results = {}
+    for name, generate in paths:
+        elapsed = time_generation(generate, count)
+        results[name] = {
+            "seconds": round(elapsed, 4),
+            "passwords_per_second": round(count / elapsed) if elapsed else 0,
+        }
+
+    base, fast = (result["seconds"] for result in results.values())
+    return {
+        "count": count,
+        "results": results,
+        "speedup": round(base / fast, 1) if fast else None,
+    }
+
+def print_report(report):
+    if "pattern" in report:
+        print(f"\n  {report['count']:,} passwords from pattern {report['pattern']!r} "
+              f"({report['entropy_bits']} bits)\n")
+    else:
+        print(f"\n  {report['count']:,} passwords of length {report['length']}\n")
+    for name, result in report["results"].items():
+        print(f"  {name:<20}{result['passwords_per_second']:>12,} passwords/s"
+              f"  ({result['seconds']:.2f}s)")
+    print(f"\n  Speedup: {report['speedup']}x\n")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark password generation.")
+    parser.add_argument('--count', '-n', type=int, default=100_000)
+    parser.add_argument('--length', '-l', type=int, default=16)
+    parser.add_argument('--no-symbols', action='store_true')
+    parser.add_argument('--no-ambiguous', action='store_true')
+    parser.add_argument('--pattern', '-p', type=str, help='Benchmark pattern generation instead')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args(argv)
+
+    if args.pattern:
+        report = run_pattern_benchmark(args.pattern, args.count)
+    else:
+        report = run_benchmark(args.count, args.length,
+                               use_symbols=not args.no_symbols,
+                               exclude_ambiguous=args.no_ambiguous)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 from .random_gen import generate_password
+from .bulk_gen import BulkPasswordGenerator, generate_passwords
 from .passphrase_gen import generate_passphrase
 from .pronounceable_gen import generate_pronounceable
-from .pattern_gen import generate_from_pattern
-from .pin_gen import generate_pin
+from .pattern_gen import generate_from_pattern, compile_pattern
+from .pin_gen import generate_pin, generate_pins, count_pins, pin_space
@@ -0,0 +1,96 @@
+import os
+import re
+from .random_gen import build_char_pool
+
+# Random bytes drawn per block
+BLOCK_SIZE = 64 * 1024
+
+class BulkPasswordGenerator:
+    """
+    Generate large numbers of random passwords from one compiled pool.
+
+    The character pool is built once. Each block of ``os.urandom`` bytes
+    is mapped to pool characters with a single ``bytes.translate`` call:
+    byte values past the largest multiple of the pool size are dropped,
+    so every character is equally likely (rejection sampling). The
+    characters are then cut into passwords.
+
+    With ``must_include_each`` a password that misses a required category
+    is rejected as a whole, so every password that includes each category
+    is equally likely.
+    """
+
+    def __init__(
+        self,
+        length=16,
+        use_uppercase=True,
+        use_lowercase=True,
+        use_digits=True,
+        use_symbols=True,
+        exclude_ambiguous=False,
+        exclude_chars="",
+        must_include_each=True,
+        block_size=BLOCK_SIZE
+    ):
+        if length < 1:
+            raise ValueError("Password length must be at least 1.")
+
+        char_pool, required_chars = build_char_pool(
+            length, use_uppercase, use_lowercase, use_digits, use_symbols,
+            exclude_ambiguous, exclude_chars, must_include_each
+        )
+        self.length = length
+        self.char_pool = char_pool
+        self.block_size = max(block_size, 4 * length)
+
+        # ── Byte → character table ──
+        size = len(char_pool)
+        limit = 256 - 256 % size
+        self._table = bytes(ord(char_pool[b % size]) for b in range(256))
+        self._rejected = bytes(range(limit, 256))
+        self._split = re.compile('.{%d}' % length, re.S)
+
+        # Categories that cover the whole pool can never be missing
+        checks = [cat for cat in required_chars if set(char_pool) - set(cat)]
+        self._is_valid = None
+        if checks:
+            lookaheads = ''.join(f'(?=.*[{re.escape(cat)}])' for cat in checks)
+            self._is_valid = re.compile(lookaheads, re.S).match
+
+    def batch(self, count=None):
+        """
+        Return the passwords from one block of random bytes.
+
+        With ``count`` the block is sized for about that many passwords,
+        so small requests don't draw a full block.
+        """
+        size = self.block_size
+        if count is not None:
+            size = min(size, 2 * count * self.length + 64)
+        chars = os.urandom(size).translate(self._table, self._rejected)
+        passwords = self._split.findall(chars.decode('ascii'))
+        if self._is_valid:
+            passwords = list(filter(self._is_valid, passwords))
+        return passwords
+
+    def batches(self, count):
+        """Yield lists of passwords, ``count`` passwords in total."""
+        while count > 0:
+            passwords = self.batch(count)[:count]
+            count -= len(passwords)
+            if passwords:
+                yield passwords
+
+    def generate(self, count):
+        """Yield ``count`` passwords one at a time."""
+        for passwords in self.batches(count):
+            yield from passwords
+
+def generate_passwords(count, length=16, **options):
+    """
+    Generate ``count`` random passwords lazily.
+
+    Takes the same options as ``generate_password``; see
+    ``BulkPasswordGenerator``.
+    """
+    return BulkPasswordGenerator(length, **options).generate(count)
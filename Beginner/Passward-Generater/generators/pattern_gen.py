@@ -1,40 +1,201 @@
+import math
+import os
+import re
 import secrets
 import string
+from functools import lru_cache
+from itertools import repeat
 
-def generate_from_pattern(pattern):
+CHAR_MAP = {
+    'L': string.ascii_uppercase,
+    'l': string.ascii_lowercase,
+    'd': string.digits,
+    's': "!@#$%^&*()_+-=",
+    'a': string.ascii_letters,
+    'A': string.ascii_letters + string.digits,
+    '*': string.ascii_letters + string.digits + "!@#$%^&*",
+    'x': string.hexdigits[:16],  # 0-9, a-f
+}
+
+_REPEAT = re.compile(r'\{(\d+)\}')
+
+class CompiledPattern:
     """
-    Generate a password based on a pattern string.
+    A parsed pattern: literal text and character-set slots.
+
+    ``segments`` is a list of ``(text, count)``. A literal segment has
+    ``count=None`` and is copied as is; any other segment is ``count``
+    characters drawn independently from the characters in ``text``.
     """
-    result = []
-    i = 0
 
-    char_map = {
-        'L': string.ascii_uppercase,
-        'l': string.ascii_lowercase,
-        'd': string.digits,
-        's': "!@#$%^&*()_+-=",
-        'a': string.ascii_letters,
-        'A': string.ascii_letters + string.digits,
-        '*': string.ascii_letters + string.digits + "!@#$%^&*",
-        'x': string.hexdigits[:16],  # 0-9, a-f
-    }
+    def __init__(self, pattern, segments):
+        self.pattern = pattern
+        self.segments = segments
+        self.length = sum(len(text) if count is None else count
+                          for text, count in segments)
+
+        # Exact size of the output space: every slot is independent
+        self.combinations = math.prod(len(text) ** count
+                                      for text, count in segments
+                                      if count is not None)
+        self.entropy = sum(count * math.log2(len(text))
+                           for text, count in segments if count is not None)
+
+        # Byte → character tables for unbiased sampling (see bulk_gen)
+        self._tables = {}
+        for text, count in segments:
+            if count is not None and text not in self._tables:
+                self._tables[text] = _byte_table(text)
+
+    def _draw(self, charset, n, buffer, pos):
+        """Draw ``n`` characters from ``charset``, reading ``buffer`` at ``pos``."""
+        table = self._tables[charset]
+        if table is None:
+            return ''.join(secrets.choice(charset) for _ in range(n)), pos
+
+        table, rejected, limit = table
+        take = n * 256 // limit + 16
+        chars = buffer[pos:pos + take].translate(table, rejected)
+        pos += take
+        while len(chars) < n:
+            chars += os.urandom(take).translate(table, rejected)
+        return chars[:n].decode('latin-1'), pos
+
+    def batch(self, count):
+        """Generate ``count`` outputs from one buffer of random bytes."""
+        needed = {}
+        for text, slots in self.segments:
+            if slots is not None:
+                needed[text] = needed.get(text, 0) + slots * count
+
+        buffer = os.urandom(sum(n * 256 // self._tables[text][2] + 16
+                                for text, n in needed.items()
+                                if self._tables[text] is not None))
+        pos = 0
+        drawn = {}
+        for text, n in needed.items():
+            drawn[text], pos = self._draw(text, n, buffer, pos)
+
+        # One column per segment; zip then joins the columns row by row
+        columns = []
+        offsets = dict.fromkeys(needed, 0)
+        for text, slots in self.segments:
+            if slots is None:
+                columns.append(repeat(text, count))
+                continue
+            start = offsets[text]
+            offsets[text] += slots * count
+            chars = drawn[text][start:offsets[text]]
+            if slots == 1:
+                columns.append(chars)
+            else:
+                columns.append([chars[i:i + slots] for i in range(0, len(chars), slots)])
+
+        if not columns:
+            return [''] * count
+        return list(map(''.join, zip(*columns)))
+
+    def generate(self, count, batch_size=10_000):
+        """Yield ``count`` outputs, ``batch_size`` at a time."""
+        while count > 0:
+            size = min(count, batch_size)
+            yield from self.batch(size)
+            count -= size
+
+def _byte_table(charset):
+    """Return ``(table, rejected, limit)`` for a charset, or None if it can't use one."""
+    if len(charset) > 256 or max(map(ord, charset)) > 255:
+        return None
+    size = len(charset)
+    limit = 256 - 256 % size
+    table = bytes(ord(charset[b % size]) for b in range(256))
+    return table, bytes(range(limit, 256)), limit
+
+def _parse_class(pattern, i):
+    """
+    Parse a ``[...]`` class starting at ``pattern[i]``.
+
+    Returns the class characters (duplicates removed) and the index after
+    the closing bracket, or None if the bracket is never closed.
+    """
+    items = []
+    i += 1
+    while i < len(pattern) and pattern[i] != ']':
+        char = pattern[i]
+        if char == '\\' and i + 1 < len(pattern):
+            char = pattern[i + 1]
+            i += 1
+        items.append(char)
+        i += 1
+    if i >= len(pattern):
+        return None
+
+    chars = []
+    j = 0
+    while j < len(items):
+        # a-f style range; a '-' at either end is literal
+        if j + 2 < len(items) and items[j + 1] == '-':
+            low, high = ord(items[j]), ord(items[j + 2])
+            if low > high:
+                raise ValueError(f"Bad range {items[j]}-{items[j + 2]} in pattern")
+            chars.extend(map(chr, range(low, high + 1)))
+            j += 3
+        else:
+            chars.append(items[j])
+            j += 1
+    if not chars:
+        raise ValueError("Empty character class [] in pattern")
+    return ''.join(dict.fromkeys(chars)), i + 1
+
+@lru_cache(maxsize=128)
+def compile_pattern(pattern):
+    """
+    Parse a pattern once into a reusable CompiledPattern.
+
+    Besides the single-character codes in CHAR_MAP and ``\\`` escapes,
+    ``[A-F]`` or ``[xyz]`` is a custom class and ``{n}`` repeats the
+    previous code, class or character ``n`` times (``d{6}``). Anything
+    else, including a ``[`` or ``{`` that doesn't start one of these, is
+    copied literally.
+    """
+    segments = []
+    i = 0
 
     while i < len(pattern):
         char = pattern[i]
 
         # Escape character
         if char == '\\' and i + 1 < len(pattern):
-            result.append(pattern[i + 1])
+            segment = (pattern[i + 1], None)
             i += 2
-            continue
-
-        # Pattern character
-        if char in char_map:
-            result.append(secrets.choice(char_map[char]))
+        elif char == '[' and (parsed := _parse_class(pattern, i)):
+            segment = (parsed[0], 1)
+            i = parsed[1]
+        elif char in CHAR_MAP:
+            segment = (CHAR_MAP[char], 1)
+            i += 1
         else:
             # Literal character
-            result.append(char)
+            segment = (char, None)
+            i += 1
 
-        i += 1
+        match = _REPEAT.match(pattern, i)
+        if match:
+            times = int(match.group(1))
+            text, count = segment
+            segment = (text * times, None) if count is None else (text, times)
+            i = match.end()
+
+        text, count = segment
+        if count is None and segments and segments[-1][1] is None:
+            segments[-1] = (segments[-1][0] + text, None)
+        elif count != 0 and text:
+            segments.append(segment)
+
+    return CompiledPattern(pattern, segments)
 
-    return ''.join(result)
+def generate_from_pattern(pattern):
+    """
+    Generate a password based on a pattern string.
+    """
+    return compile_pattern(pattern).batch(1)[0]
@@ -1,42 +1,117 @@
+import math
 import secrets
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+
+# The count table grows with the square of the length (its numbers get
+# longer too), so constrained PINs are capped
+MAX_CONSTRAINED_LENGTH = 256
+
+class PinSpace:
+    """
+    All valid PINs of one length, counted exactly.
+
+    ``no_repeated`` forbids three equal digits in a row (``777``) and
+    ``no_sequential`` three consecutive digits going up or down by one
+    (``123``, ``987``). Both rules only look at the last two digits, so
+    the PINs are counted with a small table over those: ``ways[r][s]`` is
+    the number of valid ways to add ``r`` more digits after the digit
+    pair ``s`` (``10 * a + b``). With the counts a PIN can be picked
+    uniformly in one pass: draw its rank in ``range(size)`` and walk the
+    table digit by digit, with no retries.
+    """
+
+    def __init__(self, length=4, no_repeated=False, no_sequential=False):
+        if length < 0:
+            raise ValueError("PIN length can't be negative.")
+        self.length = length
+        # Neither rule can apply to fewer than three digits
+        self.constrained = length >= 3 and (no_repeated or no_sequential)
+
+        if not self.constrained:
+            self.size = 10 ** length
+            return
+        if length > MAX_CONSTRAINED_LENGTH:
+            raise ValueError("PINs without repeats or sequences can be at most "
+                             f"{MAX_CONSTRAINED_LENGTH} digits long.")
+
+        # Digits allowed after each pair
+        self._allowed = []
+        for state in range(100):
+            a, b = divmod(state, 10)
+            self._allowed.append([
+                c for c in range(10)
+                if not (no_repeated and a == b == c)
+                and not (no_sequential and (b - a == c - b) and abs(c - b) == 1)
+            ])
+
+        # ways[r][s] for r = 0 .. length - 2
+        ways = [[1] * 100]
+        for _ in range(length - 2):
+            last = ways[-1]
+            ways.append([sum(last[(s % 10) * 10 + c] for c in self._allowed[s])
+                         for s in range(100)])
+        self._ways = ways
+
+        self._first = list(accumulate(ways[-1]))
+        self.size = self._first[-1]
+
+    @property
+    def entropy(self):
+        """Entropy in bits of a uniformly chosen valid PIN."""
+        return math.log2(self.size)
+
+    def pin(self, rank):
+        """Return the valid PIN at ``rank`` in ascending order."""
+        if not 0 <= rank < self.size:
+            raise ValueError(f"Rank must be in range({self.size}).")
+        if not self.constrained:
+            return f"{rank:0{self.length}d}" if self.length else ""
+
+        state = bisect_right(self._first, rank)
+        if state:
+            rank -= self._first[state - 1]
+        digits = [state // 10, state % 10]
+
+        for remaining in range(self.length - 2, 0, -1):
+            # Split ways[remaining][state] by the next digit
+            after = self._ways[remaining - 1]
+            base = (state % 10) * 10
+            for digit in self._allowed[state]:
+                count = after[base + digit]
+                if rank < count:
+                    break
+                rank -= count
+            digits.append(digit)
+            state = base + digit
+        return ''.join(map(str, digits))
+
+    def sample(self):
+        """Return a uniformly random valid PIN."""
+        return self.pin(secrets.randbelow(self.size))
+
+    def generate(self, count):
+        """Yield ``count`` uniformly random valid PINs."""
+        randbelow, size, pin = secrets.randbelow, self.size, self.pin
+        for _ in range(count):
+            yield pin(randbelow(size))
+
+@lru_cache(maxsize=8)
+def pin_space(length=4, no_repeated=False, no_sequential=False):
+    """Return the (cached) PinSpace for these options."""
+    return PinSpace(length, no_repeated, no_sequential)
 
 def generate_pin(length=4, no_repeated=False, no_sequential=False):
     """
     Generate a random PIN.
     """
-    max_attempts = 1000
-    attempts = 0
-
-    while attempts < max_attempts:
-        pin = ''.join(str(secrets.randbelow(10)) for _ in range(length))
-        attempts += 1
-
-        # Check for repeated digits
-        if no_repeated:
-            has_repeated = False
-            for i in range(len(pin) - 2):
-                if pin[i] == pin[i+1] == pin[i+2]:
-                    has_repeated = True
-                    break
-            if has_repeated:
-                continue
-
-        # Check for sequential digits
-        if no_sequential:
-            has_sequential = False
-            for i in range(len(pin) - 2):
-                if (int(pin[i+1]) == int(pin[i]) + 1 and
-                    int(pin[i+2]) == int(pin[i]) + 2):
-                    has_sequential = True
-                    break
-                if (int(pin[i+1]) == int(pin[i]) - 1 and
-                    int(pin[i+2]) == int(pin[i]) - 2):
-                    has_sequential = True
-                    break
-            if has_sequential:
-                continue
+    return pin_space(length, no_repeated, no_sequential).sample()
 
-        return pin
+def generate_pins(count, length=4, no_repeated=False, no_sequential=False):
+    """Generate ``count`` random PINs lazily."""
+    return pin_space(length, no_repeated, no_sequential).generate(count)
 
-    # Fallback
-    return ''.join(str(secrets.randbelow(10)) for _ in range(length))
+def count_pins(length=4, no_repeated=False, no_sequential=False):
+    """Return the number of valid PINs for these options."""
+    return pin_space(length, no_repeated, no_sequential).size
@@ -1,7 +1,7 @@
 import secrets
 import string
 
-def generate_password(
+def build_char_pool(
     length=16,
     use_uppercase=True,
     use_lowercase=True,
@@ -12,7 +12,10 @@ def generate_password(
     must_include_each=True
 ):
     """
-    Generate a cryptographically secure random password.
+    Build the character pool and the required categories for a password.
+
+    Returns ``(char_pool, required_chars)``; ``required_chars`` is empty
+    unless ``must_include_each`` is set.
     """
     # ── Build character pool ──
     char_pool = ""
@@ -74,6 +77,25 @@ def generate_password(
 
     # Filter out empty required categories
     required_chars = [cat for cat in required_chars if cat]
+    return char_pool, required_chars
+
+def generate_password(
+    length=16,
+    use_uppercase=True,
+    use_lowercase=True,
+    use_digits=True,
+    use_symbols=True,
+    exclude_ambiguous=False,
+    exclude_chars="",
+    must_include_each=True
+):
+    """
+    Generate a cryptographically secure random password.
+    """
+    char_pool, required_chars = build_char_pool(
+        length, use_uppercase, use_lowercase, use_digits, use_symbols,
+        exclude_ambiguous, exclude_chars, must_include_each
+    )
 
     # ── Generate password ──
     if must_include_each and required_chars:
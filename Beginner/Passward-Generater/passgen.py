@@ -4,10 +4,10 @@ import os
 import time
 from colorama import init, Fore, Style
 from generators import (
-    generate_password, generate_passphrase, 
-    generate_pronounceable, generate_from_pattern, generate_pin
+    generate_passwords, generate_passphrase, 
+    generate_pronounceable, compile_pattern, generate_pins, pin_space
 )
-from analyzer import PasswordStrengthAnalyzer, check_password_breach
+from analyzer import PasswordStrengthAnalyzer, check_password_breach, audit_file
 from utils import (
     copy_to_clipboard, PasswordHistory, export_passwords, 
     generate_qr_code, mask_password
@@ -29,8 +29,10 @@ Examples:
   python passgen.py --mode pin -l 6            # 6-digit PIN
   python passgen.py --mode pattern -p "Llll-dddd"  # Pattern-based
   python passgen.py -n 10 --export bulk.csv    # Generate & export 10
+  python passgen.py -n 1000000 --export bulk.jsonl.gz --format jsonl
   python passgen.py --analyze "MyPassword1!"   # Analyze strength
   python passgen.py --check-breach "password"  # Check data breaches
+  python passgen.py --audit dump.txt           # Score a file of passwords
   python passgen.py --interactive              # Interactive mode
         """
     )
@@ -71,6 +73,10 @@ Examples:
     parser.add_argument('--add-number', action='store_true', help='Add number to passphrase')
     parser.add_argument('--add-symbol', action='store_true', help='Add symbol to passphrase')
 
+    # ── PIN options ──
+    parser.add_argument('--no-repeated', action='store_true', help='PINs without three equal digits in a row')
+    parser.add_argument('--no-sequential', action='store_true', help='PINs without runs like 123 or 987')
+
     # ── Pattern options ──
     parser.add_argument('--pattern', '-p', type=str, help='Pattern for pattern-based generation')
 
@@ -78,12 +84,16 @@ Examples:
     parser.add_argument('--analyze', '-a', type=str, help='Analyze strength of a given password')
     parser.add_argument('--check-breach', type=str, help='Check if password is in known breaches')
     parser.add_argument('--verbose', '-v', action='store_true', help='Show detailed strength analysis')
+    parser.add_argument('--audit', type=str, metavar='FILE', help='Score every password in FILE (one per line)')
+    parser.add_argument('--audit-output', type=str, default='audit.jsonl', help='Per-password audit results (JSONL, .gz/.zst compressed)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes for --audit (default: all CPUs)')
 
     # ── Output ──
     parser.add_argument('--copy', '-c', action='store_true', help='Copy password to clipboard')
     parser.add_argument('--no-auto-clear', action='store_true', help='Don\'t auto-clear clipboard')
     parser.add_argument('--export', type=str, help='Export passwords to file')
-    parser.add_argument('--format', choices=['txt', 'csv', 'json'], default='txt', help='Export format')
+    parser.add_argument('--format', choices=['txt', 'csv', 'json', 'jsonl'], default='txt', help='Export format')
+    parser.add_argument('--compress', choices=['none', 'gzip', 'zstd'], help='Compress the export (default: from the .gz/.zst suffix)')
     parser.add_argument('--qr', action='store_true', help='Generate QR code for password')
 
     # ── History ──
@@ -103,6 +113,66 @@ def interactive_mode():
     from interactive import run_interactive
     run_interactive()
 
+def iter_passwords(args):
+    """Yield ``args.count`` passwords for the selected mode."""
+    if args.mode == 'random' or args.digits_only:
+        yield from generate_passwords(
+            args.count,
+            length=args.length,
+            use_uppercase=not args.no_uppercase and not args.digits_only,
+            use_lowercase=not args.no_lowercase and not args.digits_only,
+            use_digits=not args.no_digits,
+            use_symbols=not args.no_symbols and not args.digits_only,
+            exclude_ambiguous=args.no_ambiguous,
+            exclude_chars=args.exclude,
+        )
+        return
+
+    if args.mode == 'pattern':
+        yield from compile_pattern(args.pattern).generate(args.count)
+        return
+
+    if args.mode == 'pin':
+        yield from generate_pins(args.count, args.length,
+                                 args.no_repeated, args.no_sequential)
+        return
+
+    for _ in range(args.count):
+        if args.mode == 'passphrase':
+            yield generate_passphrase(
+                num_words=args.words,
+                separator=args.separator,
+                capitalize=args.capitalize,
+                include_number=args.add_number,
+                include_symbol=args.add_symbol,
+            )
+        elif args.mode == 'pronounceable':
+            yield generate_pronounceable(length=args.length)
+
+def format_count(count, bits):
+    """Format a count with separators, or as a power of two once it's huge."""
+    # Very large ints can't be printed in full (and wouldn't be readable)
+    if bits < 100:
+        return f"{count:,}"
+    return f"~2^{bits:.0f}"
+
+def print_audit_summary(summary, output):
+    total = summary['passwords']
+    print(Fore.CYAN + Style.BRIGHT + f"\n  🔎 Audited {total:,} passwords")
+    print(Fore.CYAN + "  ─────────────────────────────")
+    print(Fore.WHITE + f"  Mean score: {summary['mean_score']}   "
+          f"({summary['passwords_per_second']:,} passwords/s on {summary['workers']} workers)")
+
+    for title, key in (("Rating", "ratings"), ("Entropy (bits)", "entropy"),
+                       ("Length", "lengths"), ("Patterns", "patterns")):
+        print(Fore.CYAN + f"\n  {title}:")
+        for label, count in summary[key].items():
+            share = count / total if total else 0
+            bar = "█" * round(share * 30)
+            print(Fore.WHITE + f"    {label:<12}{count:>10,}  {share:>6.1%}  {bar}")
+
+    print(Fore.GREEN + f"\n  📄 Per-password results: {output}")
+
 def cli_main():
     parser = create_parser()
     args = parser.parse_args()
@@ -128,42 +198,54 @@ def cli_main():
             print(f"    {tip}")
         return
 
+    if args.audit:
+        try:
+            summary = audit_file(args.audit, args.audit_output, workers=args.workers)
+        except (OSError, ValueError) as e:
+            print(Fore.RED + f"  ❌ Audit failed: {e}")
+            return
+        print_audit_summary(summary, args.audit_output)
+        print()
+        return
+
     if args.check_breach:
         result = check_password_breach(args.check_breach)
         print(f"\n  Password: {mask_password(args.check_breach)}")
         print(f"  {result['message']}\n")
         return
 
-    passwords = []
-    for _ in range(args.count):
-        if args.mode == 'random' or args.digits_only:
-            pwd = generate_password(
-                length=args.length,
-                use_uppercase=not args.no_uppercase and not args.digits_only,
-                use_lowercase=not args.no_lowercase and not args.digits_only,
-                use_digits=not args.no_digits,
-                use_symbols=not args.no_symbols and not args.digits_only,
-                exclude_ambiguous=args.no_ambiguous,
-                exclude_chars=args.exclude,
-            )
-        elif args.mode == 'passphrase':
-            pwd = generate_passphrase(
-                num_words=args.words,
-                separator=args.separator,
-                capitalize=args.capitalize,
-                include_number=args.add_number,
-                include_symbol=args.add_symbol,
-            )
-        elif args.mode == 'pronounceable':
-            pwd = generate_pronounceable(length=args.length)
-        elif args.mode == 'pin':
-            pwd = generate_pin(length=args.length)
-        elif args.mode == 'pattern':
-            if not args.pattern:
-                print(Fore.RED + "  ❌ --pattern is required for pattern mode.")
-                return
-            pwd = generate_from_pattern(args.pattern)
-        passwords.append(pwd)
+    if args.mode == 'pattern':
+        if not args.pattern:
+            print(Fore.RED + "  ❌ --pattern is required for pattern mode.")
+            return
+        try:
+            compiled = compile_pattern(args.pattern)
+        except ValueError as e:
+            print(Fore.RED + f"  ❌ {e}")
+            return
+        print(Fore.WHITE + f"\n  Pattern entropy: {compiled.entropy:.1f} bits "
+              f"({format_count(compiled.combinations, compiled.entropy)} possible passwords)")
+
+    if args.mode == 'pin' and not args.digits_only:
+        try:
+            space = pin_space(args.length, args.no_repeated, args.no_sequential)
+        except ValueError as e:
+            print(Fore.RED + f"  ❌ {e}")
+            return
+        print(Fore.WHITE + f"\n  PIN space: {format_count(space.size, space.entropy)} valid PINs "
+              f"({space.entropy:.1f} bits)")
+
+    if args.export and not (args.save or args.verbose or args.copy or args.qr):
+        # Stream straight into the file; no password list is kept
+        try:
+            export_passwords(iter_passwords(args), args.export,
+                             format=args.format, compress=args.compress)
+        except ValueError as e:
+            print(Fore.RED + f"  ❌ {e}")
+        print()
+        return
+
+    passwords = list(iter_passwords(args))
 
     print(Fore.CYAN + Style.BRIGHT + "\n  🔐 Generated Password(s):")
     print(Fore.CYAN + "  ─────────────────────────────\n")
@@ -193,7 +275,7 @@ def cli_main():
         print(Fore.GREEN + f"\n  💾 Saved {len(passwords)} password(s) to history.")
 
     if args.export:
-        export_passwords(passwords, args.export, format=args.format)
+        export_passwords(passwords, args.export, format=args.format, compress=args.compress)
 
     if args.qr and len(passwords) == 1:
         generate_qr_code(passwords[0])
@@ -0,0 +1,54 @@
+import json
+import os
+import tempfile
+import unittest
+from analyzer import PasswordStrengthAnalyzer, audit_file
+from analyzer.strength import scan_characters
+
+class TestAudit(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.input = os.path.join(self.tmp.name, "dump.txt")
+        with open(self.input, "w") as f:
+            f.write("password\n\nKx9#mPq2$vL7!wRt\nabc111\r\nqwerty\n")
+
+    def test_scan_characters(self):
+        self.assertEqual(scan_characters("abcDEF1!"), (True, True, True, True, 2, 0))
+        self.assertEqual(scan_characters("aaa aaa"), (True, False, False, False, 0, 2))
+        self.assertEqual(scan_characters("١٢٣x"), (True, False, True, False, 1, 0))
+
+    def test_analyze_reports_patterns(self):
+        analyzer = PasswordStrengthAnalyzer()
+        self.assertEqual(analyzer.analyze("password")["details"]["patterns"], ["common"])
+        self.assertEqual(analyzer.analyze("abc111")["details"]["patterns"],
+                         ["sequential", "repeated"])
+        self.assertEqual(analyzer.analyze("Kx9#mPq2$vL7!wRt")["details"]["patterns"], [])
+
+    def test_audit_file(self):
+        output = os.path.join(self.tmp.name, "audit.jsonl")
+        summary = audit_file(self.input, output, workers=1, chunk_size=2)
+        self.assertEqual(summary["passwords"], 4)
+        self.assertEqual(sum(summary["ratings"].values()), 4)
+        self.assertEqual(sum(summary["lengths"].values()), 4)
+        self.assertEqual(summary["patterns"]["common"], 2)
+
+        with open(output) as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual([row["line"] for row in rows], [1, 3, 4, 5])
+        self.assertEqual(rows[0]["password"], "pass****")
+        self.assertEqual(rows[2]["patterns"], ["sequential", "repeated"])
+
+    def test_workers_keep_order(self):
+        single = os.path.join(self.tmp.name, "single.jsonl")
+        pooled = os.path.join(self.tmp.name, "pooled.jsonl")
+        with open(self.input, "a") as f:
+            f.write("".join(f"Passw0rd{i}!\n" for i in range(200)))
+        first = audit_file(self.input, single, workers=1, chunk_size=7)
+        second = audit_file(self.input, pooled, workers=2, chunk_size=7)
+        self.assertEqual(first["ratings"], second["ratings"])
+        with open(single) as a, open(pooled) as b:
+            self.assertEqual(a.read(), b.read())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import csv
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from generators import generate_passwords
+from utils.export import export_passwords
+from utils.helpers import calculate_entropy
+
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_streams_generator(self):
+        count = export_passwords(generate_passwords(25000), self.path("out.txt"))
+        self.assertEqual(count, 25000)
+        with open(self.path("out.txt")) as f:
+            self.assertEqual(sum(1 for _ in f), 25000)
+
+    def test_json_layout_unchanged(self):
+        passwords = ['a"b\\c', "Zz9!", "é"]
+        export_passwords(passwords, self.path("out.json"), format="json")
+        expected = [
+            {"index": i, "password": pwd, "length": len(pwd),
+             "entropy": calculate_entropy(pwd)}
+            for i, pwd in enumerate(passwords, 1)
+        ]
+        with open(self.path("out.json")) as f:
+            self.assertEqual(f.read(), json.dumps(expected, indent=2))
+
+        export_passwords([], self.path("empty.json"), format="json")
+        with open(self.path("empty.json")) as f:
+            self.assertEqual(json.load(f), [])
+
+    def test_gzip_by_suffix(self):
+        export_passwords(iter(["abc", "DEF1"]), self.path("out.jsonl.gz"), format="jsonl")
+        with gzip.open(self.path("out.jsonl.gz"), "rt") as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual([row["password"] for row in rows], ["abc", "DEF1"])
+        self.assertEqual(rows[1]["index"], 2)
+
+        export_passwords(["abc"], self.path("out.csv"), format="csv", compress="gzip")
+        with gzip.open(self.path("out.csv"), "rt", newline="") as f:
+            self.assertEqual(list(csv.reader(f))[1], ["1", "abc", "3", "14.1"])
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            export_passwords(["abc"], self.path("out.xml"), format="xml")
+        with self.assertRaises(ValueError):
+            export_passwords(["abc"], self.path("out.txt"), compress="rar")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,22 @@
+import math
 import unittest
 import string
-from generators import generate_password, generate_passphrase, generate_pin
+from itertools import product
+from generators import (
+    generate_password, generate_passphrase, generate_pin,
+    generate_passwords, BulkPasswordGenerator,
+    generate_from_pattern, compile_pattern,
+    generate_pins, count_pins, pin_space
+)
+
+def _pin_is_valid(pin, no_repeated, no_sequential):
+    for i in range(len(pin) - 2):
+        a, b, c = map(int, pin[i:i + 3])
+        if no_repeated and a == b == c:
+            return False
+        if no_sequential and b - a == c - b and abs(c - b) == 1:
+            return False
+    return True
 
 class TestGenerators(unittest.TestCase):
     def test_random_length(self):
@@ -15,5 +31,89 @@ class TestGenerators(unittest.TestCase):
         self.assertTrue(pin.isdigit())
         self.assertEqual(len(pin), 6)
 
+    def test_bulk_count_and_length(self):
+        passwords = list(generate_passwords(5000, length=12))
+        self.assertEqual(len(passwords), 5000)
+        self.assertTrue(all(len(pwd) == 12 for pwd in passwords))
+        self.assertEqual(list(generate_passwords(0)), [])
+
+    def test_bulk_includes_each_category(self):
+        symbols = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+        for pwd in generate_passwords(2000, length=4):
+            self.assertTrue(any(c in string.ascii_lowercase for c in pwd))
+            self.assertTrue(any(c in string.ascii_uppercase for c in pwd))
+            self.assertTrue(any(c in string.digits for c in pwd))
+            self.assertTrue(any(c in symbols for c in pwd))
+
+    def test_bulk_exclusions(self):
+        generator = BulkPasswordGenerator(
+            length=20, use_symbols=False, exclude_ambiguous=True, exclude_chars="abc"
+        )
+        used = set(''.join(generator.generate(2000)))
+        self.assertFalse(used & set("Il1O0oS5Z2abc"))
+        self.assertEqual(used, set(generator.char_pool))
+
+        digits = ''.join(generate_passwords(
+            100, length=8, use_uppercase=False, use_lowercase=False, use_symbols=False
+        ))
+        self.assertTrue(digits.isdigit())
+
+    def test_bulk_invalid_options(self):
+        with self.assertRaises(ValueError):
+            BulkPasswordGenerator(length=3)
+        with self.assertRaises(ValueError):
+            BulkPasswordGenerator(use_uppercase=False, use_lowercase=False,
+                                  use_digits=False, use_symbols=False)
+
+    def test_pattern_codes_and_escapes(self):
+        pwd = generate_from_pattern(r"Llll-dddd\d")
+        self.assertEqual(len(pwd), 10)
+        self.assertTrue(pwd[0].isupper() and pwd[1:4].islower())
+        self.assertEqual(pwd[4], "-")
+        self.assertTrue(pwd[5:9].isdigit())
+        self.assertEqual(pwd[9], "d")
+
+    def test_pattern_repetition_and_classes(self):
+        compiled = compile_pattern("[A-F]{4}-d{6}")
+        self.assertEqual(compiled.length, 11)
+        for pwd in compiled.batch(2000):
+            self.assertTrue(set(pwd[:4]) <= set("ABCDEF"))
+            self.assertEqual(pwd[4], "-")
+            self.assertTrue(pwd[5:].isdigit())
+        self.assertEqual(len(list(compiled.generate(25000, batch_size=10000))), 25000)
+
+        # Unclosed brackets and braces stay literal, as before
+        self.assertEqual(compile_pattern("[bc{z}").segments, [("[bc{z}", None)])
+        with self.assertRaises(ValueError):
+            compile_pattern("[z-a]")
+
+    def test_pattern_exact_entropy(self):
+        compiled = compile_pattern("Ld{3}-[xyz]")
+        self.assertEqual(compiled.combinations, 26 * 1000 * 3)
+        self.assertAlmostEqual(compiled.entropy, math.log2(26 * 1000 * 3))
+        self.assertEqual(compile_pattern("abc-").combinations, 52)
+        self.assertEqual(compile_pattern(r"\d\L").entropy, 0)
+
+    def test_pin_space_matches_brute_force(self):
+        for no_repeated, no_sequential in ((True, False), (False, True), (True, True)):
+            valid = [
+                ''.join(digits) for digits in product(string.digits, repeat=4)
+                if _pin_is_valid(''.join(digits), no_repeated, no_sequential)
+            ]
+            space = pin_space(4, no_repeated, no_sequential)
+            self.assertEqual(space.size, len(valid))
+            self.assertEqual([space.pin(rank) for rank in range(space.size)], valid)
+        self.assertEqual(count_pins(6), 10 ** 6)
+
+    def test_long_constrained_pins_are_valid(self):
+        for pin in generate_pins(500, length=40, no_repeated=True, no_sequential=True):
+            self.assertEqual(len(pin), 40)
+            self.assertTrue(_pin_is_valid(pin, True, True))
+        pin = generate_pin(length=8, no_repeated=True, no_sequential=True)
+        self.assertTrue(_pin_is_valid(pin, True, True))
+        with self.assertRaises(ValueError):
+            pin_space(257, no_repeated=True)
+        self.assertEqual(len(generate_pin(length=257)), 257)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,34 +1,117 @@
 import json
 import csv
+import gzip
+from itertools import islice
 from .helpers import calculate_entropy
 
-def export_passwords(passwords, filename, format="txt"):
+try:
+    from compression import zstd       # Python 3.14+
+except ImportError:
+    zstd = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+HAS_ZSTD = zstd is not None or zstandard is not None
+
+EXPORT_FORMATS = ("txt", "csv", "json", "jsonl")
+COMPRESSIONS = ("none", "gzip", "zstd")
+
+# Passwords formatted and written per write() call
+BATCH_SIZE = 10_000
+BUFFER_SIZE = 1 << 20
+
+def detect_compression(filename):
+    """Guess the compression from the file suffix (.gz, .zst)."""
+    if filename.endswith(".gz"):
+        return "gzip"
+    if filename.endswith(".zst"):
+        return "zstd"
+    return "none"
+
+def open_export_file(filename, compress=None, newline=None):
+    """
+    Open a file for writing text, optionally gzip or zstd compressed.
+
+    ``compress`` is one of COMPRESSIONS; by default it follows the suffix.
+    """
+    compress = compress or detect_compression(filename)
+    if compress == "gzip":
+        return gzip.open(filename, 'wt', compresslevel=6, newline=newline)
+    if compress == "zstd":
+        if zstd is not None:
+            return zstd.open(filename, 'wt', newline=newline)
+        if zstandard is not None:
+            return zstandard.open(filename, 'wt', newline=newline)
+        raise ValueError("zstd compression needs Python 3.14+ or: pip install zstandard")
+    if compress == "none":
+        return open(filename, 'w', buffering=BUFFER_SIZE, newline=newline)
+    raise ValueError(f"Unknown compression: {compress}")
+
+def _batches(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+# Rows are formatted from templates; json.dumps only encodes the values.
+# The output is identical to json.dumps(row) and json.dump(rows, indent=2).
+JSONL_ROW = '{"index": %d, "password": %s, "length": %d, "entropy": %s}\n'
+JSON_ROW = ('\n  {\n    "index": %d,\n    "password": %s,\n'
+            '    "length": %d,\n    "entropy": %s\n  }')
+
+def _json_values(index, pwd):
+    return index, json.dumps(pwd), len(pwd), json.dumps(calculate_entropy(pwd))
+
+def export_passwords(passwords, filename, format="txt", compress=None):
     """
     Export passwords to a file.
+
+    ``passwords`` may be any iterable, including a generator. Rows are
+    formatted and written in batches as they arrive, so memory use stays
+    the same however many passwords are exported. Returns the count.
     """
-    if format == "txt":
-        with open(filename, 'w') as f:
-            for pwd in passwords:
-                f.write(f"{pwd}\n")
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {format}")
 
-    elif format == "csv":
-        with open(filename, 'w', newline='') as f:
+    count = 0
+    with open_export_file(filename, compress, '' if format == "csv" else None) as f:
+        if format == "csv":
             writer = csv.writer(f)
             writer.writerow(["#", "Password", "Length", "Entropy"])
-            for i, pwd in enumerate(passwords, 1):
-                entropy = calculate_entropy(pwd)
-                writer.writerow([i, pwd, len(pwd), entropy])
-
-    elif format == "json":
-        data = []
-        for i, pwd in enumerate(passwords, 1):
-            data.append({
-                "index": i,
-                "password": pwd,
-                "length": len(pwd),
-                "entropy": calculate_entropy(pwd)
-            })
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
-
-    print(f"  📄 Exported {len(passwords)} passwords to: {filename}")
+
+        elif format == "json":
+            # Same layout as json.dump(rows, f, indent=2), one row at a time
+            f.write("[")
+
+        for batch in _batches(passwords, BATCH_SIZE):
+            if format == "txt":
+                f.write('\n'.join(batch) + '\n')
+
+            elif format == "csv":
+                writer.writerows(
+                    [i, pwd, len(pwd), calculate_entropy(pwd)]
+                    for i, pwd in enumerate(batch, count + 1)
+                )
+
+            elif format == "jsonl":
+                f.write(''.join(
+                    JSONL_ROW % _json_values(i, pwd)
+                    for i, pwd in enumerate(batch, count + 1)
+                ))
+
+            elif format == "json":
+                rows = ','.join(
+                    JSON_ROW % _json_values(i, pwd)
+                    for i, pwd in enumerate(batch, count + 1)
+                )
+                f.write((',' if count else '') + rows)
+
+            count += len(batch)
+
+        if format == "json":
+            f.write("\n]" if count else "]")
+
+    print(f"  📄 Exported {count} passwords to: {filename}")
+    return count
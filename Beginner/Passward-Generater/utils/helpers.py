@@ -1,5 +1,19 @@
 import math
 import re
+import string
+from functools import lru_cache
+
+SYMBOLS = "!@#$%^&*()_+-=[]{}|;:,.<>?/~`\\'\""
+
+# Maps each ASCII byte to its class: a, A, 0, ! (symbol) or space (other)
+_CHAR_CLASSES = bytes(
+    ord('a') if chr(b) in string.ascii_lowercase else
+    ord('A') if chr(b) in string.ascii_uppercase else
+    ord('0') if chr(b) in string.digits else
+    ord('!') if chr(b) in SYMBOLS else ord(' ')
+    for b in range(256)
+)
+_SYMBOL_RE = re.compile(f"[{re.escape(SYMBOLS)}]")
 
 def mask_password(password, show_chars=4):
     """
@@ -9,15 +23,37 @@ def mask_password(password, show_chars=4):
         return password[0] + "*" * (len(password) - 1)
     return password[:show_chars] + "*" * (len(password) - show_chars)
 
+def character_classes(password):
+    """
+    Return ``(lower, upper, digit, symbol, non_alnum)`` flags for a password.
+
+    ``symbol`` means a character from SYMBOLS and ``non_alnum`` anything
+    but an ASCII letter or digit. ASCII passwords are classified with one
+    translate pass instead of a regex scan per class.
+    """
+    if password.isascii():
+        classes = password.encode().translate(_CHAR_CLASSES)
+        symbol = ord('!') in classes
+        return (ord('a') in classes, ord('A') in classes, ord('0') in classes,
+                symbol, symbol or ord(' ') in classes)
+    return (
+        bool(re.search(r'[a-z]', password)),
+        bool(re.search(r'[A-Z]', password)),
+        bool(re.search(r'\d', password)),
+        bool(_SYMBOL_RE.search(password)),
+        bool(re.search(r'[^a-zA-Z0-9]', password)),
+    )
+
 def calculate_entropy(password):
     """Calculate password entropy in bits."""
-    pool = 0
-    if re.search(r'[a-z]', password): pool += 26
-    if re.search(r'[A-Z]', password): pool += 26
-    if re.search(r'\d', password): pool += 10
-    if re.search(r'[^a-zA-Z0-9]', password): pool += 33
+    lower, upper, digit, _, other = character_classes(password)
+    pool = 26 * lower + 26 * upper + 10 * digit + 33 * other
 
     if pool == 0:
         return 0
 
-    return round(math.log2(pool) * len(password), 1)
+    return _entropy_bits(pool, len(password))
+
+@lru_cache(maxsize=None)
+def _entropy_bits(pool, length):
+    return round(math.log2(pool) * length, 1)
@@ -1,89 +1,390 @@
 """AI opponents for Tic Tac Toe."""
 
+import json
+import math
 import random
+import time
+from functools import lru_cache, wraps
 
+from game import generate_win_combinations
+from opening_book import get_opening_book
 
-class EasyAI:
+
+def _build_symmetries():
+    """
+    Return the 8 board symmetries as position permutations.
+
+    ``perm[pos - 1]`` is the position that ``pos`` maps to under the
+    symmetry: the four rotations, each optionally mirrored.
+    """
+    def rotate(pos):
+        row, col = divmod(pos - 1, 3)
+        return col * 3 + (2 - row) + 1
+
+    def mirror(pos):
+        row, col = divmod(pos - 1, 3)
+        return row * 3 + (2 - col) + 1
+
+    perms = []
+    perm = list(range(1, 10))
+    for _ in range(4):
+        perms.append(tuple(perm))
+        perms.append(tuple(mirror(p) for p in perm))
+        perm = [rotate(p) for p in perm]
+    return perms
+
+
+def _build_symmetry_tables(symmetries):
+    """Precompute, per symmetry, the image of every 9-bit mark mask."""
+    tables = []
+    for perm in symmetries:
+        table = []
+        for mask in range(1 << 9):
+            image = 0
+            for pos in range(1, 10):
+                if mask >> (pos - 1) & 1:
+                    image |= 1 << (perm[pos - 1] - 1)
+            table.append(image)
+        tables.append(tuple(table))
+    return tuple(tables)
+
+
+def board_masks(game):
+    """Return the (X, O) 9-bit mark masks for a game of either engine."""
+    bits = getattr(game, 'bits', None)
+    if bits is not None:
+        return bits['X'], bits['O']
+
+    x_mask = o_mask = 0
+    for pos, value in game.board.items():
+        if value == 'X':
+            x_mask |= 1 << (pos - 1)
+        elif value == 'O':
+            o_mask |= 1 << (pos - 1)
+    return x_mask, o_mask
+
+
+class TranspositionTable:
+    """
+    Cache of minimax results shared by the search AIs.
+
+    Positions are keyed by a canonical hash — the minimum encoding over the
+    8 rotations/reflections — plus the side to move, so symmetric positions
+    and different move orders share one entry.
+
+    Scores are stored from X's point of view and relative to the node
+    (``10 - plies_to_win``), which makes an entry valid at any search depth
+    and for either AI symbol. Alpha-beta results are stored with a flag
+    saying whether the value is exact or only a lower/upper bound.
+    """
+
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
+
+    _FLIPPED = {EXACT: EXACT, LOWER: UPPER, UPPER: LOWER}
+
+    SYMMETRY_TABLES = _build_symmetry_tables(_build_symmetries())
+
+    def __init__(self):
+        self.entries = {}
+        self.probes = 0
+        self.hits = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        """Drop all cached positions and reset the counters."""
+        self.entries.clear()
+        self.probes = 0
+        self.hits = 0
+
+    def key(self, game, to_move):
+        """Return the canonical key for the game's position."""
+        x_mask, o_mask = board_masks(game)
+        if len(game.board) != 9:
+            # Symmetry tables only cover 3x3; larger boards key by raw masks
+            return (len(game.board), x_mask, o_mask, to_move == 'X')
+        canonical = min((table[x_mask] << 9) | table[o_mask]
+                        for table in self.SYMMETRY_TABLES)
+        return (canonical << 1) | (to_move == 'X')
+
+    def lookup(self, key, depth, symbol):
+        """
+        Return ``(flag, score)`` for ``symbol`` at ``depth``, or None.
+        """
+        self.probes += 1
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        self.hits += 1
+
+        flag, value = entry
+        if symbol == 'O':
+            value = -value
+            flag = self._FLIPPED[flag]
+
+        if value > 0:
+            return flag, value - depth
+        if value < 0:
+            return flag, value + depth
+        return flag, 0
+
+    def store(self, key, flag, score, depth, symbol):
+        """Record a search result for ``symbol`` found at ``depth``."""
+        if score > 0:
+            value = score + depth
+        elif score < 0:
+            value = score - depth
+        else:
+            value = 0
+
+        if symbol == 'O':
+            value = -value
+            flag = self._FLIPPED[flag]
+
+        self.entries[key] = (flag, value)
+
+
+# Shared by every search AI in the process, so positions solved in one
+# get_move call (or one game) are reused by the next.
+TRANSPOSITION_TABLE = TranspositionTable()
+
+
+class SearchProfile:
+    """
+    Search statistics recorded by an AI with profiling enabled.
+
+    One record is kept per get_move call: wall time, nodes visited per
+    depth, alpha/beta cutoffs per depth, the mean branching factor
+    (moves generated per expanded node) and transposition-table probes
+    and hits.
+    """
+
+    def __init__(self, ai_name):
+        self.ai_name = ai_name
+        self.moves = []
+        self._current = None
+
+    def begin_move(self):
+        self._current = {
+            "nodes_by_depth": {},
+            "cutoffs_by_depth": {},
+            "expanded": 0,
+            "moves_generated": 0,
+            "tt_probes": 0,
+            "tt_hits": 0,
+        }
+
+    def node(self, depth):
+        counts = self._current["nodes_by_depth"]
+        counts[depth] = counts.get(depth, 0) + 1
+
+    def expand(self, num_moves):
+        self._current["expanded"] += 1
+        self._current["moves_generated"] += num_moves
+
+    def cutoff(self, depth):
+        counts = self._current["cutoffs_by_depth"]
+        counts[depth] = counts.get(depth, 0) + 1
+
+    def probe(self, hit):
+        self._current["tt_probes"] += 1
+        if hit:
+            self._current["tt_hits"] += 1
+
+    def end_move(self, move, elapsed):
+        record = self._current
+        self._current = None
+        expanded = record["expanded"]
+        record.update(
+            move=move,
+            time_ms=elapsed * 1000,
+            nodes=sum(record["nodes_by_depth"].values()),
+            cutoffs=sum(record["cutoffs_by_depth"].values()),
+            branching_factor=(record["moves_generated"] / expanded
+                              if expanded else 0.0),
+            tt_hit_rate=(record["tt_hits"] / record["tt_probes"]
+                         if record["tt_probes"] else 0.0),
+        )
+        self.moves.append(record)
+        return record
+
+    def summary(self):
+        """Return totals across every profiled move."""
+        moves = self.moves
+        expanded = sum(m["expanded"] for m in moves)
+        probes = sum(m["tt_probes"] for m in moves)
+        return {
+            "ai": self.ai_name,
+            "moves": len(moves),
+            "time_ms": sum(m["time_ms"] for m in moves),
+            "nodes": sum(m["nodes"] for m in moves),
+            "cutoffs": sum(m["cutoffs"] for m in moves),
+            "branching_factor": (sum(m["moves_generated"] for m in moves) / expanded
+                                 if expanded else 0.0),
+            "tt_hit_rate": (sum(m["tt_hits"] for m in moves) / probes
+                            if probes else 0.0),
+        }
+
+    def to_dict(self):
+        return {"summary": self.summary(), "moves": self.moves}
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+class ProfilingMixin:
+    """
+    Opt-in search instrumentation for the AI classes.
+
+    ``profile`` stays None unless enable_profiling() is called. The search
+    hooks are guarded by that None check, so a disabled AI only pays for
+    one attribute test per node.
+    """
+
+    profile = None
+
+    def enable_profiling(self):
+        """Start recording search statistics; returns the SearchProfile."""
+        self.profile = SearchProfile(self.name)
+        return self.profile
+
+    def disable_profiling(self):
+        self.profile = None
+
+
+def profiled(get_move):
+    """Record a SearchProfile entry around get_move when profiling is on."""
+    @wraps(get_move)
+    def wrapper(self, game):
+        profile = self.profile
+        if profile is None:
+            return get_move(self, game)
+
+        table = getattr(self, "table", None)
+        probes = table.probes if table is not None else 0
+        hits = table.hits if table is not None else 0
+
+        profile.begin_move()
+        start = time.perf_counter()
+        move = get_move(self, game)
+        elapsed = time.perf_counter() - start
+
+        if table is not None:
+            profile._current["tt_probes"] += table.probes - probes
+            profile._current["tt_hits"] += table.hits - hits
+        profile.end_move(move, elapsed)
+        return move
+    return wrapper
+
+
+class EasyAI(ProfilingMixin):
     """Easy AI — makes random moves."""
 
     def __init__(self, symbol='O'):
         self.symbol = symbol
         self.name = "Easy AI 🤖"
 
+    @profiled
     def get_move(self, game):
         """Return a random available position."""
         available = game.get_available_moves()
         return random.choice(available)
 
 
-class MediumAI:
-    """Medium AI — uses basic strategy with some randomness."""
+@lru_cache(maxsize=None)
+def _board_landmarks(size):
+    """
+    Return the center cells, corners and edges of a ``size`` x ``size`` board.
+
+    Positions are 1-based. Odd boards have one center cell and even boards
+    the middle four; the edges are the other border cells.
+    """
+    last = size * size
+    corners = tuple(sorted({1, size, last - size + 1, last}))
+    middle = [size // 2] if size % 2 else [size // 2 - 1, size // 2]
+    center = tuple(r * size + c + 1 for r in middle for c in middle)
+    edges = tuple(
+        pos for pos in range(1, last + 1)
+        if pos not in corners and pos not in center
+        and (pos <= size or pos > last - size or pos % size in (0, 1))
+    )
+    return center, corners, edges
 
-    CORNERS = [1, 3, 7, 9]
-    CENTER = 5
-    EDGES = [2, 4, 6, 8]
+
+class MediumAI(ProfilingMixin):
+    """Medium AI — uses basic strategy with some randomness."""
 
     def __init__(self, symbol='O'):
         self.symbol = symbol
         self.opponent = 'X' if symbol == 'O' else 'O'
         self.name = "Medium AI 🤖"
 
+    @profiled
     def get_move(self, game):
         """Return the best move using basic strategy."""
         available = game.get_available_moves()
 
         # 1. Win if possible
-        for move in available:
-            game.board[move] = self.symbol
-            if game.check_win(self.symbol):
-                game.board[move] = ' '
-                return move
-            game.board[move] = ' '
+        wins = _completing_cells(game, self.symbol)
+        if wins:
+            return min(wins)
 
         # 2. Block opponent from winning
-        for move in available:
-            game.board[move] = self.opponent
-            if game.check_win(self.opponent):
-                game.board[move] = ' '
-                return move
-            game.board[move] = ' '
+        blocks = _completing_cells(game, self.opponent)
+        if blocks:
+            return min(blocks)
+
+        center, corners, edges = _board_landmarks(game.size)
 
         # 3. Take center
-        if self.CENTER in available:
-            return self.CENTER
+        available_center = [c for c in center if c in available]
+        if available_center:
+            return random.choice(available_center)
 
         # 4. Take a corner
-        available_corners = [c for c in self.CORNERS if c in available]
+        available_corners = [c for c in corners if c in available]
         if available_corners:
             return random.choice(available_corners)
 
         # 5. Take an edge
-        available_edges = [e for e in self.EDGES if e in available]
+        available_edges = [e for e in edges if e in available]
         if available_edges:
             return random.choice(available_edges)
 
-        # 6. Random (shouldn't reach here)
+        # 6. Random (only inner cells are left on larger boards)
         return random.choice(available)
 
 
-class HardAI:
+class HardAI(ProfilingMixin):
     """
     Hard AI — uses the Minimax algorithm.
     This AI is UNBEATABLE. The best you can do is draw.
     """
 
-    def __init__(self, symbol='O'):
+    def __init__(self, symbol='O', table=None, use_book=True):
         self.symbol = symbol
         self.opponent = 'X' if symbol == 'O' else 'O'
         self.name = "Hard AI 🤖 (Unbeatable)"
+        self.table = TRANSPOSITION_TABLE if table is None else table
+        self.book = get_opening_book() if use_book else None
 
+    @profiled
     def get_move(self, game):
         """Return the optimal move using Minimax."""
         available = game.get_available_moves()
 
         # If board is empty, take a corner (optimization)
-        if len(available) == 9:
-            return random.choice([1, 3, 7, 9])
+        if game.move_count == 0:
+            return random.choice(_board_landmarks(game.size)[1])
+
+        # Solved positions come straight from the book; search is the fallback
+        if self.book is not None:
+            book_moves = self.book.best_moves(game, self.symbol)
+            if book_moves:
+                return book_moves[0]
 
         best_score = float('-inf')
         best_move = None
@@ -115,14 +416,26 @@ class HardAI:
         - Opponent wins: -10 + depth  (prefer slower losses)
         - Draw:       0
         """
+        profile = self.profile
+        if profile is not None:
+            profile.node(depth)
+
         if game.check_win(self.symbol):
             return 10 - depth
         if game.check_win(self.opponent):
             return -10 + depth
-        if game.move_count == 9:
-            return 0
 
         available = game.get_available_moves()
+        if not available:
+            return 0
+
+        key = self.table.key(game, self.symbol if is_maximizing else self.opponent)
+        entry = self.table.lookup(key, depth, self.symbol)
+        if entry is not None and entry[0] == TranspositionTable.EXACT:
+            return entry[1]
+
+        if profile is not None:
+            profile.expand(len(available))
 
         if is_maximizing:
             best_score = float('-inf')
@@ -136,7 +449,6 @@ class HardAI:
                 game.move_count -= 1
 
                 best_score = max(score, best_score)
-            return best_score
 
         else:
             best_score = float('inf')
@@ -150,31 +462,152 @@ class HardAI:
                 game.move_count -= 1
 
                 best_score = min(score, best_score)
-            return best_score
+
+        self.table.store(key, TranspositionTable.EXACT, best_score, depth, self.symbol)
+        return best_score
+
+
+@lru_cache(maxsize=None)
+def _preferred_cells(size):
+    """Return ``{cell: 1}`` maps of the center and corner cells of a board."""
+    mid = (size - 1) / 2
+    center = {
+        row * size + col + 1: 1
+        for row in range(size) for col in range(size)
+        if abs(row - mid) < 1 and abs(col - mid) < 1
+    }
+    n = size * size
+    corners = dict.fromkeys((1, size, n - size + 1, n), 1)
+    return center, corners
 
 
-class ImpossibleAI:
+def _completing_cells(game, player):
+    """Return ``{cell: 1}`` for every empty cell that wins for ``player``."""
+    cells = {}
+    bits = getattr(game, "bits", None)
+    if bits is not None:
+        mine = bits[player]
+        occupied = bits['X'] | bits['O']
+        for mask in game.win_masks:
+            rest = mask & ~mine
+            if rest and not rest & (rest - 1) and not rest & occupied:
+                cells[rest.bit_length()] = 1
+        return cells
+
+    board = game.board
+    for combo in game.win_combinations:
+        missing = [pos for pos in combo if board[pos] != player]
+        if len(missing) == 1 and board[missing[0]] == ' ':
+            cells[missing[0]] = 1
+    return cells
+
+
+class MoveOrdering:
+    """
+    Pluggable move ordering for ImpossibleAI's alpha-beta search.
+
+    Each heuristic named in ``heuristics`` contributes one element of a
+    sort key, so earlier heuristics take priority over later ones:
+
+        win      moves that complete a line for the side to move
+        block    moves that stop the opponent completing a line
+        center   the center cell(s)
+        corner   the four corners
+        killer   moves that caused a cutoff at the same depth
+        history  moves that caused many cutoffs anywhere (depth-weighted)
+
+    An empty ``heuristics`` tuple keeps board order.
+    """
+
+    HEURISTICS = ("win", "block", "center", "corner", "killer", "history")
+    KILLERS_PER_DEPTH = 2
+
+    def __init__(self, heuristics=HEURISTICS):
+        unknown = set(heuristics) - set(self.HEURISTICS)
+        if unknown:
+            raise ValueError(f"Unknown move-ordering heuristics: {sorted(unknown)}")
+        self.heuristics = tuple(heuristics)
+        self.killers = {}
+        self.history = {}
+
+    def reset(self):
+        """Forget killer and history data from earlier searches."""
+        self.killers.clear()
+        self.history.clear()
+
+    def order(self, game, moves, player, opponent, depth):
+        """Return ``moves`` sorted best-first for ``player`` to try."""
+        if not self.heuristics or len(moves) < 2:
+            return moves
+
+        # One {cell: score} table per heuristic, in priority order
+        tables = []
+        for name in self.heuristics:
+            if name == "win":
+                tables.append(_completing_cells(game, player))
+            elif name == "block":
+                tables.append(_completing_cells(game, opponent))
+            elif name == "center":
+                tables.append(_preferred_cells(game.size)[0])
+            elif name == "corner":
+                tables.append(_preferred_cells(game.size)[1])
+            elif name == "killer":
+                tables.append(dict.fromkeys(self.killers.get(depth, ()), 1))
+            else:
+                tables.append(self.history)
+
+        return sorted(moves, reverse=True,
+                      key=lambda move: [table.get(move, 0) for table in tables])
+
+    def cutoff(self, move, depth, remaining):
+        """
+        Record that ``move`` caused a cutoff ``depth`` plies deep, with
+        ``remaining`` empty cells (plies left to search) at that node.
+        """
+        killers = self.killers.setdefault(depth, [])
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[self.KILLERS_PER_DEPTH:]
+        self.history[move] = self.history.get(move, 0) + remaining * remaining
+
+
+class ImpossibleAI(ProfilingMixin):
     """
     Impossible AI — Minimax with Alpha-Beta Pruning.
     Same result as Hard AI but computationally more efficient.
+
+    Below the root, moves are tried in the order given by ``ordering``
+    (a MoveOrdering; all heuristics by default). Root moves keep board
+    order, so ties still resolve to the lowest optimal position.
     """
 
-    def __init__(self, symbol='O'):
+    def __init__(self, symbol='O', table=None, use_book=True, ordering=None):
         self.symbol = symbol
         self.opponent = 'X' if symbol == 'O' else 'O'
         self.name = "Impossible AI 🤖 (Alpha-Beta)"
+        self.table = TRANSPOSITION_TABLE if table is None else table
+        self.book = get_opening_book() if use_book else None
+        self.ordering = MoveOrdering() if ordering is None else ordering
 
+    @profiled
     def get_move(self, game):
         """Return the optimal move using Alpha-Beta Pruning."""
         available = game.get_available_moves()
 
-        if len(available) == 9:
-            return random.choice([1, 3, 7, 9])
+        if game.move_count == 0:
+            return random.choice(_board_landmarks(game.size)[1])
+
+        # Solved positions come straight from the book; search is the fallback
+        if self.book is not None:
+            book_moves = self.book.best_moves(game, self.symbol)
+            if book_moves:
+                return book_moves[0]
 
         best_score = float('-inf')
         best_move = None
         alpha = float('-inf')
         beta = float('inf')
+        self.ordering.reset()
 
         for move in available:
             game.board[move] = self.symbol
@@ -195,15 +628,54 @@ class ImpossibleAI:
 
     def _minimax_ab(self, game, depth, is_maximizing, alpha, beta):
         """Minimax with Alpha-Beta Pruning."""
+        profile = self.profile
+        if profile is not None:
+            profile.node(depth)
+
         if game.check_win(self.symbol):
             return 10 - depth
         if game.check_win(self.opponent):
             return -10 + depth
-        if game.move_count == 9:
-            return 0
 
         available = game.get_available_moves()
+        if not available:
+            return 0
 
+        key = self.table.key(game, self.symbol if is_maximizing else self.opponent)
+        entry = self.table.lookup(key, depth, self.symbol)
+        if entry is not None:
+            flag, value = entry
+            if flag == TranspositionTable.EXACT:
+                return value
+            if flag == TranspositionTable.LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value
+
+        if is_maximizing:
+            available = self.ordering.order(game, available, self.symbol,
+                                            self.opponent, depth)
+        else:
+            available = self.ordering.order(game, available, self.opponent,
+                                            self.symbol, depth)
+
+        if profile is not None:
+            profile.expand(len(available))
+        score = self._search_ab(game, depth, is_maximizing, alpha, beta, available)
+
+        if score <= alpha:
+            flag = TranspositionTable.UPPER
+        elif score >= beta:
+            flag = TranspositionTable.LOWER
+        else:
+            flag = TranspositionTable.EXACT
+        self.table.store(key, flag, score, depth, self.symbol)
+        return score
+
+    def _search_ab(self, game, depth, is_maximizing, alpha, beta, available):
+        """Search the children of a non-terminal node within (alpha, beta)."""
         if is_maximizing:
             best_score = float('-inf')
             for move in available:
@@ -219,6 +691,9 @@ class ImpossibleAI:
                 alpha = max(alpha, best_score)
 
                 if alpha >= beta:
+                    self.ordering.cutoff(move, depth, len(available))
+                    if self.profile is not None:
+                        self.profile.cutoff(depth)
                     break  # Beta cutoff — prune
 
             return best_score
@@ -237,6 +712,568 @@ class ImpossibleAI:
                 beta = min(beta, best_score)
 
                 if alpha >= beta:
+                    self.ordering.cutoff(move, depth, len(available))
+                    if self.profile is not None:
+                        self.profile.cutoff(depth)
                     break  # Alpha cutoff — prune
 
             return best_score
+
+
+class _SearchTimeout(Exception):
+    """Raised inside MasterAI's search when the move budget runs out."""
+
+
+@lru_cache(maxsize=None)
+def _board_geometry(size, win_length, radius):
+    """
+    Precompute the masks MasterAI needs for one board shape.
+
+    Cells are 0-based bit indices. Returns the win-line masks, the line
+    indices through each cell, and each cell's neighbourhood mask.
+    """
+    combos = generate_win_combinations(size, win_length)
+    line_masks = tuple(sum(1 << (pos - 1) for pos in combo) for combo in combos)
+
+    num_cells = size * size
+    lines_through = tuple(
+        tuple(li for li, mask in enumerate(line_masks) if mask >> cell & 1)
+        for cell in range(num_cells)
+    )
+
+    neighbors = []
+    for cell in range(num_cells):
+        row, col = divmod(cell, size)
+        mask = 0
+        for r in range(max(0, row - radius), min(size, row + radius + 1)):
+            for c in range(max(0, col - radius), min(size, col + radius + 1)):
+                mask |= 1 << (r * size + c)
+        neighbors.append(mask & ~(1 << cell))
+
+    return line_masks, lines_through, tuple(neighbors)
+
+
+class _BoardSearch:
+    """
+    Incremental bitboard state for one MasterAI move.
+
+    Player 0 is the AI and player 1 its opponent. For every win line the
+    state tracks how many marks each player has on it, which keeps both
+    win detection and the heuristic score O(lines through the cell) per
+    move instead of O(all lines).
+    """
+
+    EXACT, LOWER, UPPER = 0, 1, 2
+
+    def __init__(self, game, symbol, opponent, radius, deadline, node_interval,
+                 profile=None):
+        self.size = game.size
+        self.win_length = game.win_length
+        self.num_cells = game.num_cells
+        self.full_mask = (1 << self.num_cells) - 1
+        self.line_masks, self.lines_through, self.neighbors = _board_geometry(
+            game.size, game.win_length, radius)
+
+        # weights[c]: heuristic value of an open line holding c marks
+        self.weights = [0] + [10 ** c for c in range(1, self.win_length + 1)]
+        self.win_score = 10 ** (self.win_length + 4)
+
+        self.bits = [0, 0]
+        self.counts = [[0] * len(self.line_masks), [0] * len(self.line_masks)]
+        self.score = 0           # Heuristic from the AI's point of view
+        self.near_mask = 0       # Cells next to any mark
+        self._undo_stack = []
+
+        self.deadline = deadline
+        self.node_interval = node_interval
+        self.nodes = 0
+        self.table = {}
+        self.killers = {}
+        self.history = [0] * self.num_cells
+        self.profile = profile
+
+        for pos, value in game.board.items():
+            if value == symbol:
+                self.place(pos - 1, 0)
+            elif value == opponent:
+                self.place(pos - 1, 1)
+
+    def place(self, cell, who):
+        """Put ``who``'s mark on ``cell``. Returns True if it wins."""
+        mine, theirs = self.counts[who], self.counts[1 - who]
+        weights = self.weights
+        won = False
+        delta = 0
+        for li in self.lines_through[cell]:
+            m = mine[li]
+            t = theirs[li]
+            mine[li] = m + 1
+            if t == 0:
+                delta += weights[m + 1] - weights[m]
+                if m + 1 == self.win_length:
+                    won = True
+            elif m == 0:
+                delta += weights[t]  # Our mark kills their open line
+
+        delta = delta if who == 0 else -delta
+        self._undo_stack.append((delta, self.near_mask))
+        self.score += delta
+        self.bits[who] |= 1 << cell
+        self.near_mask |= self.neighbors[cell]
+        return won
+
+    def undo(self, cell, who):
+        """Take ``who``'s mark back off ``cell``."""
+        delta, self.near_mask = self._undo_stack.pop()
+        self.score -= delta
+        self.bits[who] &= ~(1 << cell)
+        mine = self.counts[who]
+        for li in self.lines_through[cell]:
+            mine[li] -= 1
+
+    def candidate_mask(self, empty, restrict):
+        """Return the cells worth searching from the empty-cell mask."""
+        if restrict:
+            near = empty & self.near_mask
+            if near:
+                return near
+        if empty == self.full_mask:
+            return 1 << (self.num_cells // 2)  # Open in the center
+        return empty
+
+    def ordered_moves(self, empty, who, ply, first, restrict):
+        """
+        Return candidate cells, most promising first.
+
+        ``first`` (the best move from the table or the previous iteration)
+        leads, then this ply's killer moves, then cells by threat score:
+        lines the move extends for ``who`` plus lines it blocks, with the
+        history heuristic as tie-break.
+        """
+        mine, theirs = self.counts[who], self.counts[1 - who]
+        weights = self.weights
+        history = self.history
+        killers = self.killers.get(ply, ())
+
+        scored = []
+        cand = self.candidate_mask(empty, restrict)
+        while cand:
+            low = cand & -cand
+            cell = low.bit_length() - 1
+            cand ^= low
+
+            if cell == first:
+                priority = 1 << 62
+            elif cell in killers:
+                priority = 1 << 61
+            else:
+                priority = history[cell]
+                for li in self.lines_through[cell]:
+                    m = mine[li]
+                    t = theirs[li]
+                    if t == 0:
+                        priority += 2 * weights[m + 1]
+                    elif m == 0:
+                        priority += weights[t + 1]
+            scored.append((priority, cell))
+
+        scored.sort(reverse=True)
+        return [cell for _, cell in scored]
+
+    def negamax(self, depth, alpha, beta, who, ply, restrict):
+        """Alpha-beta search; returns the score for the side to move."""
+        self.nodes += 1
+        profile = self.profile
+        if profile is not None:
+            profile.node(ply)
+        if (self.nodes % self.node_interval == 0 and
+                time.perf_counter() > self.deadline):
+            raise _SearchTimeout
+
+        empty = ~(self.bits[0] | self.bits[1]) & self.full_mask
+        if not empty:
+            return 0
+        if depth == 0:
+            return self.score if who == 0 else -self.score
+
+        key = (self.bits[0], self.bits[1], who)
+        entry = self.table.get(key)
+        if profile is not None:
+            profile.probe(entry is not None)
+        table_move = None
+        if entry is not None:
+            entry_depth, flag, value, table_move = entry
+            if entry_depth >= depth:
+                if flag == self.EXACT:
+                    return value
+                if flag == self.LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        alpha_start = alpha
+        best_score = -self.win_score * 2
+        best_move = None
+        moves = self.ordered_moves(empty, who, ply, table_move, restrict)
+        if profile is not None:
+            profile.expand(len(moves))
+        for cell in moves:
+            if self.place(cell, who):
+                score = self.win_score - ply  # Prefer faster wins
+            else:
+                score = -self.negamax(depth - 1, -beta, -alpha, 1 - who,
+                                      ply + 1, restrict)
+            self.undo(cell, who)
+
+            if score > best_score:
+                best_score = score
+                best_move = cell
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                killers = self.killers.setdefault(ply, [])
+                if cell not in killers:
+                    killers.insert(0, cell)
+                    del killers[2:]
+                self.history[cell] += depth * depth
+                if profile is not None:
+                    profile.cutoff(ply)
+                break
+
+        if best_score <= alpha_start:
+            flag = self.UPPER
+        elif best_score >= beta:
+            flag = self.LOWER
+        else:
+            flag = self.EXACT
+        self.table[key] = (depth, flag, best_score, best_move)
+        return best_score
+
+    def root_best_move(self):
+        """Return the best root cell stored by the last completed search."""
+        entry = self.table.get((self.bits[0], self.bits[1], 0))
+        return entry[3] if entry is not None else None
+
+
+class MasterAI(ProfilingMixin):
+    """
+    Master AI — iterative-deepening alpha-beta for any board size.
+
+    Searches 1 ply deep, then 2, and so on until the per-move time budget
+    runs out, then plays the best move of the deepest finished search.
+    Moves are ordered by the previous iteration's best move, killer moves,
+    history and a threat score, and unfinished lines are scored by a
+    heuristic, so it stays responsive on 4x4, 5x5 or 15x15 gomoku boards.
+    """
+
+    # Boards with more cells than this only search cells next to a mark
+    FULL_WIDTH_CELLS = 16
+    NEIGHBOR_RADIUS = 1
+    # How many nodes to search between clock checks
+    NODE_CHECK_INTERVAL = 256
+
+    def __init__(self, symbol='O', time_limit_ms=500, max_depth=None):
+        self.symbol = symbol
+        self.opponent = 'X' if symbol == 'O' else 'O'
+        self.name = "Master AI 🤖 (Iterative Deepening)"
+        self.time_limit_ms = time_limit_ms
+        self.max_depth = max_depth
+        self.last_depth = 0    # Deepest completed iteration of the last move
+        self.last_nodes = 0
+
+    @profiled
+    def get_move(self, game):
+        """Return the best move found within the time budget."""
+        available = game.get_available_moves()
+        if len(available) == 1:
+            return available[0]
+
+        start = time.perf_counter()
+        budget = self.time_limit_ms / 1000
+        search = _BoardSearch(game, self.symbol, self.opponent,
+                              self.NEIGHBOR_RADIUS, start + budget,
+                              self.NODE_CHECK_INTERVAL, self.profile)
+        restrict = game.num_cells > self.FULL_WIDTH_CELLS
+
+        empty = ~(search.bits[0] | search.bits[1]) & search.full_mask
+        best_cell = search.ordered_moves(empty, 0, 0, None, restrict)[0]
+
+        max_depth = len(available)
+        if self.max_depth is not None:
+            max_depth = min(max_depth, self.max_depth)
+
+        self.last_depth = 0
+        for depth in range(1, max_depth + 1):
+            try:
+                score = search.negamax(depth, -search.win_score * 2,
+                                       search.win_score * 2, 0, 0, restrict)
+            except _SearchTimeout:
+                break
+
+            best_cell = search.root_best_move()
+            self.last_depth = depth
+
+            # A forced result needs no deeper search
+            if abs(score) >= search.win_score - game.num_cells:
+                break
+            # The next iteration costs more than all earlier ones combined
+            if time.perf_counter() - start > budget / 2:
+                break
+
+        self.last_nodes = search.nodes
+        return best_cell + 1
+
+
+class _MCTSNode:
+    """One node of an MCTS tree; ``player`` made ``move`` to reach it."""
+
+    __slots__ = ("move", "player", "parent", "children", "untried",
+                 "visits", "wins", "result")
+
+    def __init__(self, move, player, parent, untried, result=None):
+        self.move = move
+        self.player = player
+        self.parent = parent
+        self.children = []
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0        # Reward for ``player``: 1 per win, 0.5 per draw
+        self.result = result   # 'win' or 'draw' when the game ended here
+
+
+@lru_cache(maxsize=None)
+def _cell_win_masks(size, win_length):
+    """Return, for every 0-based cell, the win-line masks through it."""
+    line_masks, lines_through, _ = _board_geometry(size, win_length, 1)
+    return tuple(tuple(line_masks[li] for li in lines) for lines in lines_through)
+
+
+def _mcts_candidates(occupied, num_cells, neighbors, restrict):
+    """Return the cells the tree expands, nearest-to-play only on big boards."""
+    empty = [cell for cell in range(num_cells) if not occupied >> cell & 1]
+    if not restrict or not occupied:
+        if restrict:
+            return [num_cells // 2]
+        return empty
+    near = 0
+    for cell in range(num_cells):
+        if occupied >> cell & 1:
+            near |= neighbors[cell]
+    return [cell for cell in empty if near >> cell & 1] or empty
+
+
+def _mcts_search(size, win_length, mine, theirs, iterations, time_limit,
+                 exploration, restrict, seed=None, profile=None):
+    """
+    Run UCT from a position where ``mine`` (player 0) is to move.
+
+    Stops after ``iterations`` playouts or ``time_limit`` seconds,
+    whichever comes first (either may be None), but always runs at least
+    one playout so there is a move to return. Module-level so that
+    MCTSAI can run it in worker processes. Returns the root children's
+    ``{cell: (visits, wins)}`` and the number of playouts.
+    """
+    rng = random.Random(seed)
+    num_cells = size * size
+    full = (1 << num_cells) - 1
+    masks_through = _cell_win_masks(size, win_length)
+    neighbors = _board_geometry(size, win_length, 1)[2]
+    log = math.log
+    sqrt = math.sqrt
+
+    root = _MCTSNode(None, 1, None,
+                     _mcts_candidates(mine | theirs, num_cells, neighbors, restrict))
+    deadline = time.perf_counter() + time_limit if time_limit is not None else None
+    playouts = 0
+
+    while playouts == 0 or iterations is None or playouts < iterations:
+        # Check the clock every 64 playouts, starting after the first
+        if deadline is not None and playouts & 63 == 1 and time.perf_counter() >= deadline:
+            break
+        node = root
+        bits = [mine, theirs]
+        depth = 0
+
+        # Selection: descend through fully expanded nodes by UCB1
+        while not node.untried and node.children:
+            scale = exploration * sqrt(log(node.visits))
+            best = None
+            best_value = -1.0
+            for child in node.children:
+                value = child.wins / child.visits + scale / sqrt(child.visits)
+                if value > best_value:
+                    best, best_value = child, value
+            node = best
+            bits[node.player] |= 1 << node.move
+            depth += 1
+
+        # Expansion: add one untried move
+        if node.untried and node.result is None:
+            who = 1 - node.player
+            cell = node.untried.pop(rng.randrange(len(node.untried)))
+            placed = bits[who] | (1 << cell)
+            bits[who] = placed
+            occupied = bits[0] | bits[1]
+            if any(placed & mask == mask for mask in masks_through[cell]):
+                child = _MCTSNode(cell, who, node, [], 'win')
+            elif occupied == full:
+                child = _MCTSNode(cell, who, node, [], 'draw')
+            else:
+                child = _MCTSNode(cell, who, node, _mcts_candidates(
+                    occupied, num_cells, neighbors, restrict))
+                if profile is not None:
+                    profile.expand(len(child.untried))
+            node.children.append(child)
+            node = child
+            depth += 1
+
+        # Simulation: random playout to the end of the game
+        if node.result == 'win':
+            winner = node.player
+        elif node.result == 'draw':
+            winner = None
+        else:
+            winner = None
+            occupied = bits[0] | bits[1]
+            empty = [cell for cell in range(num_cells) if not occupied >> cell & 1]
+            rng.shuffle(empty)
+            who = 1 - node.player
+            for cell in empty:
+                placed = bits[who] | (1 << cell)
+                bits[who] = placed
+                for mask in masks_through[cell]:
+                    if placed & mask == mask:
+                        winner = who
+                        break
+                if winner is not None:
+                    break
+                who = 1 - who
+
+        # Backpropagation
+        while node is not None:
+            node.visits += 1
+            if winner is None:
+                node.wins += 0.5
+            elif winner == node.player:
+                node.wins += 1.0
+            node = node.parent
+
+        playouts += 1
+        if profile is not None:
+            profile.node(depth)
+
+    stats = {child.move: (child.visits, child.wins) for child in root.children}
+    return stats, playouts
+
+
+class MCTSAI(ProfilingMixin):
+    """
+    MCTS AI — Monte Carlo Tree Search with UCT selection, for any board size.
+
+    Each playout walks the tree by UCB1, adds one node and finishes the
+    game with random moves; the most visited move is played. The search
+    stops after ``iterations`` playouts or ``time_limit_ms``, whichever
+    comes first. With ``workers`` > 1 the budget runs root-parallel:
+    every worker process grows its own tree and the root visit counts are
+    summed. Boards larger than 4x4 only expand cells next to a mark.
+    Immediate wins and single forced blocks are played without searching.
+
+    ``last_playouts`` and ``last_playouts_per_second`` describe the last
+    move, for tuning the budget to a response-time target.
+    """
+
+    FULL_WIDTH_CELLS = 16
+    EXPLORATION = math.sqrt(2)
+
+    def __init__(self, symbol='O', iterations=None, time_limit_ms=500,
+                 workers=1, exploration=EXPLORATION, seed=None):
+        if iterations is None and time_limit_ms is None:
+            raise ValueError("MCTSAI needs an iteration or time budget")
+        if iterations is not None and iterations < 1:
+            raise ValueError("MCTSAI iterations must be positive")
+        if time_limit_ms is not None and time_limit_ms <= 0:
+            raise ValueError("MCTSAI time limit must be positive")
+        self.symbol = symbol
+        self.opponent = 'X' if symbol == 'O' else 'O'
+        self.name = "MCTS AI 🤖 (Monte Carlo)"
+        self.iterations = iterations
+        self.time_limit_ms = time_limit_ms
+        self.workers = workers
+        self.exploration = exploration
+        self.seed = seed
+        self.last_playouts = 0
+        self.last_playouts_per_second = 0.0
+        self._pool = None
+
+    def close(self):
+        """Shut down the worker processes, if any were started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    @profiled
+    def get_move(self, game):
+        """Return the most visited move after the search budget."""
+        available = game.get_available_moves()
+        self.last_playouts = 0
+        self.last_playouts_per_second = 0.0
+        if len(available) == 1:
+            return available[0]
+
+        wins = _completing_cells(game, self.symbol)
+        if wins:
+            return min(wins)
+        blocks = _completing_cells(game, self.opponent)
+        if len(blocks) == 1:
+            return next(iter(blocks))
+
+        mine = theirs = 0
+        for pos, value in game.board.items():
+            if value == self.symbol:
+                mine |= 1 << (pos - 1)
+            elif value == self.opponent:
+                theirs |= 1 << (pos - 1)
+
+        start = time.perf_counter()
+        stats, playouts = self._search(game, mine, theirs)
+        elapsed = time.perf_counter() - start
+        self.last_playouts = playouts
+        self.last_playouts_per_second = playouts / elapsed if elapsed else 0.0
+
+        best = max(stats, key=lambda cell: stats[cell][0])
+        return best + 1
+
+    def _search(self, game, mine, theirs):
+        time_limit = (self.time_limit_ms / 1000
+                      if self.time_limit_ms is not None else None)
+        restrict = game.num_cells > self.FULL_WIDTH_CELLS
+        args = (game.size, game.win_length, mine, theirs)
+
+        if self.workers <= 1:
+            return _mcts_search(*args, self.iterations, time_limit,
+                                self.exploration, restrict, self.seed,
+                                self.profile)
+
+        if self._pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._pool = ProcessPoolExecutor(self.workers)
+        iterations = (-(-self.iterations // self.workers)
+                      if self.iterations is not None else None)
+        seeds = [None if self.seed is None else self.seed + i
+                 for i in range(self.workers)]
+        futures = [self._pool.submit(_mcts_search, *args, iterations, time_limit,
+                                     self.exploration, restrict, seed)
+                   for seed in seeds]
+
+        totals = {}
+        playouts = 0
+        for future in futures:
+            stats, count = future.result()
+            playouts += count
+            for cell, (visits, wins) in stats.items():
+                total = totals.setdefault(cell, [0, 0.0])
+                total[0] += visits
+                total[1] += wins
+        return totals, playouts
@@ -0,0 +1,79 @@
+"""Background AI search for the GUIs."""
+
+import threading
+import time
+
+
+class AIWorker:
+    """
+    Runs ``ai.get_move`` on a daemon thread so a GUI's event loop never
+    blocks on a search.
+
+    The search works on a copy of the game, so the GUI can keep drawing
+    the real board. GUIs call poll() from their own loop (Tk ``after``, a
+    Pygame frame) and apply the move on their thread. cancel() (or a new
+    start()) makes any search still running stale: its result is dropped
+    when it arrives.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._result = None
+        self._started = None
+
+    def start(self, ai, game):
+        """Begin searching for ``ai``'s move in ``game``."""
+        snapshot = game.copy()
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._result = None
+            self._started = time.monotonic()
+        thread = threading.Thread(target=self._run, args=(generation, ai, snapshot),
+                                  daemon=True)
+        thread.start()
+
+    def _run(self, generation, ai, game):
+        try:
+            outcome = (ai.get_move(game), None)
+        except Exception as e:
+            outcome = (None, e)
+        with self._lock:
+            if generation == self._generation:
+                self._result = outcome
+
+    def cancel(self):
+        """Drop the running search, if any."""
+        with self._lock:
+            self._generation += 1
+            self._result = None
+            self._started = None
+
+    @property
+    def busy(self):
+        """True while a search is running or its move is not yet collected."""
+        return self._started is not None
+
+    def elapsed(self):
+        """Seconds since the current search started (0 when idle)."""
+        started = self._started
+        return time.monotonic() - started if started is not None else 0.0
+
+    def poll(self, min_time=0.0):
+        """
+        Return the finished move, or None while still thinking.
+
+        ``min_time`` holds the move back until the search has been shown
+        for at least that many seconds. Exceptions raised by the AI are
+        re-raised here.
+        """
+        with self._lock:
+            if self._result is None or self.elapsed() < min_time:
+                return None
+            move, error = self._result
+            self._result = None
+            self._started = None
+        if error is not None:
+            raise error
+        return move
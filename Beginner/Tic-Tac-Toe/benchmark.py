@@ -0,0 +1,318 @@
+"""
+Benchmark harness for the AI engines.
+
+Asks every AI for a move from every reachable 3x3 position and records
+search nodes, wall time and memory allocation per AI class. The report is
+written as JSON. Against a saved baseline, the run fails when a metric
+regresses past its threshold:
+
+    python benchmark.py --save-baseline bench_baseline.json
+    python benchmark.py --baseline bench_baseline.json --threshold 0.05
+
+``--orderings`` also measures ImpossibleAI's node count as each
+move-ordering heuristic is added in turn.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import ai as ai_module
+from game import BitboardTicTacToe
+
+DEFAULT_AIS = ("EasyAI", "MediumAI", "HardAI", "ImpossibleAI", "MasterAI")
+
+# Recursive search methods whose calls are counted as nodes
+SEARCH_METHODS = ("_minimax", "_minimax_ab")
+
+# Heuristic sets compared by --orderings: board order, then one more each
+ORDERING_STEPS = tuple(ai_module.MoveOrdering.HEURISTICS[:i]
+                       for i in range(len(ai_module.MoveOrdering.HEURISTICS) + 1))
+
+# Metrics checked against the baseline and the threshold each one uses
+REGRESSION_METRICS = {
+    "nodes_total": "threshold",
+    "time_total_s": "time_threshold",
+    "alloc_peak_bytes_mean": "threshold",
+}
+
+
+def reachable_positions():
+    """
+    Return the move lists of every reachable, unfinished 3x3 position.
+
+    The empty board is skipped: the minimax AIs answer it with a random
+    corner rather than a search.
+    """
+    positions = []
+    seen = set()
+    game = BitboardTicTacToe()
+
+    def walk():
+        key = (game.bits['X'], game.bits['O'])
+        if game.game_over or key in seen:
+            return
+        seen.add(key)
+        if game.move_count:
+            positions.append([pos for pos, _ in game.move_history])
+        for move in game.get_available_moves():
+            game.make_move(move)
+            walk()
+            game.undo_move()
+
+    walk()
+    return positions
+
+
+class NodeCounter:
+    """Counts recursive search calls by wrapping an AI's search methods."""
+
+    def __init__(self, ai):
+        self.ai = ai
+        self.count = 0
+        for name in SEARCH_METHODS:
+            method = getattr(ai, name, None)
+            if method is not None:
+                setattr(ai, name, self._wrap(method))
+
+    def _wrap(self, method):
+        def counted(*args, **kwargs):
+            self.count += 1
+            return method(*args, **kwargs)
+        return counted
+
+    def take(self):
+        """Return and reset the node count of the last move."""
+        count = self.count + getattr(self.ai, "last_nodes", 0)
+        self.count = 0
+        return count
+
+
+def make_ai(name, symbol, use_book, table, ordering=None):
+    """
+    Build an AI, disabling the opening book unless asked for.
+
+    ``ordering`` is a tuple of MoveOrdering heuristics for ImpossibleAI
+    (None keeps its default ordering).
+    """
+    cls = getattr(ai_module, name)
+    if name == "ImpossibleAI" and ordering is not None:
+        return cls(symbol, table=table, use_book=use_book,
+                   ordering=ai_module.MoveOrdering(ordering))
+    if name in ("HardAI", "ImpossibleAI"):
+        return cls(symbol, table=table, use_book=use_book)
+    return cls(symbol)
+
+
+def _play_position(moves, engine=BitboardTicTacToe):
+    game = engine()
+    for move in moves:
+        game.make_move(move)
+    return game
+
+
+def bench_ai(name, positions, use_book=False, warm=False, alloc_every=25,
+             ordering=None):
+    """
+    Benchmark one AI class over ``positions``.
+
+    Each position is searched with an empty transposition table unless
+    ``warm`` is set, which makes node counts independent of the order the
+    positions are visited. Allocation peaks are measured with tracemalloc
+    on every ``alloc_every``-th position, because tracing slows the search.
+    """
+    shared_table = ai_module.TranspositionTable()
+    times = []
+    nodes_total = 0
+    nodes_max = 0
+    alloc_peaks = []
+
+    for i, moves in enumerate(positions):
+        game = _play_position(moves)
+        table = shared_table if warm else ai_module.TranspositionTable()
+        player = make_ai(name, game.current_player, use_book, table, ordering)
+        counter = NodeCounter(player)
+
+        start = time.perf_counter()
+        player.get_move(game)
+        times.append(time.perf_counter() - start)
+
+        nodes = counter.take()
+        nodes_total += nodes
+        nodes_max = max(nodes_max, nodes)
+
+        if alloc_every and i % alloc_every == 0:
+            game = _play_position(moves)
+            table = ai_module.TranspositionTable()
+            player = make_ai(name, game.current_player, use_book, table,
+                             ordering)
+            tracemalloc.start()
+            player.get_move(game)
+            alloc_peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+    times.sort()
+    count = len(times)
+    return {
+        "positions": count,
+        "nodes_total": nodes_total,
+        "nodes_max": nodes_max,
+        "time_total_s": sum(times),
+        "time_mean_us": sum(times) / count * 1e6 if count else 0.0,
+        "time_p99_us": times[int(count * 0.99)] * 1e6 if count else 0.0,
+        "time_max_us": times[-1] * 1e6 if count else 0.0,
+        "alloc_peak_bytes_mean": (sum(alloc_peaks) / len(alloc_peaks)
+                                  if alloc_peaks else 0),
+        "alloc_peak_bytes_max": max(alloc_peaks, default=0),
+    }
+
+
+def run_benchmarks(ai_names=DEFAULT_AIS, limit=None, use_book=False,
+                   warm=False, alloc_every=25):
+    """Benchmark each AI class and return the full report dict."""
+    positions = reachable_positions()
+    if limit:
+        positions = positions[:limit]
+
+    return {
+        "python": platform.python_version(),
+        "positions": len(positions),
+        "use_book": use_book,
+        "warm_table": warm,
+        "results": {name: bench_ai(name, positions, use_book, warm, alloc_every)
+                    for name in ai_names},
+    }
+
+
+def compare_orderings(positions, steps=ORDERING_STEPS, use_book=False):
+    """
+    Benchmark ImpossibleAI once per heuristic set in ``steps``.
+
+    Returns ``{label: result}`` where each result also carries
+    ``node_reduction``: the fraction of nodes saved against the first step.
+    """
+    results = {}
+    base_nodes = None
+    for heuristics in steps:
+        result = bench_ai("ImpossibleAI", positions, use_book,
+                          alloc_every=0, ordering=heuristics)
+        if base_nodes is None:
+            base_nodes = result["nodes_total"]
+        result["node_reduction"] = (1 - result["nodes_total"] / base_nodes
+                                    if base_nodes else 0.0)
+        results["+".join(heuristics) or "board order"] = result
+    return results
+
+
+def find_regressions(report, baseline, threshold=0.10, time_threshold=0.25):
+    """
+    Compare a report with a baseline report.
+
+    Returns a list of messages, one per metric that grew by more than its
+    threshold (a fraction: 0.10 allows +10%).
+    """
+    limits = {"threshold": threshold, "time_threshold": time_threshold}
+    regressions = []
+    for name, result in report["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        for metric, limit_name in REGRESSION_METRICS.items():
+            old = base.get(metric)
+            new = result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if change > limits[limit_name]:
+                regressions.append(
+                    f"{name}.{metric}: {old:.6g} -> {new:.6g} (+{change:.1%})")
+    return regressions
+
+
+def print_summary(report):
+    """Print a one-line summary per AI class."""
+    print(f"\n  {report['positions']} positions "
+          f"(book {'on' if report['use_book'] else 'off'}, "
+          f"{'warm' if report['warm_table'] else 'cold'} table)\n")
+    print(f"  {'AI':<14}{'nodes':>12}{'max':>9}{'total s':>10}"
+          f"{'mean us':>10}{'p99 us':>10}{'peak KiB':>10}")
+    for name, r in report["results"].items():
+        print(f"  {name:<14}{r['nodes_total']:>12}{r['nodes_max']:>9}"
+              f"{r['time_total_s']:>10.3f}{r['time_mean_us']:>10.1f}"
+              f"{r['time_p99_us']:>10.1f}{r['alloc_peak_bytes_max'] / 1024:>10.1f}")
+    print()
+
+
+def print_orderings(orderings):
+    """Print the node count of each move-ordering step."""
+    print(f"  {'ImpossibleAI ordering':<44}{'nodes':>10}{'saved':>8}{'total s':>9}")
+    for label, r in orderings.items():
+        print(f"  {label:<44}{r['nodes_total']:>10}{r['node_reduction']:>8.1%}"
+              f"{r['time_total_s']:>9.3f}")
+    print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the AI engines.")
+    parser.add_argument("--ai", nargs="+", default=list(DEFAULT_AIS),
+                        help="AI class names to benchmark")
+    parser.add_argument("--limit", type=int, default=None,
+                        help="Only use the first N positions")
+    parser.add_argument("--book", action="store_true",
+                        help="Let the minimax AIs use the opening book")
+    parser.add_argument("--warm", action="store_true",
+                        help="Share one transposition table across positions")
+    parser.add_argument("--alloc-every", type=int, default=25,
+                        help="Trace allocations on every Nth position (0 = off)")
+    parser.add_argument("-o", "--output", default="benchmark_report.json")
+    parser.add_argument("--baseline", help="Baseline report to compare against")
+    parser.add_argument("--save-baseline", metavar="PATH",
+                        help="Also write this report as a new baseline")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed growth in nodes/allocations (0.10 = 10%%)")
+    parser.add_argument("--time-threshold", type=float, default=0.25,
+                        help="Allowed growth in wall time")
+    parser.add_argument("--orderings", action="store_true",
+                        help="Compare ImpossibleAI move-ordering heuristics")
+    args = parser.parse_args(argv)
+
+    for name in args.ai:
+        if not isinstance(getattr(ai_module, name, None), type):
+            parser.error(f"Unknown AI class: {name}")
+
+    report = run_benchmarks(args.ai, args.limit, args.book, args.warm,
+                            args.alloc_every)
+    print_summary(report)
+
+    if args.orderings:
+        positions = reachable_positions()
+        if args.limit:
+            positions = positions[:args.limit]
+        report["orderings"] = compare_orderings(positions, use_book=args.book)
+        print_orderings(report["orderings"])
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        regressions = find_regressions(report, baseline, args.threshold,
+                                       args.time_threshold)
+        if regressions:
+            print("  Regressions over threshold:")
+            for line in regressions:
+                print(f"    {line}")
+            return 1
+        print("  No regressions over threshold.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,7 +10,7 @@ try:
 except ImportError:
     HAS_COLOR = False
     class Fore:
-        RED = GREEN = YELLOW = CYAN = MAGENTA = BLUE = WHITE = RESET = ''
+        RED = GREEN = YELLOW = CYAN = MAGENTA = BLUE = WHITE = BLACK = RESET = ''
     class Style:
         BRIGHT = RESET_ALL = ''
 
@@ -52,9 +52,43 @@ THEMES = {
 }
 
 
+# ANSI control sequences used by the renderer
+CLEAR = "\x1b[H\x1b[2J"
+ERASE_LINE = "\x1b[2K"
+ERASE_BELOW = "\x1b[J"
+
+# Screen line (1-based) of the first board row, below the title banner
+BOARD_TOP = 6
+
+_ansi_enabled = False
+
+
+def _enable_ansi():
+    """
+    Make sure the console understands ANSI escapes.
+
+    colorama translates them on Windows; without it, one empty ``system``
+    call switches the Windows console into VT mode for the whole process.
+    """
+    global _ansi_enabled
+    if not _ansi_enabled:
+        if os.name == 'nt' and not HAS_COLOR:
+            os.system('')
+        _ansi_enabled = True
+
+
+def move_to(line, col):
+    """Return the ANSI sequence moving the cursor to ``line``, ``col``."""
+    return f"\x1b[{line};{col}H"
+
+
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    _enable_ansi()
+    sys.stdout.write(CLEAR)
+    sys.stdout.flush()
+    if _renderer is not None:
+        _renderer.invalidate()
 
 
 def colored(text, color):
@@ -62,117 +96,169 @@ def colored(text, color):
     return f"{color}{text}{Style.RESET_ALL}" if HAS_COLOR else text
 
 
-def display_board_colored(board, winning_combo=None):
-    """Display board with colors and optional winning highlight based on settings."""
-    from settings import load_settings
-    settings = load_settings()
-    
-    theme_name = settings.get("color_theme", "default")
-    style_name = settings.get("board_style", "box")
-    show_hints = settings.get("show_hints", True)
-    
-    theme = THEMES.get(theme_name, THEMES["default"])
-    
-    clear_screen()
-
-    print(colored("\n  ╔═══════════════════╗", theme["title"]))
-    print(colored("  ║   TIC  TAC  TOE   ║", theme["title"]))
-    print(colored("  ╚═══════════════════╝\n", theme["title"]))
-
-    if style_name == "emoji":
-        render_emoji_board(board, theme, winning_combo)
-    elif style_name == "minimal":
-        render_minimal_board(board, theme, winning_combo, show_hints)
-    else:
-        render_box_board(board, theme, winning_combo, show_hints)
-
-    print()
-
-
-def render_box_board(board, theme, winning_combo, show_hints):
-    """Render the standard box style board."""
-    for i in range(3):
-        if i == 0:
-            print(colored("  ┌─────┬─────┬─────┐", theme["border"]))
-
-        print(colored("  │     │     │     │", theme["border"]))
-
-        cells_str = ""
-        for j in range(3):
-            pos = i * 3 + j + 1
-            value = board[pos]
-
-            if value == ' ':
-                cell_val = str(pos) if show_hints else " "
-                cell = colored(f' {cell_val} ', theme["hint"])
-            elif value == 'X':
-                color = theme["win"] if winning_combo and pos in winning_combo else theme["x"]
-                cell = colored(' X ', color + Style.BRIGHT)
-            elif value == 'O':
-                color = theme["win"] if winning_combo and pos in winning_combo else theme["o"]
-                cell = colored(' O ', color + Style.BRIGHT)
+class BoardRenderer:
+    """
+    Draws the 3x3 board, redrawing only what changed since the last frame.
+
+    A frame is a ``{(line, col): text}`` map of screen spans: the static
+    title and grid, plus one span per cell. The first frame (or the first
+    after invalidate()) clears the screen and draws every span; later
+    frames only move the cursor to cells whose text changed. Each frame is
+    sent with one buffered write.
+
+    Settings and the rendered cell strings for the current theme are
+    cached until the shared SettingsStore reports a new version.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream
+        self._settings = None
+        self._settings_version = None
+        self._cells = {}
+        self._frame = None
+
+    def invalidate(self):
+        """Force the next render to redraw the whole screen."""
+        self._frame = None
+
+    def reload_settings(self):
+        """Re-read the settings and drop cached theme strings."""
+        self._settings = None
+        self._cells.clear()
+        self._frame = None
+
+    def _load(self):
+        from settings import get_settings
+        settings = get_settings()
+        if settings.current_version() != self._settings_version:
+            self.reload_settings()
+        if self._settings is None:
+            self._settings_version = settings.version
+            self._settings = (
+                THEMES.get(settings.get("color_theme", "default"), THEMES["default"]),
+                settings.get("board_style", "box"),
+                settings.get("show_hints", True),
+            )
+        return self._settings
+
+    def _cell(self, pos, value, won):
+        """Return the cached, colored text of one cell."""
+        key = (pos, value, won)
+        text = self._cells.get(key)
+        if text is None:
+            theme, style, show_hints = self._settings
+            if style == "emoji":
+                if value == ' ':
+                    text = EMPTY_MARKERS[pos - 1]
+                elif won:
+                    text = WIN_MARKER
+                else:
+                    text = X_MARKER if value == 'X' else O_MARKER
             else:
-                cell = colored(f' {value} ', Fore.WHITE)
+                pad = "  " if style == "box" else " "
+                if value == ' ':
+                    text = colored(f"{pad}{pos if show_hints else ' '}{pad}",
+                                   theme["hint"])
+                else:
+                    color = theme["win"] if won else theme.get(value.lower(), Fore.WHITE)
+                    text = colored(f"{pad}{value}{pad}", color + Style.BRIGHT)
+            self._cells[key] = text
+        return text
+
+    def build_frame(self, board, winning_combo=None):
+        """Return ``({(line, col): text}, last_line)`` for one board."""
+        theme, style, _ = self._load()
+        won = set(winning_combo or ())
+        title = theme["title"]
+        border = theme["border"]
+        frame = {
+            (2, 1): colored("  ╔═══════════════════╗", title),
+            (3, 1): colored("  ║   TIC  TAC  TOE   ║", title),
+            (4, 1): colored("  ╚═══════════════════╝", title),
+        }
+
+        if style == "emoji":
+            for i in range(3):
+                cells = [self._cell(pos, board[pos], pos in won)
+                         for pos in range(i * 3 + 1, i * 3 + 4)]
+                frame[(BOARD_TOP + 2 * i, 1)] = "    " + "  ".join(cells) + "  "
+            return frame, BOARD_TOP + 4
 
-            separator = colored("│", theme["border"])
-            cells_str += f"{separator}{cell}"
+        if style == "minimal":
+            bar = colored(" │ ", border)
+            for i in range(3):
+                line = BOARD_TOP + 2 * i
+                frame[(line, 1)] = f"    {'   '}{bar}{'   '}{bar}{'   '}"
+                if i < 2:
+                    frame[(line + 1, 1)] = colored("   ─────┼─────┼─────", border)
+                for j in range(3):
+                    pos = i * 3 + j + 1
+                    frame[(line, 5 + 6 * j)] = self._cell(pos, board[pos], pos in won)
+            return frame, BOARD_TOP + 4
 
-        cells_str += colored("│", theme["border"])
-        print(f"  {cells_str}")
-        print(colored("  │     │     │     │", theme["border"]))
+        spacer = colored("  │     │     │     │", border)
+        frame[(BOARD_TOP, 1)] = colored("  ┌─────┬─────┬─────┐", border)
+        for i in range(3):
+            line = BOARD_TOP + 1 + 4 * i
+            frame[(line, 1)] = spacer
+            frame[(line + 1, 1)] = spacer
+            frame[(line + 2, 1)] = spacer
+            frame[(line + 3, 1)] = colored(
+                "  ├─────┼─────┼─────┤" if i < 2 else "  └─────┴─────┴─────┘",
+                border)
+            for j in range(3):
+                pos = i * 3 + j + 1
+                frame[(line + 1, 4 + 6 * j)] = self._cell(pos, board[pos], pos in won)
+        return frame, BOARD_TOP + 12
 
-        if i < 2:
-            print(colored("  ├─────┼─────┼─────┤", theme["border"]))
+    def render(self, board, winning_combo=None):
+        """Draw ``board``, writing only the spans that changed."""
+        _enable_ansi()
+        frame, last_line = self.build_frame(board, winning_combo)
+        previous = self._frame
+
+        out = []
+        if previous is None:
+            out.append(CLEAR)
+            changed = sorted(frame)
         else:
-            print(colored("  └─────┴─────┴─────┘", theme["border"]))
-
-
-def render_minimal_board(board, theme, winning_combo, show_hints):
-    """Render a minimal lines style board."""
-    for i in range(3):
-        cells = []
-        for j in range(3):
-            pos = i * 3 + j + 1
-            value = board[pos]
-            if value == ' ':
-                cell_val = str(pos) if show_hints else " "
-                cells.append(colored(f' {cell_val} ', theme["hint"]))
-            elif value == 'X':
-                color = theme["win"] if winning_combo and pos in winning_combo else theme["x"]
-                cells.append(colored(' X ', color + Style.BRIGHT))
-            elif value == 'O':
-                color = theme["win"] if winning_combo and pos in winning_combo else theme["o"]
-                cells.append(colored(' O ', color + Style.BRIGHT))
-            else:
-                cells.append(colored(f' {value} ', Fore.WHITE))
-
-        print(f"    {cells[0]} {colored('│', theme['border'])} {cells[1]} {colored('│', theme['border'])} {cells[2]}")
-        if i < 2:
-            print(colored("   ─────┼─────┼─────", theme["border"]))
-
-
-def render_emoji_board(board, theme, winning_combo):
-    """Render a board using emojis or icons."""
-    # Use different markers for emoji style
-    x_marker = "❌"
-    o_marker = "⭕"
-    empty_markers = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣"]
-    win_marker = "⭐️"
-
-    for i in range(3):
-        row_str = "    "
-        for j in range(3):
-            pos = i * 3 + j + 1
-            value = board[pos]
-
-            if value == ' ':
-                cell = empty_markers[pos-1]
-            elif value == 'X':
-                cell = win_marker if winning_combo and pos in winning_combo else x_marker
-            elif value == 'O':
-                cell = win_marker if winning_combo and pos in winning_combo else o_marker
-            
-            row_str += cell + "  "
-        print(row_str)
-        if i < 2:
-            print()
+            changed = [span for span in frame if previous.get(span) != frame[span]]
+
+        for line, col in changed:
+            out.append(move_to(line, col))
+            if col == 1:
+                out.append(ERASE_LINE)
+            out.append(frame[(line, col)])
+
+        # Leave a blank line under the board and clear whatever was printed
+        # below it since the last frame (prompts, "thinking..." messages)
+        out.append(move_to(last_line + 1, 1))
+        out.append(ERASE_BELOW)
+        out.append("\n")
+
+        stream = self.stream or sys.stdout
+        stream.write("".join(out))
+        stream.flush()
+        self._frame = frame
+
+
+# Markers used by the emoji board style
+X_MARKER = "❌"
+O_MARKER = "⭕"
+WIN_MARKER = "⭐️"
+EMPTY_MARKERS = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣"]
+
+_renderer = None
+
+
+def get_renderer():
+    """Return the shared BoardRenderer used by the CLI."""
+    global _renderer
+    if _renderer is None:
+        _renderer = BoardRenderer()
+    return _renderer
+
+
+def display_board_colored(board, winning_combo=None):
+    """Display board with colors and optional winning highlight based on settings."""
+    get_renderer().render(board, winning_combo)
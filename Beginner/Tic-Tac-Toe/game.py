@@ -1,10 +1,35 @@
 """Core Tic Tac Toe game logic."""
 
+from collections.abc import MutableMapping
+
+
+def generate_win_combinations(size, win_length):
+    """
+    Return every run of ``win_length`` cells on a ``size`` x ``size`` board.
+
+    Runs are listed as rows, then columns, then diagonals, then
+    anti-diagonals, each in row-major order of their first cell. For 3x3
+    this matches TicTacToe.WIN_COMBINATIONS exactly.
+    """
+    combos = []
+    for d_row, d_col in ((0, 1), (1, 0), (1, 1), (1, -1)):
+        for row in range(size):
+            for col in range(size):
+                end_row = row + d_row * (win_length - 1)
+                end_col = col + d_col * (win_length - 1)
+                if not (0 <= end_row < size and 0 <= end_col < size):
+                    continue
+                combos.append([
+                    (row + d_row * k) * size + (col + d_col * k) + 1
+                    for k in range(win_length)
+                ])
+    return combos
+
 
 class TicTacToe:
     """Core Tic Tac Toe game logic."""
 
-    # All possible winning combinations
+    # All possible winning combinations on the classic 3x3 board
     WIN_COMBINATIONS = [
         # Rows
         [1, 2, 3],
@@ -19,9 +44,35 @@ class TicTacToe:
         [3, 5, 7],
     ]
 
-    def __init__(self):
-        """Initialize a new game."""
-        self.board = {i: ' ' for i in range(1, 10)}
+    def __init__(self, size=3, win_length=None):
+        """
+        Initialize a new game.
+
+        ``size`` is the board width and height; ``win_length`` is how many
+        marks in a row win (defaults to ``size``). Positions are numbered
+        1..size*size in row-major order.
+        """
+        if win_length is None:
+            win_length = size
+        if size < 1 or not 1 <= win_length <= size:
+            raise ValueError(
+                f"Invalid board: size={size}, win_length={win_length}")
+
+        self.size = size
+        self.win_length = win_length
+        self.num_cells = size * size
+        if size == 3 and win_length == 3:
+            self.win_combinations = self.WIN_COMBINATIONS
+        else:
+            self.win_combinations = generate_win_combinations(size, win_length)
+
+        # lines_through[pos] lists the win combinations containing pos
+        self.lines_through = {pos: [] for pos in range(1, self.num_cells + 1)}
+        for combo in self.win_combinations:
+            for pos in combo:
+                self.lines_through[pos].append(combo)
+
+        self.board = {i: ' ' for i in range(1, self.num_cells + 1)}
         self.current_player = 'X'   # X always goes first
         self.move_history = []       # List of (position, player) tuples
         self.game_over = False
@@ -29,8 +80,8 @@ class TicTacToe:
         self.move_count = 0
 
     def reset(self):
-        """Reset the game to initial state."""
-        self.__init__()
+        """Reset the game to initial state, keeping the board geometry."""
+        self.__init__(self.size, self.win_length)
 
     def get_available_moves(self):
         """Return list of available (empty) positions."""
@@ -40,7 +91,7 @@ class TicTacToe:
         """Check if a move is valid."""
         if not isinstance(position, int):
             return False
-        if position < 1 or position > 9:
+        if position < 1 or position > self.num_cells:
             return False
         if self.board[position] != ' ':
             return False
@@ -60,11 +111,12 @@ class TicTacToe:
         self.move_history.append((position, self.current_player))
         self.move_count += 1
 
-        # Check for win or draw
-        if self.check_win(self.current_player):
+        # Check for win or draw — only lines through the new mark can win
+        if any(all(self.board[pos] == self.current_player for pos in combo)
+               for combo in self.lines_through[position]):
             self.game_over = True
             self.winner = self.current_player
-        elif self.check_draw():
+        elif self.move_count == self.num_cells:
             self.game_over = True
             self.winner = None  # Draw
 
@@ -89,27 +141,34 @@ class TicTacToe:
 
     def check_win(self, player):
         """Check if the given player has won."""
-        for combo in self.WIN_COMBINATIONS:
+        for combo in self.win_combinations:
             if all(self.board[pos] == player for pos in combo):
                 return True
         return False
 
     def get_winning_combo(self, player):
         """Return the winning combination if player has won, else None."""
-        for combo in self.WIN_COMBINATIONS:
+        for combo in self.win_combinations:
             if all(self.board[pos] == player for pos in combo):
                 return combo
         return None
 
     def check_draw(self):
         """Check if the game is a draw (board full, no winner)."""
-        return (self.move_count == 9 and
+        return (self.move_count == self.num_cells and
                 not self.check_win('X') and not self.check_win('O'))
 
     def get_board_copy(self):
         """Return a deep copy of the current board."""
         return dict(self.board)
 
+    def copy(self):
+        """Return an independent game with the same geometry and moves."""
+        clone = type(self)(self.size, self.win_length)
+        for position, _ in self.move_history:
+            clone.make_move(position)
+        return clone
+
     def display(self):
         """Display the current board state."""
         from display import display_board_colored
@@ -117,12 +176,208 @@ class TicTacToe:
 
     def __str__(self):
         """String representation of the board."""
+        width = len(str(self.num_cells))
         rows = []
-        for i in range(3):
+        for i in range(self.size):
             row = []
-            for j in range(3):
-                pos = i * 3 + j + 1
+            for j in range(self.size):
+                pos = i * self.size + j + 1
                 val = self.board[pos]
-                row.append(val if val != ' ' else str(pos))
+                row.append((val if val != ' ' else str(pos)).center(width))
             rows.append(' | '.join(row))
-        return '\n-----------\n'.join(rows)
+        divider = '-' * (len(rows[0]) + 2)
+        return f'\n{divider}\n'.join(rows)
+
+
+class BoardView(MutableMapping):
+    """
+    Dict-style ``{position: mark}`` view over a BitboardTicTacToe.
+
+    Reads and writes go straight to the game's bitmasks, so code written
+    against ``game.board`` (displays, GUIs, AIs) works unchanged.
+    """
+
+    def __init__(self, game):
+        self._game = game
+
+    def __getitem__(self, position):
+        bit = self._game._bit(position)
+        if self._game.bits['X'] & bit:
+            return 'X'
+        if self._game.bits['O'] & bit:
+            return 'O'
+        return ' '
+
+    def __setitem__(self, position, value):
+        bit = self._game._bit(position)
+        bits = self._game.bits
+        bits['X'] &= ~bit
+        bits['O'] &= ~bit
+        if value in bits:
+            bits[value] |= bit
+        elif value != ' ':
+            raise ValueError(f"Invalid mark: {value!r}")
+
+    def __delitem__(self, position):
+        raise TypeError("Board positions cannot be deleted")
+
+    def __iter__(self):
+        return iter(range(1, self._game.num_cells + 1))
+
+    def __len__(self):
+        return self._game.num_cells
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+def _build_move_lists():
+    """Map every 9-bit empty-cell mask to its tuple of positions."""
+    return tuple(
+        tuple(pos for pos in range(1, 10) if mask >> (pos - 1) & 1)
+        for mask in range(1 << 9)
+    )
+
+
+def _build_win_table(win_masks):
+    """Map every 9-bit mark mask to whether it contains a win line."""
+    return tuple(
+        any(bits & mask == mask for mask in win_masks)
+        for bits in range(1 << 9)
+    )
+
+
+class BitboardTicTacToe(TicTacToe):
+    """
+    Tic Tac Toe engine storing each player's marks as an integer bitmask.
+
+    Bit ``pos - 1`` is set when the player occupies ``pos``, and every win
+    line is precomputed as a mask, so win detection is a mask check. On the
+    classic 3x3 board wins and move lists are single lookups into tables
+    keyed by the 9-bit mask. ``board`` is a BoardView, so the public API
+    matches TicTacToe.
+    """
+
+    _WIN_MASKS_3X3 = tuple(
+        sum(1 << (pos - 1) for pos in combo)
+        for combo in TicTacToe.WIN_COMBINATIONS
+    )
+
+    _WINNING_3X3 = _build_win_table(_WIN_MASKS_3X3)
+    _MOVE_LISTS_3X3 = _build_move_lists()
+
+    def __init__(self, size=3, win_length=None):
+        """Initialize a new game."""
+        super().__init__(size, win_length)
+        self.bits = {'X': 0, 'O': 0}
+        self.board = BoardView(self)
+
+        self.full_mask = (1 << self.num_cells) - 1
+        self.win_masks = tuple(
+            sum(1 << (pos - 1) for pos in combo)
+            for combo in self.win_combinations
+        )
+        self.win_masks_through = {
+            pos: tuple(mask for mask in self.win_masks if mask >> (pos - 1) & 1)
+            for pos in range(1, self.num_cells + 1)
+        }
+        self._standard = self.win_masks == self._WIN_MASKS_3X3
+
+    def reset(self):
+        """Reset the game to initial state, keeping the board geometry."""
+        self.bits = {'X': 0, 'O': 0}
+        self.current_player = 'X'
+        self.move_history = []
+        self.game_over = False
+        self.winner = None
+        self.move_count = 0
+
+    def _bit(self, position):
+        """Return the bit for a position, raising KeyError if off-board."""
+        if (not isinstance(position, int) or
+                position < 1 or position > self.num_cells):
+            raise KeyError(position)
+        return 1 << (position - 1)
+
+    def get_available_moves(self):
+        """Return list of available (empty) positions."""
+        empty = ~(self.bits['X'] | self.bits['O']) & self.full_mask
+        if self._standard:
+            return list(self._MOVE_LISTS_3X3[empty])
+
+        moves = []
+        while empty:
+            low = empty & -empty
+            moves.append(low.bit_length())
+            empty ^= low
+        return moves
+
+    def is_valid_move(self, position):
+        """Check if a move is valid."""
+        if not isinstance(position, int):
+            return False
+        if position < 1 or position > self.num_cells:
+            return False
+        if (self.bits['X'] | self.bits['O']) >> (position - 1) & 1:
+            return False
+        if self.game_over:
+            return False
+        return True
+
+    def make_move(self, position):
+        """
+        Place the current player's mark at the given position.
+        Returns True if move was successful, False otherwise.
+        """
+        if not self.is_valid_move(position):
+            return False
+
+        player = self.current_player
+        bits = self.bits[player] | (1 << (position - 1))
+        self.bits[player] = bits
+        self.move_history.append((position, player))
+        self.move_count += 1
+
+        if any(bits & mask == mask for mask in self.win_masks_through[position]):
+            self.game_over = True
+            self.winner = player
+        elif (self.bits['X'] | self.bits['O']) == self.full_mask:
+            self.game_over = True
+            self.winner = None  # Draw
+        else:
+            self.current_player = 'O' if player == 'X' else 'X'
+
+        return True
+
+    def undo_move(self):
+        """Undo the last move. Returns True if successful."""
+        if not self.move_history:
+            return False
+
+        position, player = self.move_history.pop()
+        self.bits[player] &= ~(1 << (position - 1))
+        self.move_count -= 1
+        self.current_player = player
+        self.game_over = False
+        self.winner = None
+        return True
+
+    def check_win(self, player):
+        """Check if the given player has won."""
+        bits = self.bits[player]
+        if self._standard:
+            return self._WINNING_3X3[bits]
+        return any(bits & mask == mask for mask in self.win_masks)
+
+    def get_winning_combo(self, player):
+        """Return the winning combination if player has won, else None."""
+        bits = self.bits[player]
+        for mask, combo in zip(self.win_masks, self.win_combinations):
+            if bits & mask == mask:
+                return combo
+        return None
+
+    def check_draw(self):
+        """Check if the game is a draw (board full, no winner)."""
+        return ((self.bits['X'] | self.bits['O']) == self.full_mask and
+                not self.check_win('X') and not self.check_win('O'))
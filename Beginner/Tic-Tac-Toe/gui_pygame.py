@@ -4,9 +4,13 @@ import pygame
 import sys
 import math
 import random
+from collections import deque
+from functools import lru_cache
 
 from game import TicTacToe
 from ai import EasyAI, MediumAI, HardAI
+from ai_worker import AIWorker
+from settings import get_settings
 
 # Constants
 WIDTH, HEIGHT = 600, 750
@@ -14,6 +18,7 @@ BOARD_SIZE = 450
 CELL_SIZE = BOARD_SIZE // 3
 BOARD_OFFSET_X = (WIDTH - BOARD_SIZE) // 2
 BOARD_OFFSET_Y = 180
+FPS = 60
 
 # Colors
 BG_COLOR = (26, 26, 46)
@@ -26,8 +31,33 @@ WIN_COLOR = (0, 230, 118)
 HINT_COLOR = (78, 79, 115)
 PARTICLE_COLOR = (255, 214, 0)
 
+# Screen regions redrawn independently
+BOARD_RECT = pygame.Rect(BOARD_OFFSET_X, BOARD_OFFSET_Y, BOARD_SIZE, BOARD_SIZE)
+MODES_RECT = pygame.Rect(0, 35, WIDTH, 50)
+STATUS_RECT = pygame.Rect(0, 685, WIDTH, 45)
+OVERLAY_POS = (10, 8)
+
+MODES = [("PvP", None), ("vs Easy", EasyAI), ("vs Medium", MediumAI),
+         ("vs Hard", HardAI)]
+
+# Largest number of particles alive at once
+PARTICLE_POOL_SIZE = 200
+
+
+@lru_cache(maxsize=None)
+def particle_sprite(color, size):
+    """Return a cached circle sprite; particles share one per color/size."""
+    sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, color, (size, size), size)
+    return sprite
+
+
 class Particle:
-    def __init__(self, x, y):
+    def __init__(self, x=0, y=0):
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        """Reuse this particle for a new burst at (x, y)."""
         self.x = x
         self.y = y
         self.vx = random.uniform(-5, 5)
@@ -44,10 +74,44 @@ class Particle:
         return self.lifetime > 0
 
     def draw(self, screen):
-        alpha = int(self.lifetime * 255)
-        s = pygame.Surface((self.size*2, self.size*2), pygame.SRCALPHA)
-        pygame.draw.circle(s, (*self.color, alpha), (self.size, self.size), self.size)
-        screen.blit(s, (self.x - self.size, self.y - self.size))
+        """Draw the particle and return the screen rect it covers."""
+        sprite = particle_sprite(self.color, self.size)
+        sprite.set_alpha(int(self.lifetime * 255))
+        return screen.blit(sprite, (self.x - self.size, self.y - self.size))
+
+
+class ParticlePool:
+    """Fixed set of Particle objects recycled between bursts."""
+
+    def __init__(self, capacity=PARTICLE_POOL_SIZE):
+        self.free = [Particle() for _ in range(capacity)]
+        self.active = []
+
+    def burst(self, x, y, count):
+        """Launch up to ``count`` idle particles from (x, y)."""
+        for _ in range(min(count, len(self.free))):
+            particle = self.free.pop()
+            particle.reset(x, y)
+            self.active.append(particle)
+
+    def update(self, dt):
+        alive = 0
+        for particle in self.active:
+            if particle.update(dt):
+                self.active[alive] = particle
+                alive += 1
+            else:
+                self.free.append(particle)
+        del self.active[alive:]
+
+    def clear(self):
+        self.free.extend(self.active)
+        self.active.clear()
+
+    def draw(self, screen):
+        """Draw every live particle; returns the rects drawn."""
+        return [particle.draw(screen) for particle in self.active]
+
 
 class AnimatedPiece:
     def __init__(self, row, col, type):
@@ -67,7 +131,7 @@ class AnimatedPiece:
         margin = 35
         cx = BOARD_OFFSET_X + self.col * CELL_SIZE + CELL_SIZE // 2
         cy = BOARD_OFFSET_Y + self.row * CELL_SIZE + CELL_SIZE // 2
-        
+
         if self.type == 'X':
             self.draw_x(screen, cx, cy, margin)
         else:
@@ -82,7 +146,7 @@ class AnimatedPiece:
             start = (cx - half, cy - half)
             end = (cx - half + (half * 2 * p1), cy - half + (half * 2 * p1))
             pygame.draw.line(screen, X_COLOR, start, end, 8)
-        
+
         # Second stroke
         p2 = (self.progress - 0.5) * 2
         if p2 > 1.0: p2 = 1.0
@@ -97,12 +161,12 @@ class AnimatedPiece:
         if self.progress > 0:
             pygame.draw.arc(screen, O_COLOR, rect, 0, self.progress * math.pi * 2, 8)
 
+
 def draw_board(screen):
     """Draw the game grid."""
     # Background for board
-    board_rect = pygame.Rect(BOARD_OFFSET_X, BOARD_OFFSET_Y, BOARD_SIZE, BOARD_SIZE)
-    pygame.draw.rect(screen, BORDER_COLOR, board_rect)
-    
+    pygame.draw.rect(screen, BORDER_COLOR, BOARD_RECT)
+
     # Grid lines
     for i in range(1, 3):
         x = BOARD_OFFSET_X + i * CELL_SIZE
@@ -110,167 +174,286 @@ def draw_board(screen):
         y = BOARD_OFFSET_Y + i * CELL_SIZE
         pygame.draw.line(screen, LINE_COLOR, (BOARD_OFFSET_X, y), (BOARD_OFFSET_X + BOARD_SIZE, y), 5)
 
+
+def cell_rect(pos):
+    """Screen rect inside the grid lines of board position ``pos``."""
+    row, col = (pos - 1) // 3, (pos - 1) % 3
+    return pygame.Rect(BOARD_OFFSET_X + col * CELL_SIZE + 3,
+                       BOARD_OFFSET_Y + row * CELL_SIZE + 3,
+                       CELL_SIZE - 6, CELL_SIZE - 6)
+
+
+def cell_center(pos):
+    row, col = (pos - 1) // 3, (pos - 1) % 3
+    return (BOARD_OFFSET_X + col * CELL_SIZE + CELL_SIZE // 2,
+            BOARD_OFFSET_Y + row * CELL_SIZE + CELL_SIZE // 2)
+
+
+class SceneRenderer:
+    """
+    Dirty-rectangle renderer.
+
+    Everything except particles and the frame-time overlay is drawn on an
+    off-screen ``scene``. Each region is redrawn only when the key that
+    describes its content changes. A frame copies just the changed scene
+    rects to the screen, draws the particles and overlay over them, and
+    passes the union of those rects to ``pygame.display.update``.
+    """
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.scene = pygame.Surface(screen.get_size())
+        self._keys = {}
+        self._dirty = []
+        self._floating = []   # Rects drawn over the scene last frame
+
+        self.scene.fill(BG_COLOR)
+        draw_board(self.scene)
+
+    def region(self, name, key, rect, draw):
+        """Redraw ``rect`` of the scene with ``draw(surface, rect)`` if ``key`` changed."""
+        if name in self._keys and self._keys[name] == key:
+            return False
+        self._keys[name] = key
+        self.scene.set_clip(rect)
+        draw(self.scene, rect)
+        self.scene.set_clip(None)
+        self._dirty.append(pygame.Rect(rect))
+        return True
+
+    def forget(self, *names):
+        """Force the named regions to redraw next frame."""
+        for name in names:
+            self._keys.pop(name, None)
+
+    def present(self, particles, overlay=None):
+        """Put the changed rects on screen; returns how many were updated."""
+        screen = self.screen
+        rects = self._dirty + self._floating
+        for rect in rects:
+            screen.blit(self.scene, rect, rect)
+
+        floating = particles.draw(screen)
+        if overlay is not None:
+            floating.append(screen.blit(overlay, OVERLAY_POS))
+
+        rects.extend(floating)
+        if rects:
+            pygame.display.update(rects)
+        self._floating = floating
+        self._dirty = []
+        return len(rects)
+
+
+class FrameStats:
+    """Rolling frame-interval and frame-work times for the overlay."""
+
+    def __init__(self, window=FPS * 2):
+        self.intervals = deque(maxlen=window)
+        self.work = deque(maxlen=window)
+
+    def add(self, interval_ms, work_ms):
+        self.intervals.append(interval_ms)
+        self.work.append(work_ms)
+
+    def text(self):
+        if not self.intervals:
+            return ""
+        mean = sum(self.intervals) / len(self.intervals)
+        fps = 1000 / mean if mean else 0.0
+        return (f"{fps:5.1f} FPS  frame {mean:4.1f} ms  "
+                f"work {sum(self.work) / len(self.work):4.1f} ms  "
+                f"worst {max(self.intervals):4.1f} ms")
+
+
 def main():
     """Main Pygame logic."""
     pygame.init()
     if pygame.mixer.get_init():
         # Optional: pygame.mixer.music.load("bg_music.mp3")
         pass
-    
+
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Tic Tac Toe — Premium Edition")
     clock = pygame.time.Clock()
-    
+
     try:
         title_font = pygame.font.Font(None, 64)
         status_font = pygame.font.Font(None, 36)
         ui_font = pygame.font.Font(None, 28)
+        overlay_font = pygame.font.Font(None, 22)
     except:
         title_font = pygame.font.SysFont("arial", 48, bold=True)
         status_font = pygame.font.SysFont("arial", 28)
         ui_font = pygame.font.SysFont("arial", 22)
+        overlay_font = pygame.font.SysFont("arial", 16)
 
     game = TicTacToe()
     ai = None
-    ai_choice = "Player"
-    
-    animated_pieces = []
-    particles = []
-    
-    running = True
-    ai_turn = False
-    ai_delay = 0
-    winner_notified = False
+    worker = AIWorker()
+    settings = get_settings()
+    show_hints = settings.get("show_hints", True)
+    ai_thinking_delay = 0.6 if settings.get("ai_thinking_delay", True) else 0
+
+    pieces = {}            # position -> AnimatedPiece
+    particles = ParticlePool()
+    renderer = SceneRenderer(screen)
+    frame_stats = FrameStats()
+    show_overlay = False
+
+    title_txt = title_font.render("TIC TAC TOE", True, LINE_COLOR)
+    renderer.scene.blit(title_txt, (WIDTH // 2 - title_txt.get_width() // 2, 110))
+    screen.blit(renderer.scene, (0, 0))
+    pygame.display.flip()
+
+    def new_game(new_ai):
+        nonlocal ai, show_hints, ai_thinking_delay
+        worker.cancel()
+        ai = new_ai
+        game.reset()
+        pieces.clear()
+        particles.clear()
+        # Pick up settings changed from the CLI or another window
+        show_hints = settings.get("show_hints", True)
+        ai_thinking_delay = 0.6 if settings.get("ai_thinking_delay", True) else 0
+
+    def play(position):
+        player = game.current_player
+        row, col = (position - 1) // 3, (position - 1) % 3
+        game.make_move(position)
+        pieces[position] = AnimatedPiece(row, col, player)
+        if game.game_over and game.winner:
+            # Fireworks
+            particles.burst(WIDTH // 2, HEIGHT // 2, 50)
+
+    def draw_modes(surface, rect):
+        surface.fill(BG_COLOR, rect)
+        for i, (label, cls) in enumerate(MODES):
+            active = (ai is None) if cls is None else isinstance(ai, cls)
+            col = X_COLOR if active else TEXT_COLOR
+            btn_rect = pygame.Rect(20 + i * 140, 40, 130, 40)
+            pygame.draw.rect(surface, col, btn_rect, 2, 5)
+            txt = ui_font.render(label, True, col)
+            surface.blit(txt, (btn_rect.centerx - txt.get_width() // 2,
+                               btn_rect.centery - txt.get_height() // 2))
 
+    def draw_status(text, color):
+        def draw(surface, rect):
+            surface.fill(BG_COLOR, rect)
+            txt = status_font.render(text, True, color)
+            surface.blit(txt, (WIDTH // 2 - txt.get_width() // 2, 700))
+        return draw
+
+    def draw_cell(pos, hint):
+        def draw(surface, rect):
+            surface.fill(BORDER_COLOR, rect)
+            piece = pieces.get(pos)
+            if piece is not None:
+                piece.draw(surface)
+            elif hint:
+                row, col = (pos - 1) // 3, (pos - 1) % 3
+                num_txt = ui_font.render(str(pos), True, HINT_COLOR)
+                surface.blit(num_txt, (BOARD_OFFSET_X + col * CELL_SIZE + 10,
+                                       BOARD_OFFSET_Y + row * CELL_SIZE + 10))
+        return draw
+
+    def cell_key(pos, hint):
+        piece = pieces.get(pos)
+        return (piece.type, piece.progress) if piece is not None else hint
+
+    def draw_grid(surface, rect):
+        draw_board(surface)
+
+    def draw_won_board(combo):
+        def draw(surface, rect):
+            draw_board(surface)
+            for pos in range(1, 10):
+                draw_cell(pos, False)(surface, cell_rect(pos))
+            pygame.draw.line(surface, WIN_COLOR, cell_center(combo[0]),
+                             cell_center(combo[-1]), 10)
+        return draw
+
+    running = True
     while running:
-        dt = clock.tick(60) / 1000.0
-        
+        dt = clock.tick(FPS) / 1000.0
+        frame_stats.add(clock.get_time(), clock.get_rawtime())
+
         # --- Handle Input ---
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
-            
-            if event.type == pygame.MOUSEBUTTONDOWN and not game.game_over and not ai_turn:
+
+            if event.type == pygame.MOUSEBUTTONDOWN:
                 pos = event.pos
-                if (BOARD_OFFSET_X <= pos[0] < BOARD_OFFSET_X + BOARD_SIZE and 
-                    BOARD_OFFSET_Y <= pos[1] < BOARD_OFFSET_Y + BOARD_SIZE):
+                if (BOARD_RECT.collidepoint(pos) and not game.game_over and
+                        not worker.busy):
                     col = (pos[0] - BOARD_OFFSET_X) // CELL_SIZE
                     row = (pos[1] - BOARD_OFFSET_Y) // CELL_SIZE
                     position = row * 3 + col + 1
-                    
                     if game.is_valid_move(position):
-                        game.make_move(position)
-                        animated_pieces.append(AnimatedPiece(row, col, 'X'))
-                        if ai and not game.game_over:
-                            ai_turn = True
-                            ai_delay = 0.6
-                
+                        play(position)
+
                 # Check mode buttons (simple area checks)
                 if pos[1] < 100:
-                    if 20 < pos[0] < 150: 
-                        ai = None; ai_choice = "Player"; game.reset(); animated_pieces = []; winner_notified = False
-                    elif 160 < pos[0] < 290:
-                        ai = EasyAI('O'); ai_choice = "Easy AI"; game.reset(); animated_pieces = []; winner_notified = False
-                    elif 300 < pos[0] < 430:
-                        ai = MediumAI('O'); ai_choice = "Medium AI"; game.reset(); animated_pieces = []; winner_notified = False
-                    elif 440 < pos[0] < 570:
-                        ai = HardAI('O'); ai_choice = "Hard AI"; game.reset(); animated_pieces = []; winner_notified = False
+                    for i, (_, cls) in enumerate(MODES):
+                        if 20 + i * 140 < pos[0] < 150 + i * 140:
+                            new_game(cls('O') if cls else None)
 
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_n:
-                    game.reset()
-                    animated_pieces = []
-                    particles = []
-                    ai_turn = False
-                    winner_notified = False
-
-        # --- AI Strategy ---
-        if ai_turn and not game.game_over:
-            ai_delay -= dt
-            if ai_delay <= 0:
-                move = ai.get_move(game)
-                row, col = (move - 1) // 3, (move - 1) % 3
-                game.make_move(move)
-                animated_pieces.append(AnimatedPiece(row, col, 'O'))
-                ai_turn = False
+                    new_game(ai)
+                elif event.key == pygame.K_f:
+                    show_overlay = not show_overlay
+
+        # --- AI Strategy (searched off the frame loop) ---
+        if ai and not game.game_over and game.current_player == ai.symbol:
+            if not worker.busy:
+                worker.start(ai, game)
+            move = worker.poll(ai_thinking_delay)
+            if move is not None:
+                play(move)
 
         # --- Update Effects ---
-        for p in animated_pieces:
+        for p in pieces.values():
             p.update(dt)
-            
-        particles = [p for p in particles if p.update(dt)]
-        
-        if game.game_over and game.winner and not winner_notified:
-            # Spawn fireworks
-            for _ in range(50):
-                particles.append(Particle(WIDTH // 2, HEIGHT // 2))
-            winner_notified = True
-
-        # --- Draw Everything ---
-        screen.fill(BG_COLOR)
-        
-        # Draw Mode Selector
-        modes = ["PvP", "vs Easy", "vs Medium", "vs Hard"]
-        for i, m in enumerate(modes):
-            col = X_COLOR if (i==0 and ai is None) or (i==1 and isinstance(ai, EasyAI)) or \
-                           (i==2 and isinstance(ai, MediumAI)) or (i==3 and isinstance(ai, HardAI)) else TEXT_COLOR
-            btn_rect = pygame.Rect(20 + i*140, 40, 130, 40)
-            pygame.draw.rect(screen, col, btn_rect, 2, 5)
-            txt = ui_font.render(m, True, col)
-            screen.blit(txt, (btn_rect.centerx - txt.get_width()//2, btn_rect.centery - txt.get_height()//2))
-
-        # Title
-        title_txt = title_font.render("TIC TAC TOE", True, LINE_COLOR)
-        screen.blit(title_txt, (WIDTH // 2 - title_txt.get_width() // 2, 110))
-        
-        # Status
+        particles.update(dt)
+
+        # --- Redraw changed regions ---
+        renderer.region("modes", type(ai), MODES_RECT, draw_modes)
+
         if game.game_over:
             if game.winner:
-                s_txt = f"{game.winner} Wins!"
-                s_col = WIN_COLOR
+                s_txt, s_col = f"{game.winner} Wins!", WIN_COLOR
             else:
-                s_txt = "Draw!"
-                s_col = PARTICLE_COLOR
+                s_txt, s_col = "Draw!", PARTICLE_COLOR
+        elif worker.busy:
+            dots = "." * (1 + int(worker.elapsed() * 3) % 3)
+            s_txt, s_col = f"{game.current_player} is thinking{dots}", O_COLOR
         else:
             s_txt = f"{game.current_player}'s Turn"
             s_col = X_COLOR if game.current_player == 'X' else O_COLOR
-        
-        status_txt = status_font.render(s_txt, True, s_col)
-        screen.blit(status_txt, (WIDTH // 2 - status_txt.get_width() // 2, 700))
-
-        draw_board(screen)
-        
-        # Hint numbers
-        if not game.game_over:
-            for i in range(3):
-                for j in range(3):
-                    pos = i * 3 + j + 1
-                    if game.board[pos] == ' ':
-                        num_txt = ui_font.render(str(pos), True, HINT_COLOR)
-                        screen.blit(num_txt, (BOARD_OFFSET_X + j * CELL_SIZE + 10, BOARD_OFFSET_Y + i * CELL_SIZE + 10))
-
-        # Pieces
-        for p in animated_pieces:
-            p.draw(screen)
-
-        # Winning line
-        if game.game_over and game.winner:
-            combo = game.get_winning_combo(game.winner)
-            if combo:
-                c1 = combo[0]
-                c3 = combo[2]
-                p1 = (BOARD_OFFSET_X + ((c1-1)%3) * CELL_SIZE + CELL_SIZE//2, 
-                      BOARD_OFFSET_Y + ((c1-1)//3) * CELL_SIZE + CELL_SIZE//2)
-                p2 = (BOARD_OFFSET_X + ((c3-1)%3) * CELL_SIZE + CELL_SIZE//2, 
-                      BOARD_OFFSET_Y + ((c3-1)//3) * CELL_SIZE + CELL_SIZE//2)
-                pygame.draw.line(screen, WIN_COLOR, p1, p2, 10)
-
-        # Particles
-        for p in particles:
-            p.draw(screen)
-
-        pygame.display.flip()
+        renderer.region("status", s_txt, STATUS_RECT, draw_status(s_txt, s_col))
+
+        combo = game.get_winning_combo(game.winner) if game.winner else None
+        hint = show_hints and not game.game_over
+        cell_keys = [cell_key(pos, hint) for pos in range(1, 10)]
+        if combo:
+            renderer.region("board", (tuple(combo), tuple(cell_keys)),
+                            BOARD_RECT, draw_won_board(combo))
+        else:
+            if renderer.region("board", None, BOARD_RECT, draw_grid):
+                renderer.forget(*range(1, 10))  # Grid repainted under the cells
+            for pos in range(1, 10):
+                renderer.region(pos, cell_keys[pos - 1], cell_rect(pos),
+                                draw_cell(pos, hint))
+
+        overlay = None
+        if show_overlay:
+            overlay = overlay_font.render(frame_stats.text(), True, TEXT_COLOR,
+                                          BG_COLOR)
+        renderer.present(particles, overlay)
 
+    worker.cancel()
     pygame.quit()
 
 if __name__ == "__main__":
@@ -4,12 +4,17 @@ import tkinter as tk
 from tkinter import messagebox, ttk
 
 from game import TicTacToe
-from ai import EasyAI, MediumAI, HardAI
+from ai import EasyAI, MediumAI, HardAI, ImpossibleAI, MasterAI
+from ai_worker import AIWorker
+from settings import get_settings
 
 
 class TicTacToeGUI:
     """Graphical User Interface for Tic Tac Toe."""
 
+    # How often to check on a running AI search
+    AI_POLL_MS = 30
+
     COLORS = {
         "bg": "#1a1a2e",
         "board_bg": "#16213e",
@@ -37,6 +42,8 @@ class TicTacToeGUI:
         self.ai_difficulty = "medium"
         self.score = {"X": 0, "O": 0, "Draw": 0}
         self.buttons = {}
+        self.settings = get_settings()
+        self.worker = AIWorker()
 
         self.create_widgets()
         self.center_window()
@@ -66,6 +73,10 @@ class TicTacToeGUI:
         )
         self.status_label.pack()
 
+        # Shown only while the AI is searching
+        self.progress = ttk.Progressbar(info_frame, mode="indeterminate",
+                                        length=160)
+
         self.score_label = tk.Label(
             info_frame,
             text="X: 0  │  O: 0  │  Draw: 0",
@@ -122,7 +133,8 @@ class TicTacToeGUI:
             mode_frame,
             textvariable=self.mode_var,
             values=["Player vs Player", "Player vs AI (Easy)",
-                    "Player vs AI (Medium)", "Player vs AI (Hard)"],
+                    "Player vs AI (Medium)", "Player vs AI (Hard)",
+                    "Player vs AI (Impossible)", "Player vs AI (Master)"],
             state="readonly",
             width=22
         )
@@ -154,7 +166,7 @@ class TicTacToeGUI:
 
     def cell_clicked(self, position):
         """Handle a cell click."""
-        if self.game.game_over:
+        if self.game.game_over or self.worker.busy:
             return
         if not self.game.is_valid_move(position):
             return
@@ -170,14 +182,47 @@ class TicTacToeGUI:
         self.update_status()
 
         if self.ai and self.game.current_player == 'O':
-            self.root.after(500, self.ai_move)
+            self.start_ai_move()
+
+    def ai_min_display_s(self):
+        """
+        Shortest time the "thinking" state is shown, per the shared "AI
+        thinking delay" setting. Search time counts toward it.
+        """
+        return 0.5 if self.settings.get("ai_thinking_delay", True) else 0.0
+
+    def start_ai_move(self):
+        """Start the AI's search in the background and show progress."""
+        self.worker.start(self.ai, self.game)
+        self.status_label.config(text=f"🤖 {self.ai.name} is thinking...",
+                                 fg=self.COLORS["o_color"])
+        self.progress.pack(pady=(5, 0))
+        self.progress.start(15)
+        self.root.after(self.AI_POLL_MS, self.poll_ai_move)
+
+    def stop_ai_move(self):
+        """Cancel any running search and hide the progress bar."""
+        self.worker.cancel()
+        self.progress.stop()
+        self.progress.pack_forget()
+
+    def poll_ai_move(self):
+        """Apply the AI's move once its search (and minimum display) is done."""
+        if not self.worker.busy:
+            return  # Cancelled by new game / undo
+        move = self.worker.poll(self.ai_min_display_s())
+        if move is None:
+            self.root.after(self.AI_POLL_MS, self.poll_ai_move)
+            return
 
-    def ai_move(self):
-        """Let the AI make a move."""
+        self.stop_ai_move()
+        self.ai_move(move)
+
+    def ai_move(self, move):
+        """Play the move the AI chose."""
         if self.game.game_over:
             return
 
-        move = self.ai.get_move(self.game)
         player = self.game.current_player
         self.game.make_move(move)
         self.update_cell(move, player)
@@ -189,6 +234,8 @@ class TicTacToeGUI:
 
     def update_cell(self, position, player):
         """Update the visual of a cell."""
+        if self.settings.get("sound_enabled", False):
+            self.root.bell()
         btn = self.buttons[position]
         color = self.COLORS["x_color"] if player == 'X' else self.COLORS["o_color"]
         btn.config(
@@ -243,6 +290,7 @@ class TicTacToeGUI:
 
     def new_game(self):
         """Start a new game."""
+        self.stop_ai_move()
         self.game.reset()
         for pos in range(1, 10):
             self.buttons[pos].config(
@@ -254,12 +302,16 @@ class TicTacToeGUI:
         self.update_status()
 
         if self.ai and self.game.current_player == 'O':
-            self.root.after(500, self.ai_move)
+            self.start_ai_move()
 
     def undo_move(self):
-        """Undo the last move."""
+        """Undo the last move (and the AI's reply, so it is your turn)."""
+        self.stop_ai_move()
         if not self.game.undo_move():
+            self.update_status()
             return
+        if self.ai and self.game.current_player == 'O':
+            self.game.undo_move()
 
         # Redraw entire board from game state
         for pos in range(1, 10):
@@ -307,6 +359,10 @@ class TicTacToeGUI:
             self.ai = MediumAI('O')
         elif "Hard" in selection:
             self.ai = HardAI('O')
+        elif "Impossible" in selection:
+            self.ai = ImpossibleAI('O')
+        elif "Master" in selection:
+            self.ai = MasterAI('O')
 
         self.new_game()
 
@@ -0,0 +1,145 @@
+"""Incrementally maintained leaderboard rankings."""
+
+import heapq
+from bisect import bisect_left, insort
+from datetime import date, timedelta
+
+# Longest time window kept in the per-day buckets
+MAX_WINDOW_DAYS = 30
+
+
+def _win_rate(stats):
+    total = stats["total_games"]
+    return stats["wins"] / total if total else 0.0
+
+
+# Each metric maps player stats to a sort key; smaller keys rank higher
+METRICS = {
+    "wins": lambda s: (-s["wins"], -_win_rate(s)),
+    "win_rate": lambda s: (-_win_rate(s), -s["wins"]),
+    "streak": lambda s: (-s["best_streak"], -s["win_streak"]),
+}
+
+
+class Leaderboard:
+    """
+    Player rankings kept sorted as games are recorded.
+
+    Every metric in METRICS has its own sorted list of
+    ``(key..., player_name)`` tuples. Updating a player moves one entry per
+    list, and top-K, pages and rank lookups are slices or bisections, so
+    none of them re-sort the whole player table.
+
+    ``daily`` maps ``'YYYY-MM-DD'`` to ``{player: [wins, losses, draws]}``
+    for the last MAX_WINDOW_DAYS days and backs the time-windowed queries.
+    """
+
+    def __init__(self, players=None, daily=None):
+        self.players = {}
+        self.daily = {} if daily is None else daily
+        self._sorted = {metric: [] for metric in METRICS}
+        self._keys = {}
+        self._window_cache = {}
+
+        for name, stats in (players or {}).items():
+            self.players[name] = stats
+            self._keys[name] = {}
+            for metric, key_func in METRICS.items():
+                key = key_func(stats) + (name,)
+                self._keys[name][metric] = key
+                self._sorted[metric].append(key)
+        for entries in self._sorted.values():
+            entries.sort()
+
+    def __len__(self):
+        return len(self.players)
+
+    def update(self, name, stats):
+        """Re-rank ``name`` after its stats changed (or were created)."""
+        self.players[name] = stats
+        old_keys = self._keys.setdefault(name, {})
+        for metric, key_func in METRICS.items():
+            entries = self._sorted[metric]
+            old = old_keys.get(metric)
+            if old is not None:
+                del entries[bisect_left(entries, old)]
+            key = key_func(stats) + (name,)
+            insort(entries, key)
+            old_keys[metric] = key
+
+    def page(self, metric="wins", page=1, per_page=10):
+        """Return ``[(rank, name, stats)]`` for one page of the ranking."""
+        entries = self._sorted[metric]
+        start = (page - 1) * per_page
+        return [(start + i + 1, key[-1], self.players[key[-1]])
+                for i, key in enumerate(entries[start:start + per_page])]
+
+    def top(self, metric="wins", k=10):
+        """Return ``[(rank, name, stats)]`` for the best ``k`` players."""
+        return self.page(metric, 1, k)
+
+    def rank(self, name, metric="wins"):
+        """Return the 1-based rank of ``name``, or None if unknown."""
+        key = self._keys.get(name, {}).get(metric)
+        if key is None:
+            return None
+        return bisect_left(self._sorted[metric], key) + 1
+
+    # --- Time-windowed stats ---
+
+    def record_day(self, day, player, outcome):
+        """
+        Count one result for ``player`` on ``day`` ('YYYY-MM-DD').
+
+        ``outcome`` is 0 for a win, 1 for a loss and 2 for a draw.
+        """
+        counts = self.daily.setdefault(day, {}).setdefault(player, [0, 0, 0])
+        counts[outcome] += 1
+        self._window_cache.clear()
+
+    def prune_days(self, today=None):
+        """Drop buckets older than MAX_WINDOW_DAYS."""
+        today = today or date.today()
+        cutoff = (today - timedelta(days=MAX_WINDOW_DAYS - 1)).isoformat()
+        for day in [d for d in self.daily if d < cutoff]:
+            del self.daily[day]
+        self._window_cache.clear()
+
+    def window(self, days=7, today=None):
+        """
+        Return ``{player: {"wins", "losses", "draws", "total_games"}}``
+        over the last ``days`` days, including today.
+        """
+        if days > MAX_WINDOW_DAYS:
+            raise ValueError(f"Windows are limited to {MAX_WINDOW_DAYS} days")
+        today = today or date.today()
+        cache_key = (days, today)
+        if cache_key in self._window_cache:
+            return self._window_cache[cache_key]
+
+        totals = {}
+        for offset in range(days):
+            day = (today - timedelta(days=offset)).isoformat()
+            for player, (w, l, d) in self.daily.get(day, {}).items():
+                t = totals.setdefault(player, [0, 0, 0])
+                t[0] += w
+                t[1] += l
+                t[2] += d
+
+        result = {
+            player: {"wins": w, "losses": l, "draws": d,
+                     "total_games": w + l + d}
+            for player, (w, l, d) in totals.items()
+        }
+        self._window_cache[cache_key] = result
+        return result
+
+    def window_top(self, metric="wins", k=10, days=7, today=None):
+        """Return ``[(rank, name, stats)]`` for the best ``k`` in a window."""
+        if metric not in ("wins", "win_rate"):
+            raise ValueError(f"Unsupported window metric: {metric}")
+        stats = self.window(days, today)
+        key_func = METRICS[metric]
+        best = heapq.nsmallest(
+            k, stats.items(), key=lambda item: key_func(item[1]) + (item[0],))
+        return [(i + 1, name, s) for i, (name, s) in enumerate(best)]
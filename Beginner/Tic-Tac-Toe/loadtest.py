@@ -0,0 +1,133 @@
+"""
+Load-test client for server.py.
+
+Opens many concurrent connections, plays random legal moves against the
+server's AI, and reports matches per second and the round-trip latency
+of each move (request sent to state received):
+
+    python server.py --no-record &
+    python loadtest.py -n 5000 -c 500 --ai ImpossibleAI
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+from server import HOST, PORT
+from simulate import PERCENTILES, percentile
+
+
+async def _request(reader, writer, message):
+    writer.write(json.dumps(message, separators=(',', ':')).encode() + b'\n')
+    await writer.drain()
+    reply = json.loads(await reader.readline())
+    if reply["type"] == "error":
+        raise RuntimeError(reply["message"])
+    return reply
+
+
+async def play_match(reader, writer, ai, size, rng, latencies):
+    """Play one match as X with random moves; returns the winner."""
+    state = await _request(reader, writer, {"type": "new", "ai": ai,
+                                            "name": "LoadTest", "size": size})
+    while not state["over"]:
+        empty = [i + 1 for i, cell in enumerate(state["board"]) if cell == '.']
+        start = time.perf_counter()
+        state = await _request(reader, writer,
+                               {"type": "move", "position": rng.choice(empty)})
+        latencies.append(time.perf_counter() - start)
+    return state["winner"]
+
+
+async def load_test(host=HOST, port=PORT, matches=1000, concurrency=100,
+                    ai="HardAI", size=3, seed=None):
+    """
+    Play ``matches`` matches over ``concurrency`` connections.
+
+    Returns a report dict with throughput and move round-trip latency
+    percentiles.
+    """
+    rng = random.Random(seed)
+    remaining = matches
+    latencies = []
+    outcomes = {'X': 0, 'O': 0, None: 0}
+
+    async def client():
+        nonlocal remaining
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while remaining > 0:
+                remaining -= 1
+                winner = await play_match(reader, writer, ai, size, rng, latencies)
+                outcomes[winner] += 1
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(min(concurrency, matches))))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    latency = {f"p{pct}_ms": percentile(latencies, pct) * 1000 for pct in PERCENTILES}
+    latency["max_ms"] = latencies[-1] * 1000 if latencies else 0.0
+    return {
+        "ai": ai,
+        "board": f"{size}x{size}",
+        "matches": matches,
+        "concurrency": concurrency,
+        "client_wins": outcomes['X'],
+        "ai_wins": outcomes['O'],
+        "draws": outcomes[None],
+        "moves": len(latencies),
+        "elapsed_s": elapsed,
+        "matches_per_second": matches / elapsed if elapsed else 0.0,
+        "latency": latency,
+    }
+
+
+def print_report(report):
+    """Print a load-test report as plain text."""
+    lat = report["latency"]
+    print(f"\n  {report['matches']} matches vs {report['ai']} on {report['board']}, "
+          f"{report['concurrency']} connections")
+    print(f"  Client wins {report['client_wins']}, AI wins {report['ai_wins']}, "
+          f"draws {report['draws']}")
+    print(f"  Throughput: {report['matches_per_second']:.1f} matches/s "
+          f"({report['elapsed_s']:.2f}s, {report['moves']} moves)")
+    print(f"  Move round trip: p50 {lat['p50_ms']:.2f} ms, p90 {lat['p90_ms']:.2f} ms, "
+          f"p99 {lat['p99_ms']:.2f} ms, max {lat['max_ms']:.2f} ms\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the network server.")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("-n", "--matches", type=int, default=1000)
+    parser.add_argument("-c", "--concurrency", type=int, default=100)
+    parser.add_argument("--ai", default="HardAI")
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", action="store_true",
+                        help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        report = asyncio.run(load_test(args.host, args.port, args.matches,
+                                       args.concurrency, args.ai, args.size,
+                                       args.seed))
+    except (OSError, RuntimeError) as e:
+        print(f"Load test failed: {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
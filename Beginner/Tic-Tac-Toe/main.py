@@ -1,14 +1,76 @@
 """Main entry point for the Tic Tac Toe game."""
 
+import argparse
 import sys
 import time
-import random
 
-from game import TicTacToe
 from display import clear_screen, display_board_colored, colored, Fore, Style
-from ai import EasyAI, MediumAI, HardAI, ImpossibleAI
-from scores import ScoreTracker
-from settings import display_settings, load_settings
+
+# The game, AI, stats and settings modules are imported on first use, so
+# the menu appears without building AI tables or parsing the stats file.
+# Check with: python startup_benchmark.py
+
+# Where to write AI search profiles (set by --profile; None = profiling off)
+PROFILE_OUTPUT = None
+_profiles = []
+
+# AI menu choices, by class name in ai.py
+AI_CHOICES = {
+    '1': "EasyAI",
+    '2': "MediumAI",
+    '3': "HardAI",
+    '4': "ImpossibleAI",
+    '5': "MasterAI",
+    '6': "MCTSAI",
+}
+
+_score_tracker = None
+
+
+def get_score_tracker():
+    """Return the shared ScoreTracker, loading the stats on first use."""
+    global _score_tracker
+    if _score_tracker is None:
+        from scores import ScoreTracker
+        _score_tracker = ScoreTracker()
+    return _score_tracker
+
+
+def make_ai(class_name, symbol):
+    """Build an AI from ai.py by class name, importing ai.py when first needed."""
+    import ai
+    return getattr(ai, class_name)(symbol)
+
+
+def setup_ai(ai):
+    """Turn on search profiling for ``ai`` when running with --profile."""
+    if PROFILE_OUTPUT is not None:
+        _profiles.append(ai.enable_profiling())
+    return ai
+
+
+def show_profile(ai):
+    """Print the search statistics of the AI's last move, if profiled."""
+    if ai.profile is None or not ai.profile.moves:
+        return
+    stats = ai.profile.moves[-1]
+    print(colored(
+        f"  ⏱️  {stats['time_ms']:.1f} ms | {stats['nodes']} nodes | "
+        f"{stats['cutoffs']} cutoffs | branching {stats['branching_factor']:.2f} | "
+        f"TT hits {stats['tt_hit_rate']:.0%}", Fore.WHITE))
+    if getattr(ai, "last_playouts", 0):
+        print(colored(f"  🎲 {ai.last_playouts} playouts "
+                      f"({ai.last_playouts_per_second:,.0f}/s)", Fore.WHITE))
+
+
+def save_profiles():
+    """Write every recorded search profile to PROFILE_OUTPUT as JSON."""
+    if PROFILE_OUTPUT is None or not _profiles:
+        return
+    import json
+    with open(PROFILE_OUTPUT, 'w') as f:
+        json.dump([profile.to_dict() for profile in _profiles], f, indent=2)
+    print(colored(f"  ⏱️  Search profile saved to {PROFILE_OUTPUT}", Fore.WHITE))
 
 
 def get_player_move(game, player_name):
@@ -61,10 +123,13 @@ def get_player_move(game, player_name):
             print(colored("  ❌ Invalid input. Enter a number (1-9) or 'h' for help.", Fore.RED))
 
 
-def play_pvp(score_tracker):
+def play_pvp(score_tracker=None):
     """Play a Player vs Player game."""
+    from game import TicTacToe
+    from settings import get_settings
+
     game = TicTacToe()
-    settings = load_settings()
+    settings = get_settings()
     auto_save = settings.get("auto_save_stats", True)
     sound_enabled = settings.get("sound_enabled", False)
 
@@ -100,10 +165,12 @@ def play_pvp(score_tracker):
                 display_board_colored(game.board)
 
         # Record game for stats
-        if auto_save and score_tracker:
-            score_tracker.record_game(
+        if auto_save:
+            (score_tracker or get_score_tracker()).record_game(
                 player_names['X'], player_names['O'],
-                game.winner, game.move_count, "PvP"
+                player_names[game.winner] if game.winner else None,
+                game.move_count, "PvP",
+                [pos for pos, _ in game.move_history]
             )
 
         if game.winner:
@@ -121,10 +188,14 @@ def play_pvp(score_tracker):
             break
 
 
-def play_pvai(score_tracker):
+def play_pvai(score_tracker=None):
     """Play a Player vs AI game."""
+    import random
+    from game import TicTacToe
+    from settings import get_settings
+
     game = TicTacToe()
-    settings = load_settings()
+    settings = get_settings()
     auto_save = settings.get("auto_save_stats", True)
     ai_delay = settings.get("ai_thinking_delay", True)
     sound_enabled = settings.get("sound_enabled", False)
@@ -156,22 +227,17 @@ def play_pvai(score_tracker):
     print(colored("    2. 🟡 Medium  — Basic strategy", Fore.YELLOW))
     print(colored("    3. 🔴 Hard    — Minimax (Unbeatable)", Fore.RED))
     print(colored("    4. 🟣 Impossible — Alpha-Beta (Unbeatable+)", Fore.MAGENTA))
+    print(colored("    5. 🔵 Master  — Iterative Deepening (Timed)", Fore.BLUE))
+    print(colored("    6. 🟠 MCTS    — Monte Carlo Tree Search (Timed)", Fore.YELLOW))
 
     while True:
-        diff = input(colored("\n  Enter difficulty (1-4) [2]: ", Fore.YELLOW)).strip()
-        if diff in ('', '2'):
-            ai = MediumAI(ai_symbol)
-            break
-        elif diff == '1':
-            ai = EasyAI(ai_symbol)
-            break
-        elif diff == '3':
-            ai = HardAI(ai_symbol)
-            break
-        elif diff == '4':
-            ai = ImpossibleAI(ai_symbol)
+        diff = input(colored("\n  Enter difficulty (1-6) [2]: ", Fore.YELLOW)).strip()
+        diff = diff or '2'
+        if diff in AI_CHOICES:
+            ai = make_ai(AI_CHOICES[diff], ai_symbol)
             break
         print(colored("  ❌ Invalid choice.", Fore.RED))
+    setup_ai(ai)
 
     print(colored(f"\n  You: {player_symbol} | AI: {ai_symbol} ({ai.name})", Fore.WHITE))
     print(colored("  Type 'h' for help during the game.\n", Fore.WHITE))
@@ -204,19 +270,23 @@ def play_pvai(score_tracker):
                 display_board_colored(game.board, winning_combo)
             else:
                 display_board_colored(game.board)
+            if game.move_history[-1][1] == ai_symbol:
+                show_profile(ai)
 
         # Record game for stats
-        if auto_save and score_tracker:
-            ai_name = ai.name
-            score_tracker.record_game(
-                player_name, ai_name,
-                game.winner, game.move_count, "PvAI"
+        if auto_save:
+            names = {player_symbol: player_name, ai_symbol: ai.name}
+            (score_tracker or get_score_tracker()).record_game(
+                names['X'], names['O'],
+                names[game.winner] if game.winner else None,
+                game.move_count, "PvAI",
+                [pos for pos, _ in game.move_history]
             )
 
         if game.winner == player_symbol:
             print(colored(f"  🎉 Congratulations, {player_name}! You WIN! 🎉",
                          Fore.GREEN + Style.BRIGHT))
-            if diff in ('3', '4'):
+            if diff in ('3', '4', '5'):
                 print(colored("  (Wait... that shouldn't be possible! 🤔)",
                              Fore.YELLOW))
         elif game.winner == ai_symbol:
@@ -236,9 +306,13 @@ def play_pvai(score_tracker):
 
 def play_ai_vs_ai():
     """Watch two AIs play against each other."""
+    from game import TicTacToe
+    from settings import get_settings
+
     game = TicTacToe()
-    settings = load_settings()
+    settings = get_settings()
     sound_enabled = settings.get("sound_enabled", False)
+    ai_delay = settings.get("ai_thinking_delay", True)
 
     print(colored("\n  👁️  AI vs AI — Watch Mode", Fore.GREEN + Style.BRIGHT))
     print(colored("  ──────────────────────────\n", Fore.GREEN))
@@ -248,6 +322,8 @@ def play_ai_vs_ai():
     print(colored("    2. 🟡 Medium", Fore.YELLOW))
     print(colored("    3. 🔴 Hard", Fore.RED))
     print(colored("    4. 🟣 Impossible", Fore.MAGENTA))
+    print(colored("    5. 🔵 Master", Fore.BLUE))
+    print(colored("    6. 🟠 MCTS", Fore.YELLOW))
     ai_x_choice = input(colored("\n  Choice [3]: ", Fore.YELLOW)).strip()
 
     print(colored("\n  Select AI for O:", Fore.MAGENTA))
@@ -255,18 +331,12 @@ def play_ai_vs_ai():
     print(colored("    2. 🟡 Medium", Fore.YELLOW))
     print(colored("    3. 🔴 Hard", Fore.RED))
     print(colored("    4. 🟣 Impossible", Fore.MAGENTA))
+    print(colored("    5. 🔵 Master", Fore.BLUE))
+    print(colored("    6. 🟠 MCTS", Fore.YELLOW))
     ai_o_choice = input(colored("\n  Choice [3]: ", Fore.YELLOW)).strip()
 
-    ai_map = {
-        '1': lambda s: EasyAI(s),
-        '2': lambda s: MediumAI(s),
-        '3': lambda s: HardAI(s),
-        '4': lambda s: ImpossibleAI(s),
-        '': lambda s: HardAI(s),
-    }
-
-    ai_x = ai_map.get(ai_x_choice, lambda s: HardAI(s))('X')
-    ai_o = ai_map.get(ai_o_choice, lambda s: HardAI(s))('O')
+    ai_x = setup_ai(make_ai(AI_CHOICES.get(ai_x_choice, "HardAI"), 'X'))
+    ai_o = setup_ai(make_ai(AI_CHOICES.get(ai_o_choice, "HardAI"), 'O'))
 
     print(colored(f"\n  X: {ai_x.name}  vs  O: {ai_o.name}", Fore.WHITE))
     print(colored("  Watch the AIs battle it out!\n", Fore.YELLOW))
@@ -279,7 +349,8 @@ def play_ai_vs_ai():
 
         print(colored(f"  🤖 {current_ai.name} ({game.current_player}) thinking...",
                      Fore.YELLOW))
-        time.sleep(0.8)
+        if ai_delay:
+            time.sleep(0.8)
 
         move = current_ai.get_move(game)
         game.make_move(move)
@@ -292,6 +363,7 @@ def play_ai_vs_ai():
             display_board_colored(game.board, winning_combo)
         else:
             display_board_colored(game.board)
+        show_profile(current_ai)
 
     if game.winner:
         winner_ai = ai_x if game.winner == 'X' else ai_o
@@ -386,10 +458,25 @@ def display_how_to_play():
     input(colored("    Press Enter to return to menu...", Fore.YELLOW))
 
 
-def main():
+def main(argv=None):
     """Main application entry point."""
-    score_tracker = ScoreTracker()
-
+    global PROFILE_OUTPUT
+    parser = argparse.ArgumentParser(description="Tic Tac Toe")
+    parser.add_argument("--profile", nargs="?", const="search_profile.json",
+                        metavar="PATH",
+                        help="Record AI search statistics and save them as "
+                             "JSON on exit (default: search_profile.json)")
+    args = parser.parse_args(argv)
+    PROFILE_OUTPUT = args.profile
+
+    try:
+        run_menu()
+    finally:
+        save_profiles()
+
+
+def run_menu():
+    """Show the main menu until the player quits."""
     while True:
         display_title()
         display_menu()
@@ -397,18 +484,18 @@ def main():
         choice = input(colored("    Enter choice (0-9): ", Fore.YELLOW)).strip()
 
         if choice == '1':
-            play_pvp(score_tracker)
+            play_pvp()
         elif choice == '2':
-            play_pvai(score_tracker)
+            play_pvai()
         elif choice == '3':
             play_ai_vs_ai()
         elif choice == '4':
-            score_tracker.display_leaderboard()
+            get_score_tracker().display_leaderboard()
             input(colored("\n  Press Enter to continue...", Fore.YELLOW))
         elif choice == '5':
             name = input(colored("\n  Enter player name: ", Fore.CYAN)).strip()
             if name:
-                score_tracker.display_player_stats(name)
+                get_score_tracker().display_player_stats(name)
             input(colored("  Press Enter to continue...", Fore.YELLOW))
         elif choice == '6':
             try:
@@ -431,6 +518,7 @@ def main():
         elif choice == '8':
             display_how_to_play()
         elif choice == '9':
+            from settings import display_settings
             display_settings()
         elif choice == '0':
             print(colored("\n    👋 Thanks for playing Tic Tac Toe!", Fore.CYAN))
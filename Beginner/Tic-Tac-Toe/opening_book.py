@@ -0,0 +1,263 @@
+"""
+Precomputed perfect-play table for Tic Tac Toe.
+
+The whole game tree is solved once (``python opening_book.py``) and written
+to ``opening_book.bin``. Every board is indexed by its base-3 encoding
+(empty=0, X=1, O=2, position ``p`` weighted ``3 ** (p - 1)``), so a lookup
+is a single fixed-size record read from the memory-mapped file.
+
+File layout (little-endian):
+    header:  magic b'TTTB', version (u16), entry count (u32), CRC-32 (u32)
+    records: best-move bitmask (u16), score (i8) — one per board index
+
+Scores use the search AIs' convention from the side to move's point of
+view: ``10`` for a win this move, one less per extra ply, ``0`` for a
+draw. Unreachable and finished boards have an empty move mask.
+"""
+
+import mmap
+import os
+import struct
+import zlib
+
+BOOK_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         "opening_book.bin")
+
+MAGIC = b'TTTB'
+VERSION = 1
+NUM_ENTRIES = 3 ** 9
+
+HEADER = struct.Struct('<4sHII')
+RECORD = struct.Struct('<Hb')
+
+WIN_COMBINATIONS = (
+    (1, 2, 3), (4, 5, 6), (7, 8, 9),
+    (1, 4, 7), (2, 5, 8), (3, 6, 9),
+    (1, 5, 9), (3, 5, 7),
+)
+
+_WEIGHTS = tuple(3 ** (pos - 1) for pos in range(1, 10))
+_MARK_DIGITS = {'X': 1, 'O': 2}
+
+# _TERNARY[mask]: base-3 index of the X marks in a 9-bit mask
+_TERNARY = tuple(sum(_WEIGHTS[cell] for cell in range(9) if mask >> cell & 1)
+                 for mask in range(1 << 9))
+
+
+def board_index(board):
+    """Return the base-3 index of a ``{1..9: mark}`` board."""
+    index = 0
+    for pos in range(1, 10):
+        digit = _MARK_DIGITS.get(board[pos])
+        if digit:
+            index += digit * _WEIGHTS[pos - 1]
+    return index
+
+
+def side_to_move(board):
+    """Return 'X' or 'O' for a legal mid-game board, else None."""
+    marks = [board[pos] for pos in range(1, 10)]
+    x_count = marks.count('X')
+    o_count = marks.count('O')
+    if x_count == o_count:
+        return 'X'
+    if x_count == o_count + 1:
+        return 'O'
+    return None
+
+
+def _has_won(cells, player):
+    return any(all(cells[pos - 1] == player for pos in combo)
+               for combo in WIN_COMBINATIONS)
+
+
+def solve_game_tree():
+    """
+    Solve every reachable position.
+
+    Returns ``{index: (best_move_mask, score)}`` for each position where
+    the side to move still has a move to make.
+    """
+    solved = {}
+
+    def solve(cells, player, index):
+        if index in solved:
+            return solved[index][1]
+
+        opponent = 'O' if player == 'X' else 'X'
+        best_score = None
+        best_mask = 0
+        for pos in range(1, 10):
+            if cells[pos - 1] != ' ':
+                continue
+            cells[pos - 1] = player
+            child = index + _MARK_DIGITS[player] * _WEIGHTS[pos - 1]
+            if _has_won(cells, player):
+                score = 10
+            elif ' ' not in cells:
+                score = 0
+            else:
+                reply = solve(cells, opponent, child)
+                # Step the opponent's score one ply further away
+                if reply > 0:
+                    score = -(reply - 1)
+                elif reply < 0:
+                    score = -(reply + 1)
+                else:
+                    score = 0
+            cells[pos - 1] = ' '
+
+            if best_score is None or score > best_score:
+                best_score = score
+                best_mask = 1 << (pos - 1)
+            elif score == best_score:
+                best_mask |= 1 << (pos - 1)
+
+        solved[index] = (best_mask, best_score)
+        return best_score
+
+    solve([' '] * 9, 'X', 0)
+    return solved
+
+
+def _book_body():
+    """
+    Return the packed records of the solved game.
+
+    Uses the vectorized solver when NumPy is available, otherwise the
+    recursive one; both produce the same bytes.
+    """
+    try:
+        from solver import book_body
+    except ImportError:
+        pass
+    else:
+        return book_body()
+
+    body = bytearray(RECORD.size * NUM_ENTRIES)
+    for index, (mask, score) in solve_game_tree().items():
+        RECORD.pack_into(body, index * RECORD.size, mask, score)
+    return bytes(body)
+
+
+def _count_positions(body):
+    return sum(1 for mask, _ in RECORD.iter_unpack(body) if mask)
+
+
+def build_book(path=BOOK_FILE):
+    """Solve the game and write the binary table to ``path``."""
+    body = _book_body()
+    header = HEADER.pack(MAGIC, VERSION, NUM_ENTRIES, zlib.crc32(body))
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(body)
+    os.replace(tmp_path, path)
+    return _count_positions(body)
+
+
+class OpeningBook:
+    """
+    Read-only view of the solved table: ``opening_book.bin`` mapped into
+    memory, or the same bytes solved in memory.
+    """
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+
+    @classmethod
+    def load(cls, path=BOOK_FILE):
+        """
+        Map the book file into memory.
+
+        Returns None when the file is missing, truncated, or fails its
+        header or checksum validation.
+        """
+        try:
+            with open(path, 'rb') as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        expected_size = HEADER.size + RECORD.size * NUM_ENTRIES
+        if len(buffer) != expected_size:
+            buffer.close()
+            return None
+
+        magic, version, count, crc = HEADER.unpack_from(buffer, 0)
+        body = memoryview(buffer)[HEADER.size:]
+        valid = (magic == MAGIC and version == VERSION and
+                 count == NUM_ENTRIES and zlib.crc32(body) == crc)
+        body.release()
+        if not valid:
+            buffer.close()
+            return None
+        return cls(buffer)
+
+    @classmethod
+    def solve(cls):
+        """
+        Build the book in memory with the vectorized solver.
+
+        Returns None when NumPy is not installed.
+        """
+        try:
+            from solver import book_body
+        except ImportError:
+            return None
+        body = book_body()
+        return cls(HEADER.pack(MAGIC, VERSION, NUM_ENTRIES, zlib.crc32(body)) + body)
+
+    def lookup(self, board):
+        """Return ``(best_move_mask, score)`` for a board."""
+        return self.lookup_index(board_index(board))
+
+    def lookup_index(self, index):
+        """Return ``(best_move_mask, score)`` for a base-3 board index."""
+        return RECORD.unpack_from(self._buffer, HEADER.size + index * RECORD.size)
+
+    def best_moves(self, game, symbol):
+        """
+        Return the optimal positions for ``symbol``, lowest first.
+
+        Returns None when the book cannot answer: the board is not a legal
+        3x3 position, it is not ``symbol``'s turn, or the game is finished.
+        """
+        bits = getattr(game, "bits", None)
+        if bits is not None and game.num_cells == 9:
+            # Bitboards give the index and side to move without a board scan
+            x_bits, o_bits = bits['X'], bits['O']
+            lead = bin(x_bits).count('1') - bin(o_bits).count('1')
+            if lead != (1 if symbol == 'O' else 0):
+                return None
+            mask, _ = self.lookup_index(_TERNARY[x_bits] + 2 * _TERNARY[o_bits])
+        else:
+            if len(game.board) != 9 or side_to_move(game.board) != symbol:
+                return None
+            mask, _ = self.lookup(game.board)
+        if not mask:
+            return None
+        return [pos for pos in range(1, 10) if mask >> (pos - 1) & 1]
+
+
+_book = None
+_book_loaded = False
+
+
+def get_opening_book():
+    """
+    Return the shared OpeningBook, loading it on first use.
+
+    Without a valid book file the game is solved in memory instead (needs
+    NumPy); returns None when neither works.
+    """
+    global _book, _book_loaded
+    if not _book_loaded:
+        _book = OpeningBook.load() or OpeningBook.solve()
+        _book_loaded = True
+    return _book
+
+
+if __name__ == "__main__":
+    positions = build_book()
+    print(f"Wrote {BOOK_FILE} ({positions} positions solved)")
@@ -0,0 +1,232 @@
+"""
+Replay and analysis of recorded games.
+
+Games recorded with their move sequence carry it in the ``seq`` field of
+their log record, one hex digit per move (0-based cell) on boards of up
+to 16 cells and two digits per move on larger boards. Player 1 of such a
+record played X.
+
+Analysis re-runs each classic 3x3 game and rates every move against the
+solved values in the opening book, so no search runs per move:
+
+    python replay.py                  # blunder summary of all stored games
+    python replay.py --player Alice   # only games Alice played
+    python replay.py --game 42        # annotated replay of game #42
+"""
+
+import argparse
+import json
+import sys
+
+from game import BitboardTicTacToe
+from opening_book import get_opening_book
+
+_WEIGHTS = tuple(3 ** (pos - 1) for pos in range(1, 10))
+_MARK_DIGITS = {'X': 1, 'O': 2}
+
+
+def encode_moves(moves, num_cells=9):
+    """Encode a sequence of 1-based positions as a compact hex string."""
+    width = 1 if num_cells <= 16 else 2
+    return ''.join(format(pos - 1, f'0{width}x') for pos in moves)
+
+
+def decode_moves(seq, num_cells=9):
+    """Decode a string from encode_moves back to a list of positions."""
+    width = 1 if num_cells <= 16 else 2
+    return [int(seq[i:i + width], 16) + 1 for i in range(0, len(seq), width)]
+
+
+def _from_reply(score):
+    """Turn the opponent's score into ours, one ply further away."""
+    if score > 0:
+        return -(score - 1)
+    if score < 0:
+        return -(score + 1)
+    return 0
+
+
+def _outcome(score):
+    return (score > 0) - (score < 0)
+
+
+def analyze_moves(moves, book):
+    """
+    Annotate each move of a 3x3 game with its game-theoretic value.
+
+    Values use the book's convention from the mover's point of view
+    (``10`` wins at once, one less per extra ply, ``0`` draws, negative
+    loses). A move is a blunder when it worsens the outcome: a win thrown
+    away, or a drawn position turned into a loss. Raises ValueError for
+    an illegal sequence.
+    """
+    game = BitboardTicTacToe()
+    index = 0
+    annotations = []
+    for ply, move in enumerate(moves, 1):
+        player = game.current_player
+        mask, best = book.lookup_index(index)
+        if not game.make_move(move):
+            raise ValueError(f"Illegal move {move} at ply {ply}")
+        index += _MARK_DIGITS[player] * _WEIGHTS[move - 1]
+
+        if game.winner:
+            value = 10
+        elif game.game_over:
+            value = 0
+        else:
+            value = _from_reply(book.lookup_index(index)[1])
+
+        annotations.append({
+            "ply": ply,
+            "player": player,
+            "move": move,
+            "value": value,
+            "best": best,
+            "best_moves": [pos for pos in range(1, 10) if mask >> (pos - 1) & 1],
+            "blunder": _outcome(value) < _outcome(best),
+        })
+    return annotations
+
+
+def analyze_records(records, book=None, player=None):
+    """
+    Analyze every replayable game in an iterable of log records.
+
+    Only 3x3 games with a recorded ``seq`` can be analyzed; others are
+    counted as skipped. Identical move sequences (common in AI-vs-AI
+    simulations) are analyzed once. With ``player`` set, only that
+    player's games are included. Returns a report dict.
+    """
+    book = book or get_opening_book()
+    if book is None:
+        raise FileNotFoundError(
+            "opening_book.bin is missing or invalid; run python opening_book.py")
+
+    cache = {}
+    report = {
+        "games": 0,
+        "skipped": 0,
+        "invalid": 0,
+        "moves": 0,
+        "blunders": 0,
+        "players": {},
+        "blunder_moves": [],
+    }
+    for record in records:
+        names = {'X': record.get("player1"), 'O': record.get("player2")}
+        if player is not None and player not in names.values():
+            continue
+        seq = record.get("seq")
+        if seq is None or record.get("size", 3) != 3:
+            report["skipped"] += 1
+            continue
+
+        annotations = cache.get(seq)
+        if annotations is None:
+            try:
+                annotations = analyze_moves(decode_moves(seq), book)
+            except ValueError:
+                report["invalid"] += 1
+                continue
+            cache[seq] = annotations
+
+        report["games"] += 1
+        report["moves"] += len(annotations)
+        for note in annotations:
+            name = names[note["player"]]
+            counts = report["players"].setdefault(name, {"moves": 0, "blunders": 0})
+            counts["moves"] += 1
+            if note["blunder"]:
+                counts["blunders"] += 1
+                report["blunders"] += 1
+                report["blunder_moves"].append({"game": record.get("id"),
+                                                "name": name, **note})
+    return report
+
+
+def _describe(score):
+    if score > 0:
+        return f"win in {10 - score + 1}"
+    if score < 0:
+        return f"loss in {10 + score + 1}"
+    return "draw"
+
+
+def print_game(record, book=None):
+    """Print an annotated move-by-move replay of one 3x3 game record."""
+    book = book or get_opening_book()
+    moves = decode_moves(record["seq"])
+    names = {'X': record["player1"], 'O': record["player2"]}
+    game = BitboardTicTacToe()
+
+    print(f"\n  Game #{record.get('id')}: {names['X']} (X) vs {names['O']} (O)\n")
+    for note in analyze_moves(moves, book):
+        game.make_move(note["move"])
+        flag = "  ?? blunder" if note["blunder"] else ""
+        best = ", ".join(map(str, note["best_moves"]))
+        print(f"  {note['ply']}. {note['player']} -> {note['move']}   "
+              f"{_describe(note['value'])} (best: {_describe(note['best'])} "
+              f"with {best}){flag}")
+    print()
+    for line in str(game).splitlines():
+        print(f"    {line}")
+    print()
+
+
+def print_report(report, show=10):
+    """Print a blunder summary."""
+    print(f"\n  {report['games']} games analyzed, {report['moves']} moves, "
+          f"{report['blunders']} blunders")
+    if report["skipped"] or report["invalid"]:
+        print(f"  ({report['skipped']} without a replayable 3x3 sequence, "
+              f"{report['invalid']} invalid)")
+    print()
+    ranked = sorted(report["players"].items(),
+                    key=lambda item: -item[1]["blunders"] / item[1]["moves"])
+    for name, counts in ranked:
+        rate = counts["blunders"] / counts["moves"]
+        print(f"  {name:<30} {counts['blunders']:>6} / {counts['moves']:<7} "
+              f"moves ({rate:.1%})")
+    if show and report["blunder_moves"]:
+        print("\n  Latest blunders:")
+        for note in report["blunder_moves"][-show:]:
+            best = ", ".join(map(str, note["best_moves"]))
+            print(f"    game #{note['game']}, move {note['ply']}: {note['name']} "
+                  f"played {note['move']} ({_describe(note['value'])}), "
+                  f"best {best} ({_describe(note['best'])})")
+    print()
+
+
+def main(argv=None):
+    from scores import GAMES_LOG_FILE, iter_games
+
+    parser = argparse.ArgumentParser(description="Replay and analyze stored games.")
+    parser.add_argument("--log", default=GAMES_LOG_FILE, help="Game log to read")
+    parser.add_argument("--player", help="Only analyze this player's games")
+    parser.add_argument("--game", type=int, help="Print an annotated replay of one game")
+    parser.add_argument("--show", type=int, default=10,
+                        help="How many blunders to list (default: 10)")
+    parser.add_argument("--json", action="store_true",
+                        help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    if args.game is not None:
+        for record in iter_games(args.log):
+            if record.get("id") == args.game:
+                if record.get("seq") is None or record.get("size", 3) != 3:
+                    parser.error(f"Game #{args.game} has no replayable 3x3 sequence")
+                print_game(record)
+                return 0
+        parser.error(f"No game #{args.game} in the log")
+
+    report = analyze_records(iter_games(args.log), player=args.player)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, args.show)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,35 +1,167 @@
 """Score tracking and game statistics."""
 
 import json
+import os
 from datetime import datetime
 
 from display import colored, Fore, Style
+from leaderboard import Leaderboard
+from replay import encode_moves
 
 STATS_FILE = "game_stats.json"
+GAMES_LOG_FILE = "game_log.jsonl"
+
+# Rewrite the aggregate snapshot after this many newly logged games
+SNAPSHOT_INTERVAL = 100
+
+
+def iter_games(log_file=GAMES_LOG_FILE):
+    """
+    Yield every game in a log, oldest first, without loading a tracker.
+
+    Only reads the log: no snapshot is loaded and nothing is written, so
+    any log can be inspected. A partly written last line is skipped.
+    """
+    try:
+        f = open(log_file, 'rb')
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            if line.endswith(b'\n'):
+                yield json.loads(line)
 
 
 class ScoreTracker:
-    """Track and persist game statistics."""
+    """
+    Track and persist game statistics.
+
+    Each completed game is appended to a JSON-lines log as one compact
+    record, so recording costs the same however long the history is.
+    Player aggregates live in a small snapshot (STATS_FILE) that also notes
+    how far into the log it reaches. The snapshot is rewritten atomically
+    every SNAPSHOT_INTERVAL games, and startup replays only the log records
+    written after it.
 
-    def __init__(self):
+    Rankings and the per-day buckets for time-windowed stats are kept in
+    ``self.leaderboard`` and updated as each game is applied.
+    """
+
+    def __init__(self, stats_file=None, log_file=None):
+        self.stats_file = stats_file or STATS_FILE
+        self.log_file = log_file or GAMES_LOG_FILE
+        self._unsaved = 0   # Logged games not yet folded into the snapshot
         self.stats = self.load_stats()
 
     def load_stats(self):
-        """Load stats from JSON file."""
+        """Load the aggregate snapshot and replay any newer log records."""
         try:
-            with open(STATS_FILE, 'r') as f:
-                return json.load(f)
+            with open(self.stats_file, 'r') as f:
+                self.stats = json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
-            return {
-                "players": {},
-                "games": [],
-                "total_games": 0,
-            }
+            self.stats = {}
+        self.stats.setdefault("players", {})
+        self.stats.setdefault("total_games", 0)
+        self.stats.setdefault("log_offset", 0)
+        missing_days = "daily" not in self.stats
+        self.stats.setdefault("daily", {})
+        self.leaderboard = Leaderboard(self.stats["players"], self.stats["daily"])
+
+        # Older versions kept every game inside the snapshot
+        legacy_games = self.stats.pop("games", None)
+        if legacy_games is not None:
+            if self._log_size() == 0:
+                self._append_records(legacy_games)
+            self._index_days(self._log_size())
+            self.save_stats()
+        else:
+            if missing_days:
+                self._index_days(self.stats["log_offset"])
+            self._replay_log()
+        return self.stats
 
     def save_stats(self):
-        """Save stats to JSON file."""
-        with open(STATS_FILE, 'w') as f:
+        """Fold the logged games into a new snapshot, written atomically."""
+        self.leaderboard.prune_days()
+        self.stats["log_offset"] = self._log_size()
+        tmp_file = self.stats_file + ".tmp"
+        with open(tmp_file, 'w') as f:
             json.dump(self.stats, f, indent=2)
+        os.replace(tmp_file, self.stats_file)
+        self._unsaved = 0
+
+    def iter_games(self):
+        """Yield every recorded game, oldest first, streamed from the log."""
+        return iter_games(self.log_file)
+
+    def _log_size(self):
+        try:
+            return os.path.getsize(self.log_file)
+        except OSError:
+            return 0
+
+    def _append_records(self, records):
+        """Append game records to the log, one compact JSON line each."""
+        data = ''.join(json.dumps(r, separators=(',', ':')) + '\n'
+                       for r in records)
+        with open(self.log_file, 'ab') as f:
+            f.write(data.encode('utf-8'))
+
+    def _index_days(self, upto):
+        """Fill the per-day buckets from the first ``upto`` bytes of the log."""
+        try:
+            with open(self.log_file, 'rb') as f:
+                data = f.read(upto)
+        except FileNotFoundError:
+            return
+        for line in data.splitlines():
+            try:
+                self._count_day(json.loads(line))
+            except (json.JSONDecodeError, KeyError):
+                continue
+        self.leaderboard.prune_days()
+
+    def _count_day(self, record):
+        """Add a game to the per-day buckets used for windowed stats."""
+        day = record["timestamp"][:10]
+        winner = record["winner"]
+        for player in (record["player1"], record["player2"]):
+            if not winner:
+                outcome = 2
+            elif player == winner:
+                outcome = 0
+            else:
+                outcome = 1
+            self.leaderboard.record_day(day, player, outcome)
+
+    def _replay_log(self):
+        """Apply the log records written after the snapshot."""
+        offset = self.stats["log_offset"]
+        size = self._log_size()
+        if offset > size:
+            # The log was replaced or truncated; trust the snapshot
+            self.stats["log_offset"] = size
+            return
+        if offset == size:
+            return
+
+        with open(self.log_file, 'rb') as f:
+            f.seek(offset)
+            tail = f.read()
+
+        # Drop a partial last line left by a crash mid-append
+        complete = tail.rfind(b'\n') + 1
+        if complete < len(tail):
+            with open(self.log_file, 'r+b') as f:
+                f.truncate(offset + complete)
+
+        for line in tail[:complete].splitlines():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            self._apply_record(record)
+            self._unsaved += 1
 
     def get_player_stats(self, player_name):
         """Get or create stats for a player."""
@@ -43,22 +175,74 @@ class ScoreTracker:
                 "best_streak": 0,
                 "created_at": str(datetime.now()),
             }
+            self.leaderboard.update(player_name, self.stats["players"][player_name])
         return self.stats["players"][player_name]
 
-    def record_game(self, player1, player2, winner, moves, mode):
-        """Record a completed game."""
-        self.stats["total_games"] += 1
+    def record_game(self, player1, player2, winner, moves, mode,
+                    sequence=None, size=3):
+        """
+        Record a completed game.
+
+        ``sequence`` optionally lists the positions played, in order, so
+        the game can be replayed (see replay.py); player1 must then be the
+        X player. ``size`` is the board width.
+        """
+        self.record_games([(player1, player2, winner, moves, mode,
+                            sequence, size)])
+
+    def record_games(self, games):
+        """
+        Record many completed games with a single log append.
 
-        game_record = {
-            "id": self.stats["total_games"],
-            "player1": player1,
-            "player2": player2,
-            "winner": winner,
-            "moves": moves,
-            "mode": mode,
-            "timestamp": str(datetime.now()),
-        }
-        self.stats["games"].append(game_record)
+        ``games`` is an iterable of ``(player1, player2, winner, moves,
+        mode[, sequence[, size]])`` tuples, in the same form as
+        record_game's arguments.
+        """
+        records = []
+        for player1, player2, winner, moves, mode, *extra in games:
+            sequence = extra[0] if extra else None
+            size = extra[1] if len(extra) > 1 else 3
+            record = {
+                "id": self.stats["total_games"] + 1,
+                "player1": player1,
+                "player2": player2,
+                "winner": winner,
+                "moves": moves,
+                "mode": mode,
+                "timestamp": str(datetime.now()),
+            }
+            if sequence is not None:
+                record["seq"] = (sequence if isinstance(sequence, str)
+                                 else encode_moves(sequence, size * size))
+                if size != 3:
+                    record["size"] = size
+            self._apply_record(record)
+            records.append(record)
+        if not records:
+            return
+
+        self._append_records(records)
+        self._unsaved += len(records)
+        if self._unsaved >= SNAPSHOT_INTERVAL:
+            self.save_stats()
+
+    def set_ratings(self, ratings):
+        """
+        Store rating tables and write the snapshot.
+
+        ``ratings`` maps a rating system to ``{player: rating}``, e.g. the
+        ``elo`` and ``glicko`` tables computed by tournament.py. Tables
+        replace any earlier table of the same system.
+        """
+        self.stats.setdefault("ratings", {}).update(ratings)
+        self.save_stats()
+
+    def _apply_record(self, record):
+        """Add one game record to the in-memory aggregates."""
+        self.stats["total_games"] += 1
+        player1 = record["player1"]
+        player2 = record["player2"]
+        winner = record["winner"]
 
         # Update player stats
         if winner:
@@ -76,6 +260,8 @@ class ScoreTracker:
             loser_stats["losses"] += 1
             loser_stats["total_games"] += 1
             loser_stats["win_streak"] = 0
+            self.leaderboard.update(winner, winner_stats)
+            self.leaderboard.update(loser, loser_stats)
         else:
             # Draw
             for player in [player1, player2]:
@@ -83,11 +269,12 @@ class ScoreTracker:
                 p_stats["draws"] += 1
                 p_stats["total_games"] += 1
                 p_stats["win_streak"] = 0
+                self.leaderboard.update(player, p_stats)
 
-        self.save_stats()
+        self._count_day(record)
 
-    def display_leaderboard(self):
-        """Display the leaderboard."""
+    def display_leaderboard(self, metric="wins", page=1, per_page=10):
+        """Display one page of the leaderboard ranked by ``metric``."""
         print(colored("\n  ╔══════════════════════════════════════════╗", Fore.CYAN))
         print(colored("  ║           🏆  LEADERBOARD  🏆            ║", Fore.CYAN))
         print(colored("  ╠══════════════════════════════════════════╣", Fore.CYAN))
@@ -97,19 +284,12 @@ class ScoreTracker:
             print(colored("  ╚══════════════════════════════════════════╝\n", Fore.CYAN))
             return
 
-        # Sort by wins
-        sorted_players = sorted(
-            self.stats["players"].items(),
-            key=lambda x: x[1]["wins"],
-            reverse=True
-        )
-
         print(colored("  ║ Rank │ Player         │ W  │ L  │ D  │ %  ║", Fore.YELLOW))
         print(colored("  ╟──────┼────────────────┼────┼────┼────┼────╢", Fore.WHITE))
 
         medals = ['🥇', '🥈', '🥉']
-        for i, (name, stats) in enumerate(sorted_players):
-            medal = medals[i] if i < 3 else f' {i+1}'
+        for rank, name, stats in self.leaderboard.page(metric, page, per_page):
+            medal = medals[rank - 1] if rank <= 3 else f'{rank:>2}'
             total = stats["total_games"]
             win_pct = (stats["wins"] / total * 100) if total > 0 else 0
 
@@ -137,4 +317,16 @@ class ScoreTracker:
         print(colored(f"  🔥 Current Streak: {stats['win_streak']}", Fore.MAGENTA))
         print(colored(f"  ⭐ Best Streak:    {stats['best_streak']}", Fore.MAGENTA))
         print(colored(f"  🎮 Total Games:    {total}", Fore.WHITE))
+        print(colored(f"  🏅 Rank:           #{self.leaderboard.rank(player_name)} "
+                      f"of {len(self.leaderboard)}", Fore.WHITE))
+        elo = self.stats.get("ratings", {}).get("elo", {}).get(player_name)
+        if elo is not None:
+            print(colored(f"  🎯 Elo:            {elo:.0f}", Fore.WHITE))
+
+        for days in (7, 30):
+            recent = self.leaderboard.window(days).get(player_name)
+            if recent:
+                print(colored(
+                    f"  📅 Last {days} days: {recent['wins']}W "
+                    f"{recent['losses']}L {recent['draws']}D", Fore.CYAN))
         print()
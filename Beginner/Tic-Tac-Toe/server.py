@@ -0,0 +1,345 @@
+"""
+Network play server: many concurrent matches against the AIs over TCP.
+
+Clients speak newline-delimited JSON, one match at a time per
+connection (a new match may start once the last one is over):
+
+    -> {"type": "new", "ai": "HardAI", "name": "Alice", "symbol": "X",
+        "size": 3, "win_length": 3}
+    <- {"type": "state", "board": "....X....", "turn": "X", ...}
+    -> {"type": "move", "position": 5}
+    <- {"type": "state", "board": "....X...O", "ai_move": 9, ...}
+
+Every reply is a ``state`` message (see Match.state) or an ``error``
+message with a ``message`` field. AI searches run in an executor, so a
+slow search never stalls the event loop. Finished matches are recorded
+through a ResultWriter, which batches them into bulk
+``ScoreTracker.record_games`` calls:
+
+    python server.py --port 8765 --workers 4
+    python server.py --processes           # searches in a process pool
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from ai import TranspositionTable
+from game import BitboardTicTacToe
+from simulate import check_board_size, resolve_ai
+
+HOST = "127.0.0.1"
+PORT = 8765
+MAX_SIZE = 15
+
+# Record finished matches once this many are waiting, or after FLUSH_INTERVAL s
+BATCH_SIZE = 200
+FLUSH_INTERVAL = 1.0
+
+_local = threading.local()
+
+
+def search_move(ai_name, symbol, size, win_length, moves):
+    """
+    Return ``ai_name``'s move for the game reached by ``moves``.
+
+    Runs inside an executor worker. Each worker thread (or process) keeps
+    its own AI instances and transposition table, since AIs are not safe
+    to share between threads.
+    """
+    ais = getattr(_local, "ais", None)
+    if ais is None:
+        ais = _local.ais = {}
+        _local.table = TranspositionTable()
+
+    ai = ais.get((ai_name, symbol))
+    if ai is None:
+        cls = resolve_ai(ai_name)
+        if ai_name in ("HardAI", "ImpossibleAI"):
+            ai = cls(symbol, table=_local.table)
+        else:
+            ai = cls(symbol)
+        ais[(ai_name, symbol)] = ai
+
+    game = BitboardTicTacToe(size, win_length)
+    for move in moves:
+        game.make_move(move)
+    return ai.get_move(game)
+
+
+class Match:
+    """One game between a connected player and an AI."""
+
+    def __init__(self, ai_name, player_name, symbol='X', size=3, win_length=None):
+        if symbol not in ('X', 'O'):
+            raise ValueError(f"Invalid symbol: {symbol!r}")
+        if not isinstance(size, int) or not 3 <= size <= MAX_SIZE:
+            raise ValueError(f"Board size must be 3..{MAX_SIZE}")
+        cls = resolve_ai(ai_name)
+        check_board_size(ai_name, size)
+
+        self.game = BitboardTicTacToe(size, win_length)
+        self.ai_name = ai_name
+        self.ai_display_name = cls('X').name
+        self.player_name = player_name
+        self.symbol = symbol
+        self.ai_symbol = 'O' if symbol == 'X' else 'X'
+
+    @property
+    def moves(self):
+        return [pos for pos, _ in self.game.move_history]
+
+    def state(self, ai_move=None):
+        """Return the ``state`` message for the current position."""
+        game = self.game
+        return {
+            "type": "state",
+            "board": ''.join(game.board[pos] if game.board[pos] != ' ' else '.'
+                             for pos in range(1, game.num_cells + 1)),
+            "turn": None if game.game_over else game.current_player,
+            "ai_move": ai_move,
+            "over": game.game_over,
+            "winner": game.winner,
+        }
+
+    def result(self):
+        """Return the finished match as a ``record_games`` tuple."""
+        names = {self.symbol: self.player_name, self.ai_symbol: self.ai_display_name}
+        winner = self.game.winner
+        return (names['X'], names['O'], names[winner] if winner else None,
+                self.game.move_count, "Network", self.moves, self.game.size)
+
+
+class ResultWriter:
+    """
+    Batches finished matches into bulk ScoreTracker writes.
+
+    add() only queues a result; a background task records the queue with
+    one ``record_games`` call (run in a thread) once BATCH_SIZE results are
+    waiting or FLUSH_INTERVAL seconds have passed, so the event loop never
+    waits on file I/O per match.
+    """
+
+    def __init__(self, tracker, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.tracker = tracker
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.recorded = 0
+        self.batches = 0
+        self._pending = []
+        self._wake = asyncio.Event()
+        self._closed = False
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    def add(self, result):
+        """Queue one ``record_games`` tuple."""
+        self._pending.append(result)
+        if len(self._pending) >= self.batch_size:
+            self._wake.set()
+
+    async def _run(self):
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    async def flush(self):
+        """Record everything queued so far."""
+        self._wake.clear()
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        await asyncio.to_thread(self.tracker.record_games, batch)
+        self.recorded += len(batch)
+        self.batches += 1
+
+    async def close(self):
+        """Record the remaining results and write the stats snapshot."""
+        self._closed = True
+        self._wake.set()
+        if self._task is not None:
+            await self._task
+        await self.flush()
+        await asyncio.to_thread(self.tracker.save_stats)
+
+
+class GameServer:
+    """
+    Hosts matches for every connection on one event loop.
+
+    ``executor`` runs the AI searches (a thread pool by default); a
+    ProcessPoolExecutor spreads them across CPUs. ``tracker`` is an
+    optional ScoreTracker for the results.
+    """
+
+    def __init__(self, executor=None, tracker=None, batch_size=BATCH_SIZE,
+                 flush_interval=FLUSH_INTERVAL):
+        self.executor = executor or ThreadPoolExecutor()
+        self.writer = (ResultWriter(tracker, batch_size, flush_interval)
+                       if tracker is not None else None)
+        self.connections = 0
+        self.matches_started = 0
+        self.matches_finished = 0
+        self._server = None
+        self._handlers = set()
+
+    async def start(self, host=HOST, port=PORT):
+        """Start listening; returns the bound port."""
+        if self.writer is not None:
+            self.writer.start()
+        self._server = await asyncio.start_server(self.handle, host, port,
+                                                  backlog=1024)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Stop accepting connections, end open ones and flush recorded results."""
+        if self._server is not None:
+            self._server.close()
+            for task in self._handlers:
+                task.cancel()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self._server.wait_closed()
+        if self.writer is not None:
+            await self.writer.close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def handle(self, reader, writer):
+        """Serve one connection until the client disconnects."""
+        self.connections += 1
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        match = None
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    # Longer than the stream limit; the stream can't be
+                    # split into messages any more, so give up on it
+                    await self._send(writer, {"type": "error",
+                                              "message": "Message too long"})
+                    break
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                    match, reply = await self.dispatch(match, message)
+                except (ValueError, TypeError, KeyError) as e:
+                    reply = {"type": "error", "message": str(e)}
+                await self._send(writer, reply)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            # Only close() cancels handlers; ending normally keeps asyncio's
+            # stream callback from logging the cancellation
+            pass
+        finally:
+            self._handlers.discard(task)
+            self.connections -= 1
+            writer.close()
+
+    @staticmethod
+    async def _send(writer, reply):
+        writer.write(json.dumps(reply, separators=(',', ':')).encode() + b'\n')
+        await writer.drain()
+
+    async def dispatch(self, match, message):
+        """Apply one client message; returns ``(match, reply)``."""
+        kind = message["type"]
+        if kind == "new":
+            if match is not None and not match.game.game_over:
+                raise ValueError("A match is already in progress")
+            match = Match(message.get("ai", "HardAI"),
+                          str(message.get("name", "Guest")),
+                          message.get("symbol", 'X'),
+                          message.get("size", 3),
+                          message.get("win_length"))
+            self.matches_started += 1
+            ai_move = None
+            if match.ai_symbol == 'X':
+                ai_move = await self._ai_move(match)
+            return match, match.state(ai_move)
+
+        if kind == "move":
+            if match is None or match.game.game_over:
+                raise ValueError("No match in progress")
+            position = message["position"]
+            # bool is an int subclass, so check the exact type
+            if type(position) is not int or not match.game.make_move(position):
+                raise ValueError(f"Illegal move: {position!r}")
+            ai_move = None
+            if not match.game.game_over:
+                ai_move = await self._ai_move(match)
+            self._finish(match)
+            return match, match.state(ai_move)
+
+        raise ValueError(f"Unknown message type: {kind!r}")
+
+    async def _ai_move(self, match):
+        game = match.game
+        loop = asyncio.get_running_loop()
+        move = await loop.run_in_executor(
+            self.executor, search_move, match.ai_name, match.ai_symbol,
+            game.size, game.win_length, match.moves)
+        game.make_move(move)
+        return move
+
+    def _finish(self, match):
+        if not match.game.game_over:
+            return
+        self.matches_finished += 1
+        if self.writer is not None:
+            self.writer.add(match.result())
+
+
+async def serve(host=HOST, port=PORT, executor=None, tracker=None):
+    server = GameServer(executor, tracker)
+    port = await server.start(host, port)
+    print(f"Serving Tic Tac Toe on {host}:{port}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tic Tac Toe network server.")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="AI search workers (default: CPU count)")
+    parser.add_argument("--processes", action="store_true",
+                        help="Run AI searches in a process pool")
+    parser.add_argument("--no-record", action="store_true",
+                        help="Don't record results in the stats file")
+    args = parser.parse_args(argv)
+
+    workers = args.workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor if args.processes else ThreadPoolExecutor
+    tracker = None
+    if not args.no_record:
+        from scores import ScoreTracker
+        tracker = ScoreTracker()
+
+    try:
+        asyncio.run(serve(args.host, args.port, pool(workers), tracker))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,7 @@
 """Settings management for the game."""
 
 import json
+import os
 import time
 
 from display import clear_screen, colored, Fore, Style
@@ -19,25 +20,138 @@ DEFAULT_SETTINGS = {
 }
 
 
+class SettingsStore:
+    """
+    In-memory settings shared by the CLI and both GUIs.
+
+    The file is parsed once and reads are served from memory. Each read
+    checks the file's mtime, so edits made by another process (or another
+    front end) are picked up. Changes mark the store dirty, and save()
+    writes atomically only when something actually changed.
+    """
+
+    def __init__(self, path=None):
+        self._path = path
+        self._data = None
+        self._loaded_from = None
+        self._mtime = None
+        self._dirty = False
+        self.version = 0   # Bumped whenever the values may have changed
+
+    @property
+    def path(self):
+        return self._path or SETTINGS_FILE
+
+    def _file_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _current(self):
+        """Return the settings dict, reloading it if the file changed."""
+        path = self.path
+        if self._data is None or self._loaded_from != path:
+            self.reload()
+        elif not self._dirty and self._file_mtime() != self._mtime:
+            self.reload()
+        return self._data
+
+    def reload(self):
+        """Re-read the file, dropping unsaved changes."""
+        path = self.path
+        mtime = self._file_mtime()
+        try:
+            with open(path, 'r') as f:
+                saved = json.load(f)
+            data = {**DEFAULT_SETTINGS, **saved}
+        except (OSError, ValueError):
+            data = dict(DEFAULT_SETTINGS)
+        self._data = data
+        self._loaded_from = path
+        self._mtime = mtime
+        self._dirty = False
+        self.version += 1
+
+    def current_version(self):
+        """Return ``version`` after picking up any change to the file."""
+        self._current()
+        return self.version
+
+    def get(self, key, default=None):
+        return self._current().get(key, default)
+
+    def __getitem__(self, key):
+        return self._current()[key]
+
+    def __setitem__(self, key, value):
+        self.update({key: value})
+
+    def all(self):
+        """Return a copy of every setting."""
+        return dict(self._current())
+
+    def update(self, values):
+        """Change several settings; only real changes mark the store dirty."""
+        data = self._current()
+        for key, value in values.items():
+            if data.get(key) != value:
+                data[key] = value
+                self._dirty = True
+                self.version += 1
+
+    def reset(self):
+        """Restore the defaults (and forget any extra keys)."""
+        data = self._current()
+        if data != DEFAULT_SETTINGS:
+            data.clear()
+            data.update(DEFAULT_SETTINGS)
+            self._dirty = True
+            self.version += 1
+
+    @property
+    def dirty(self):
+        return self._dirty
+
+    def save(self):
+        """Write the settings if anything changed. Returns True if written."""
+        if not self._dirty:
+            return False
+        tmp_file = self.path + ".tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(self._data, f, indent=2)
+        os.replace(tmp_file, self.path)
+        self._mtime = self._file_mtime()
+        self._dirty = False
+        return True
+
+
+_store = None
+
+
+def get_settings():
+    """Return the shared SettingsStore."""
+    global _store
+    if _store is None:
+        _store = SettingsStore()
+    return _store
+
+
 def load_settings():
-    """Load settings from file."""
-    try:
-        with open(SETTINGS_FILE, 'r') as f:
-            saved = json.load(f)
-            return {**DEFAULT_SETTINGS, **saved}
-    except (FileNotFoundError, json.JSONDecodeError):
-        return dict(DEFAULT_SETTINGS)
+    """Return a copy of the current settings."""
+    return get_settings().all()
 
 
 def save_settings(settings):
-    """Save settings to file."""
-    with open(SETTINGS_FILE, 'w') as f:
-        json.dump(settings, f, indent=2)
+    """Save settings to file (only written if something changed)."""
+    store = get_settings()
+    store.update(settings)
+    store.save()
 
 
 def display_settings():
     """Display and modify game settings."""
-    settings = load_settings()
+    settings = get_settings()
 
     while True:
         clear_screen()
@@ -91,12 +205,11 @@ def display_settings():
         elif choice == '7':
             settings["auto_save_stats"] = not settings["auto_save_stats"]
         elif choice == '8':
-            settings.clear()
-            settings.update(DEFAULT_SETTINGS)
+            settings.reset()
             print(colored("    ✅ Settings reset to defaults.", Fore.GREEN))
             time.sleep(1)
         elif choice == '9':
-            save_settings(settings)
+            settings.save()
             break
 
-        save_settings(settings)
+        settings.save()
@@ -0,0 +1,223 @@
+"""
+Headless batch self-play between two AIs.
+
+Runs N games across a process pool without rendering or delays and
+reports win/draw/loss rates, throughput and per-move latency percentiles:
+
+    python simulate.py HardAI EasyAI -n 10000
+    python simulate.py MasterAI MediumAI -n 200 --size 4 --record
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from array import array
+from multiprocessing import Pool
+
+import ai as ai_module
+from game import BitboardTicTacToe
+from replay import encode_moves
+
+PERCENTILES = (50, 90, 99)
+
+# Minimax AIs only finish on the classic board
+LARGE_BOARD_AIS = ("EasyAI", "MediumAI", "MasterAI", "MCTSAI")
+
+
+def resolve_ai(name):
+    """Return the AI class called ``name`` from ai.py."""
+    cls = getattr(ai_module, name, None)
+    if not isinstance(cls, type) or not hasattr(cls, "get_move"):
+        raise ValueError(f"Unknown AI class: {name}")
+    return cls
+
+
+def check_board_size(name, size):
+    """Raise ValueError if the AI called ``name`` can't play a ``size`` board."""
+    if size > 3 and name not in LARGE_BOARD_AIS:
+        raise ValueError(f"{name} only plays 3x3; use one of "
+                         f"{', '.join(LARGE_BOARD_AIS)}")
+
+
+def _play_chunk(task):
+    """
+    Play one chunk of games in a worker process.
+
+    Returns the per-game ``(winner, moves, sequence)`` results, with the
+    sequence in replay.py's compact encoding, and the per-move latencies
+    (seconds) of each side as compact float arrays.
+    """
+    x_name, o_name, count, size, win_length, seed = task
+    if seed is not None:
+        random.seed(seed)
+
+    ai_x = resolve_ai(x_name)('X')
+    ai_o = resolve_ai(o_name)('O')
+    latencies = {'X': array('d'), 'O': array('d')}
+    results = []
+    clock = time.perf_counter
+
+    game = BitboardTicTacToe(size, win_length)
+    for _ in range(count):
+        game.reset()
+        while not game.game_over:
+            player = game.current_player
+            current_ai = ai_x if player == 'X' else ai_o
+            start = clock()
+            move = current_ai.get_move(game)
+            latencies[player].append(clock() - start)
+            game.make_move(move)
+        results.append((game.winner, game.move_count,
+                        encode_moves([pos for pos, _ in game.move_history],
+                                     game.num_cells)))
+
+    return results, latencies['X'].tobytes(), latencies['O'].tobytes()
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _latency_summary(values):
+    values = sorted(values)
+    summary = {f"p{pct}_ms": percentile(values, pct) * 1000 for pct in PERCENTILES}
+    summary["max_ms"] = values[-1] * 1000 if values else 0.0
+    summary["moves"] = len(values)
+    return summary
+
+
+def simulate(x_ai, o_ai, games, workers=None, size=3, win_length=None,
+             chunk_size=None, seed=None, score_tracker=None):
+    """
+    Play ``games`` games of ``x_ai`` (X) against ``o_ai`` (O).
+
+    AIs are given by class name from ai.py. Games are split into chunks and
+    played across ``workers`` processes (all CPUs by default). When a
+    ``score_tracker`` is given, each finished chunk is recorded with one
+    bulk ``record_games`` call. Returns a report dict.
+    """
+    for name in (x_ai, o_ai):
+        resolve_ai(name)
+        check_board_size(name, size)
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, min(500, games // (workers * 4) or 1))
+
+    tasks = []
+    remaining = games
+    while remaining > 0:
+        count = min(chunk_size, remaining)
+        chunk_seed = None if seed is None else seed + len(tasks)
+        tasks.append((x_ai, o_ai, count, size, win_length, chunk_seed))
+        remaining -= count
+
+    x_name, o_name = resolve_ai(x_ai)('X').name, resolve_ai(o_ai)('O').name
+    if x_name == o_name:
+        x_name, o_name = f"{x_name} (X)", f"{o_name} (O)"
+    names = {'X': x_name, 'O': o_name}
+
+    outcomes = {'X': 0, 'O': 0, None: 0}
+    total_moves = 0
+    latencies = {'X': array('d'), 'O': array('d')}
+
+    start = time.perf_counter()
+    with Pool(workers) as pool:
+        for results, x_lat, o_lat in pool.imap_unordered(_play_chunk, tasks):
+            latencies['X'].frombytes(x_lat)
+            latencies['O'].frombytes(o_lat)
+            for winner, moves, _ in results:
+                outcomes[winner] += 1
+                total_moves += moves
+
+            if score_tracker is not None:
+                score_tracker.record_games([
+                    (names['X'], names['O'],
+                     names[winner] if winner else None, moves, "Simulation",
+                     sequence, size)
+                    for winner, moves, sequence in results
+                ])
+    elapsed = time.perf_counter() - start
+
+    return {
+        "x_ai": x_name,
+        "o_ai": o_name,
+        "board": f"{size}x{size}",
+        "win_length": win_length or size,
+        "games": games,
+        "workers": workers,
+        "x_win_rate": outcomes['X'] / games if games else 0.0,
+        "o_win_rate": outcomes['O'] / games if games else 0.0,
+        "draw_rate": outcomes[None] / games if games else 0.0,
+        "avg_moves": total_moves / games if games else 0.0,
+        "elapsed_s": elapsed,
+        "games_per_second": games / elapsed if elapsed else 0.0,
+        "latency": {
+            "X": _latency_summary(latencies['X']),
+            "O": _latency_summary(latencies['O']),
+        },
+    }
+
+
+def print_report(report):
+    """Print a simulation report as plain text."""
+    print(f"\n  {report['x_ai']} (X)  vs  {report['o_ai']} (O)")
+    print(f"  Board {report['board']}, {report['win_length']} in a row, "
+          f"{report['games']} games on {report['workers']} workers\n")
+    print(f"  X wins: {report['x_win_rate']:7.2%}")
+    print(f"  O wins: {report['o_win_rate']:7.2%}")
+    print(f"  Draws:  {report['draw_rate']:7.2%}")
+    print(f"  Avg moves/game: {report['avg_moves']:.2f}")
+    print(f"  Throughput: {report['games_per_second']:.1f} games/s "
+          f"({report['elapsed_s']:.2f}s)\n")
+    for side in ('X', 'O'):
+        lat = report["latency"][side]
+        print(f"  {side} move latency: p50 {lat['p50_ms']:.3f} ms, "
+              f"p90 {lat['p90_ms']:.3f} ms, p99 {lat['p99_ms']:.3f} ms, "
+              f"max {lat['max_ms']:.3f} ms")
+    print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless AI vs AI simulation.")
+    parser.add_argument("x_ai", help="AI class for X, e.g. HardAI")
+    parser.add_argument("o_ai", help="AI class for O, e.g. EasyAI")
+    parser.add_argument("-n", "--games", type=int, default=1000)
+    parser.add_argument("-w", "--workers", type=int, default=None)
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--win-length", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--record", action="store_true",
+                        help="Record results in the stats file")
+    parser.add_argument("--json", action="store_true",
+                        help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    tracker = None
+    if args.record:
+        from scores import ScoreTracker
+        tracker = ScoreTracker()
+
+    try:
+        report = simulate(args.x_ai, args.o_ai, args.games, args.workers,
+                          args.size, args.win_length, args.chunk_size,
+                          args.seed, tracker)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""
+Startup benchmark for the CLI.
+
+Imports ``main`` in fresh interpreters under ``python -X importtime`` and
+reports its import time (everything it pulls in included), the slowest
+imports, and any module that should only load on demand but was imported
+at startup. Like benchmark.py, a run can be checked against a saved
+baseline; it fails when the import time grows past the threshold or a
+lazy module is imported eagerly:
+
+    python startup_benchmark.py
+    python startup_benchmark.py --save-baseline startup_baseline.json
+    python startup_benchmark.py --baseline startup_baseline.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Modules the CLI must not import before they are needed
+LAZY_MODULES = (
+    "ai", "game", "scores", "leaderboard", "replay", "opening_book",
+    "settings", "gui_tkinter", "gui_pygame", "tkinter", "pygame",
+)
+
+
+def parse_importtime(output):
+    """
+    Parse ``-X importtime`` output.
+
+    Returns ``(name, self_us, cumulative_us, depth)`` per import, in the
+    order they finished; depth 0 is a top-level import.
+    """
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        raw_name = fields[2].rstrip()
+        name = raw_name.lstrip()
+        depth = (len(raw_name) - len(name) - 1) // 2
+        imports.append((name, int(fields[0]), int(fields[1]), depth))
+    return imports
+
+
+def time_import(module="main", python=sys.executable, env=None):
+    """Import ``module`` once in a fresh interpreter and return its stats."""
+    start = time.perf_counter()
+    proc = subprocess.run([python, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=HERE, capture_output=True, text=True, env=env)
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr}")
+
+    imports = parse_importtime(proc.stderr)
+    total = next(cumulative for name, _, cumulative, depth in imports
+                 if name == module and depth == 0)
+    return {
+        "import_us": total,
+        "wall_ms": wall * 1000,
+        "modules": sorted(name for name, *_ in imports),
+        "slowest": sorted(((name, self_us) for name, self_us, _, _ in imports),
+                          key=lambda item: -item[1])[:10],
+    }
+
+
+def measure_startup(module="main", runs=5, python=sys.executable):
+    """
+    Time ``runs`` fresh imports of ``module`` and return a report dict.
+
+    One unmeasured import runs first so the bytecode caches are written
+    (even under PYTHONDONTWRITEBYTECODE), as they are for a player.
+    """
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    time_import(module, python, env)
+    samples = [time_import(module, python) for _ in range(runs)]
+    median = sorted(samples, key=lambda s: s["import_us"])[len(samples) // 2]
+    return {
+        "module": module,
+        "python": sys.version.split()[0],
+        "runs": runs,
+        "import_ms_median": median["import_us"] / 1000,
+        "import_ms_min": min(s["import_us"] for s in samples) / 1000,
+        "wall_ms_median": statistics.median(s["wall_ms"] for s in samples),
+        "modules_imported": len(median["modules"]),
+        "slowest": [{"module": name, "self_ms": us / 1000}
+                    for name, us in median["slowest"]],
+        "eager_imports": [name for name in LAZY_MODULES
+                          if name in median["modules"] and name != module],
+    }
+
+
+def find_regressions(report, baseline, threshold=0.25):
+    """Return a message per startup regression against ``baseline``."""
+    regressions = [f"{name} is imported at startup"
+                   for name in report["eager_imports"]]
+    old = baseline.get("import_ms_median")
+    new = report["import_ms_median"]
+    if old and (new - old) / old > threshold:
+        regressions.append(f"import_ms_median: {old:.2f} -> {new:.2f} "
+                           f"(+{(new - old) / old:.1%})")
+    return regressions
+
+
+def print_report(report):
+    """Print a startup report as plain text."""
+    print(f"\n  import {report['module']}: {report['import_ms_median']:.1f} ms median "
+          f"(min {report['import_ms_min']:.1f} ms, {report['runs']} runs), "
+          f"{report['modules_imported']} modules")
+    print(f"  Interpreter start + import: {report['wall_ms_median']:.1f} ms\n")
+    print("  Slowest imports (self time):")
+    for entry in report["slowest"]:
+        print(f"    {entry['module']:<32}{entry['self_ms']:>8.2f} ms")
+    if report["eager_imports"]:
+        print(f"\n  Imported eagerly: {', '.join(report['eager_imports'])}")
+    print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup imports.")
+    parser.add_argument("--module", default="main", help="Module to import")
+    parser.add_argument("-n", "--runs", type=int, default=5)
+    parser.add_argument("-o", "--output", default="startup_report.json")
+    parser.add_argument("--baseline", help="Baseline report to compare against")
+    parser.add_argument("--save-baseline", metavar="PATH",
+                        help="Also write this report as a new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed growth in import time (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    report = measure_startup(args.module, args.runs)
+    print_report(report)
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+    regressions = find_regressions(report, baseline, args.threshold)
+    if regressions:
+        print("  Startup regressions:")
+        for line in regressions:
+            print(f"    {line}")
+        return 1
+    if args.baseline:
+        print("  No regressions over threshold.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,11 @@
+import os
+import tempfile
+import time
 import unittest
-from game import TicTacToe
-from ai import EasyAI, HardAI
+from game import TicTacToe, BitboardTicTacToe
+from ai import (EasyAI, MediumAI, HardAI, ImpossibleAI, MasterAI, MCTSAI,
+                MoveOrdering, TranspositionTable)
+from opening_book import OpeningBook, build_book
 
 class TestAI(unittest.TestCase):
 
@@ -51,5 +56,241 @@ class TestAI(unittest.TestCase):
                 losses += 1
         self.assertEqual(losses, 0, "Hard AI should NEVER lose!")
 
+    def test_hard_ai_on_bitboard_engine(self):
+        """Hard AI should pick the same move on the bitboard engine."""
+        for engine in (TicTacToe, BitboardTicTacToe):
+            game = engine()
+            ai = HardAI('O')
+            game.make_move(1)  # X
+            game.make_move(4)  # O
+            game.make_move(2)  # X - threatens 3
+            self.assertEqual(ai.get_move(game), 3)
+
+    def test_symmetric_positions_share_table_key(self):
+        """Rotations and reflections of a position should hash the same."""
+        table = TranspositionTable()
+        keys = set()
+        for corner in (1, 3, 7, 9):
+            game = TicTacToe()
+            game.make_move(corner)
+            keys.add(table.key(game, 'O'))
+        self.assertEqual(len(keys), 1)
+
+    def test_table_persists_across_moves(self):
+        """A repeated search should be answered from the table."""
+        table = TranspositionTable()
+        ai = ImpossibleAI('O', table=table, use_book=False)
+        game = TicTacToe()
+        game.make_move(1)
+        first = ai.get_move(game)
+        size = len(table)
+        self.assertEqual(ai.get_move(game), first)
+        self.assertEqual(len(table), size)
+        self.assertGreater(table.hits, 0)
+
+    def test_impossible_ai_matches_hard_ai_with_shared_table(self):
+        """Alpha-beta bounds in the table should not change move quality."""
+        table = TranspositionTable()
+        hard = HardAI('O', table=table, use_book=False)
+        impossible = ImpossibleAI('O', table=table, use_book=False)
+        for opening in ([5], [1], [2], [1, 5, 9]):
+            game = TicTacToe()
+            for pos in opening:
+                game.make_move(pos)
+            game_copy = game.get_board_copy()
+            move = impossible.get_move(game)
+            self.assertEqual(game.get_board_copy(), game_copy)
+            self.assertEqual(move, hard.get_move(game))
+    def test_move_ordering_tries_wins_then_blocks(self):
+        """Ordering should put the winning move first, then the block."""
+        game = TicTacToe()
+        for pos in [1, 4, 2, 5]:
+            game.make_move(pos)
+        ordering = MoveOrdering()
+        moves = ordering.order(game, game.get_available_moves(), 'X', 'O', 0)
+        self.assertEqual(moves[:2], [3, 6])
+        self.assertEqual(MoveOrdering(()).order(game, [9, 3, 6], 'X', 'O', 0),
+                         [9, 3, 6])
+        with self.assertRaises(ValueError):
+            MoveOrdering(("sideways",))
+
+    def test_move_ordering_keeps_optimal_moves(self):
+        """Ordered and unordered searches should pick the same move."""
+        game = BitboardTicTacToe()
+        for pos in [1, 5, 9]:
+            game.make_move(pos)
+        moves = [
+            ImpossibleAI('O', table=TranspositionTable(), use_book=False,
+                         ordering=ordering).get_move(game)
+            for ordering in (MoveOrdering(), MoveOrdering(()))
+        ]
+        self.assertEqual(moves[0], moves[1])
+
+    def test_book_moves_match_search(self):
+        """Book answers should equal the search result."""
+        for opening in ([5], [1], [2], [1, 5, 9], [5, 1, 9, 3]):
+            game = TicTacToe()
+            for pos in opening:
+                game.make_move(pos)
+            symbol = game.current_player
+            with_book = HardAI(symbol)
+            without_book = HardAI(symbol, use_book=False)
+            self.assertIsNotNone(with_book.book)
+            self.assertEqual(with_book.get_move(game), without_book.get_move(game))
+
+    def test_corrupt_book_is_rejected(self):
+        """A damaged book file should fail to load instead of misplaying."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "book.bin")
+            build_book(path)
+            self.assertIsNotNone(OpeningBook.load(path))
+
+            with open(path, 'r+b') as f:
+                f.seek(-1, os.SEEK_END)
+                f.write(b'\xff')
+            self.assertIsNone(OpeningBook.load(path))
+            self.assertIsNone(OpeningBook.load(os.path.join(tmp, "missing.bin")))
+
+    def test_master_ai_never_loses_on_classic_board(self):
+        """Master AI should play perfectly on 3x3 within its budget."""
+        import random
+        for _ in range(20):
+            game = TicTacToe()
+            ai = MasterAI('O')
+            while not game.game_over:
+                if game.current_player == 'X':
+                    move = random.choice(game.get_available_moves())
+                else:
+                    move = ai.get_move(game)
+                game.make_move(move)
+            self.assertNotEqual(game.winner, 'X')
+
+    def test_master_ai_wins_and_blocks_on_larger_board(self):
+        """Master AI should take a win before blocking on 4x4."""
+        game = TicTacToe(size=4)
+        for pos in [1, 5, 2, 6, 3]:
+            game.make_move(pos)
+        self.assertEqual(MasterAI('O').get_move(game), 4)  # Block
+        game.make_move(7)
+        self.assertEqual(MasterAI('X').get_move(game), 4)  # Win over block
+
+    def test_ais_only_pick_free_cells_on_larger_board(self):
+        """Nine empty cells on 4x4 is not an empty 3x3 board."""
+        game = BitboardTicTacToe(size=4)
+        for pos in [1, 2, 7, 3, 6, 8, 12]:
+            game.make_move(pos)
+        for ai in (MediumAI('O'), HardAI('O'), ImpossibleAI('O')):
+            for _ in range(5):
+                self.assertTrue(game.is_valid_move(ai.get_move(game)))
+
+        empty = TicTacToe(size=4)
+        self.assertIn(HardAI('X').get_move(empty), (1, 4, 13, 16))
+        self.assertIn(MediumAI('X').get_move(empty), (6, 7, 10, 11))
+
+    def test_master_ai_respects_time_budget(self):
+        """A move on a gomoku board should come back within the budget."""
+        game = BitboardTicTacToe(size=15, win_length=5)
+        for pos in [113, 114, 98, 128]:
+            game.make_move(pos)
+        ai = MasterAI('X', time_limit_ms=200)
+        start = time.perf_counter()
+        move = ai.get_move(game)
+        self.assertLess(time.perf_counter() - start, 0.4)
+        self.assertTrue(game.is_valid_move(move))
+        self.assertGreaterEqual(ai.last_depth, 1)
+
+    def test_profiling_is_off_by_default(self):
+        """AIs should not record anything unless profiling is enabled."""
+        game = TicTacToe()
+        game.make_move(5)
+        ai = ImpossibleAI('O', table=TranspositionTable(), use_book=False)
+        ai.get_move(game)
+        self.assertIsNone(ai.profile)
+
+    def test_profile_records_search_statistics(self):
+        """A profiled move should report nodes, cutoffs and TT probes."""
+        game = TicTacToe()
+        game.make_move(5)
+        ai = ImpossibleAI('O', table=TranspositionTable(), use_book=False)
+        profile = ai.enable_profiling()
+        ai.get_move(game)
+
+        stats = profile.moves[0]
+        self.assertGreater(stats["nodes"], 1)
+        self.assertEqual(stats["nodes"], sum(stats["nodes_by_depth"].values()))
+        self.assertGreater(stats["cutoffs"], 0)
+        self.assertGreater(stats["branching_factor"], 1)
+        self.assertGreater(stats["tt_probes"], 0)
+        self.assertIn('"moves": 1', profile.to_json())
+
+    def test_master_ai_profile_counts_nodes(self):
+        """Master AI's profiled node count should match last_nodes."""
+        game = TicTacToe(size=4)
+        game.make_move(6)
+        ai = MasterAI('O', time_limit_ms=100)
+        profile = ai.enable_profiling()
+        ai.get_move(game)
+        self.assertEqual(profile.summary()["nodes"], ai.last_nodes)
+        ai.disable_profiling()
+        self.assertIsNone(ai.profile)
+
+    def test_mcts_ai_never_loses_on_classic_board(self):
+        """MCTS AI should hold HardAI to a draw from either side."""
+        for mcts_symbol in ('X', 'O'):
+            game = BitboardTicTacToe()
+            mcts = MCTSAI(mcts_symbol, iterations=2000, time_limit_ms=None, seed=3)
+            hard = HardAI('O' if mcts_symbol == 'X' else 'X')
+            while not game.game_over:
+                ai = mcts if game.current_player == mcts_symbol else hard
+                game.make_move(ai.get_move(game))
+            self.assertIsNone(game.winner)
+
+    def test_mcts_ai_wins_and_blocks_on_larger_board(self):
+        """MCTS AI should finish its own line first, else block a threat."""
+        game = TicTacToe(size=5, win_length=4)
+        for pos in (1, 7, 2, 8, 3):
+            game.make_move(pos)
+        # X threatens 4; O has no win of its own yet
+        self.assertEqual(MCTSAI('O', iterations=50).get_move(game), 4)
+        game.make_move(9)
+        self.assertEqual(MCTSAI('X', iterations=50).get_move(game), 4)
+
+    def test_mcts_ai_reports_playouts(self):
+        """The iteration budget should be met exactly, also root-parallel."""
+        game = BitboardTicTacToe(size=7, win_length=4)
+        game.make_move(25)
+        for workers in (1, 2):
+            ai = MCTSAI('O', iterations=300, time_limit_ms=None,
+                        workers=workers, seed=1)
+            self.addCleanup(ai.close)
+            self.assertIn(ai.get_move(game), game.get_available_moves())
+            self.assertEqual(ai.last_playouts, 300)
+            self.assertGreater(ai.last_playouts_per_second, 0)
+
+    def test_mcts_ai_respects_time_budget(self):
+        """MCTS AI should answer within its time budget on a 15x15 board."""
+        game = BitboardTicTacToe(size=15, win_length=5)
+        game.make_move(113)
+        ai = MCTSAI('O', time_limit_ms=100)
+        profile = ai.enable_profiling()
+        start = time.perf_counter()
+        move = ai.get_move(game)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertIn(move, game.get_available_moves())
+        self.assertEqual(profile.summary()["nodes"], ai.last_playouts)
+
+        with self.assertRaises(ValueError):
+            MCTSAI('O', iterations=None, time_limit_ms=None)
+        with self.assertRaises(ValueError):
+            MCTSAI('O', time_limit_ms=0)
+        with self.assertRaises(ValueError):
+            MCTSAI('O', iterations=0, time_limit_ms=None)
+
+        # A budget that runs out at once still plays a legal move
+        ai = MCTSAI('O', time_limit_ms=1e-9)
+        self.assertIn(ai.get_move(game), game.get_available_moves())
+        self.assertEqual(ai.last_playouts, 1)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,86 @@
+import threading
+import time
+import unittest
+
+from ai import HardAI
+from ai_worker import AIWorker
+from game import TicTacToe
+
+
+class SlowAI:
+    """Test double that waits for a signal before answering."""
+
+    def __init__(self, move):
+        self.move = move
+        self.release = threading.Event()
+
+    def get_move(self, game):
+        self.release.wait(5)
+        return self.move
+
+
+def wait_for_move(worker, min_time=0.0, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        move = worker.poll(min_time)
+        if move is not None:
+            return move
+        time.sleep(0.005)
+    raise AssertionError("AI worker never produced a move")
+
+
+class TestAIWorker(unittest.TestCase):
+
+    def test_returns_move_without_touching_game(self):
+        """The search should run on a copy of the game."""
+        game = TicTacToe()
+        for pos in [1, 4, 2]:
+            game.make_move(pos)
+        board = dict(game.board)
+
+        worker = AIWorker()
+        worker.start(HardAI('O'), game)
+        self.assertEqual(wait_for_move(worker), 3)  # Block
+        self.assertEqual(dict(game.board), board)
+        self.assertFalse(worker.busy)
+
+    def test_minimum_display_time(self):
+        """A fast move should be held back until the minimum time."""
+        game = TicTacToe()
+        game.make_move(5)
+        worker = AIWorker()
+        start = time.monotonic()
+        worker.start(HardAI('O'), game)
+        wait_for_move(worker, min_time=0.2)
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+    def test_cancel_drops_stale_result(self):
+        """A cancelled search's move should never be returned."""
+        game = TicTacToe()
+        worker = AIWorker()
+        slow = SlowAI(7)
+        worker.start(slow, game)
+        self.assertTrue(worker.busy)
+        worker.cancel()
+        self.assertFalse(worker.busy)
+
+        fast = SlowAI(3)
+        fast.release.set()
+        worker.start(fast, game)
+        slow.release.set()
+        self.assertEqual(wait_for_move(worker), 3)
+
+    def test_ai_errors_are_raised_on_poll(self):
+        """Exceptions from the search should surface in the GUI thread."""
+        class BrokenAI:
+            def get_move(self, game):
+                raise RuntimeError("boom")
+
+        worker = AIWorker()
+        worker.start(BrokenAI(), TicTacToe())
+        with self.assertRaises(RuntimeError):
+            wait_for_move(worker)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import copy
+import unittest
+
+from ai import MoveOrdering
+from benchmark import (compare_orderings, find_regressions,
+                       reachable_positions, run_benchmarks)
+
+
+class TestBenchmark(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.report = run_benchmarks(("HardAI", "ImpossibleAI"), limit=30,
+                                    alloc_every=10)
+
+    def test_enumerates_every_unfinished_position(self):
+        """All 4,519 non-empty, unfinished positions should be found."""
+        self.assertEqual(len(reachable_positions()), 4519)
+
+    def test_counts_search_nodes(self):
+        """Alpha-beta should visit fewer nodes than plain minimax."""
+        results = self.report["results"]
+        self.assertGreater(results["HardAI"]["nodes_total"], 0)
+        self.assertLess(results["ImpossibleAI"]["nodes_total"],
+                        results["HardAI"]["nodes_total"])
+        self.assertGreater(results["HardAI"]["alloc_peak_bytes_max"], 0)
+
+    def test_regression_threshold(self):
+        """Growth past the threshold should be reported, noise should not."""
+        slower = copy.deepcopy(self.report)
+        slower["results"]["HardAI"]["nodes_total"] *= 1.5
+        self.assertEqual(find_regressions(self.report, self.report), [])
+        regressions = find_regressions(slower, self.report, threshold=0.10)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("HardAI.nodes_total", regressions[0])
+
+    def test_move_ordering_reduces_nodes(self):
+        """Full move ordering should search fewer nodes than board order."""
+        positions = reachable_positions()[:30]
+        orderings = compare_orderings(
+            positions, steps=((), MoveOrdering.HEURISTICS))
+        self.assertEqual(orderings["board order"]["node_reduction"], 0.0)
+        full = orderings["+".join(MoveOrdering.HEURISTICS)]
+        self.assertGreater(full["node_reduction"], 0.2)
+
+
+if __name__ == '__main__':
+    unittest.main()
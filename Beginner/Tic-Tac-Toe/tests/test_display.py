@@ -0,0 +1,93 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import settings
+from display import CLEAR, WIN_MARKER, BoardRenderer
+from game import TicTacToe
+
+
+class TestBoardRenderer(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(
+            settings, "SETTINGS_FILE",
+            os.path.join(self.tmpdir.name, "settings.json"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmpdir.cleanup)
+
+        self.game = TicTacToe()
+        self.renderer = BoardRenderer(io.StringIO())
+
+    def render(self, winning_combo=None):
+        """Render the game and return what was written for this frame."""
+        stream = self.renderer.stream
+        stream.seek(0)
+        stream.truncate()
+        self.renderer.render(self.game.board, winning_combo)
+        return stream.getvalue()
+
+    def test_first_frame_draws_everything(self):
+        """The first frame should clear the screen and draw every cell."""
+        output = self.render()
+        self.assertTrue(output.startswith(CLEAR))
+        for pos in range(1, 10):
+            self.assertIn(str(pos), output)
+
+    def test_later_frames_only_redraw_changed_cells(self):
+        """After a move only that cell should be written."""
+        self.render()
+        self.game.make_move(5)
+        output = self.render()
+        self.assertNotIn(CLEAR, output)
+        self.assertIn("\x1b[12;10H", output)   # Center cell
+        self.assertEqual(output.count("H"), 2)  # Cell + cursor park
+        self.assertIn("X", output)
+
+    def test_winning_line_is_redrawn(self):
+        """Highlighting a win should mark every winning cell."""
+        settings.save_settings({**settings.DEFAULT_SETTINGS,
+                                "board_style": "emoji"})
+        for pos in [1, 4, 2, 5]:
+            self.game.make_move(pos)
+        self.render()
+        self.game.make_move(3)
+        output = self.render(self.game.get_winning_combo('X'))
+        self.assertEqual(output.count(WIN_MARKER), 3)
+
+    def test_settings_read_once(self):
+        """Rendering should not re-read settings until the file changes."""
+        with mock.patch("settings.json.load", wraps=settings.json.load) as load:
+            settings.save_settings({**settings.DEFAULT_SETTINGS,
+                                    "show_hints": False})
+            self.render()
+            for pos in [1, 2, 3]:
+                self.game.make_move(pos)
+                self.assertNotIn(CLEAR, self.render())
+            self.assertEqual(load.call_count, 0)   # Our own save needs no re-read
+
+            # Another program edits the file: the next frame is redrawn
+            path = settings.get_settings().path
+            with open(path, 'w') as f:
+                f.write('{"board_style": "minimal"}')
+            os.utime(path, ns=(0, 0))
+            self.assertTrue(self.render().startswith(CLEAR))
+            self.assertEqual(load.call_count, 1)
+
+    def test_no_subprocess_per_frame(self):
+        """Frames should be plain writes, never a shell ``clear``."""
+        with mock.patch("os.system") as system:
+            self.render()
+            self.game.make_move(5)
+            self.render()
+            self.renderer.invalidate()
+            self.assertTrue(self.render().startswith(CLEAR))
+        system.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
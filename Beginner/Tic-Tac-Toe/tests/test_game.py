@@ -1,5 +1,5 @@
 import unittest
-from game import TicTacToe
+from game import TicTacToe, BitboardTicTacToe, generate_win_combinations
 
 class TestTicTacToe(unittest.TestCase):
 
@@ -93,5 +93,79 @@ class TestTicTacToe(unittest.TestCase):
         self.game.make_move(5)
         self.assertEqual(len(self.game.get_available_moves()), initial_count - 1)
 
+    def test_generated_lines_match_classic_board(self):
+        """3x3 line generation should reproduce WIN_COMBINATIONS."""
+        self.assertEqual(generate_win_combinations(3, 3), TicTacToe.WIN_COMBINATIONS)
+        self.assertEqual(len(generate_win_combinations(15, 5)), 572)
+
+    def test_larger_board_win(self):
+        """Four in a row should win on a 4x4 board, three should not."""
+        game = type(self.game)(size=4)
+        for pos in [1, 5, 2, 6, 3, 7]:
+            game.make_move(pos)
+        self.assertFalse(game.game_over)
+        game.make_move(4)
+        self.assertEqual(game.winner, 'X')
+        self.assertEqual(game.get_winning_combo('X'), [1, 2, 3, 4])
+
+    def test_win_length_shorter_than_board(self):
+        """A 5x5 board with 4 in a row should detect diagonal wins."""
+        game = type(self.game)(size=5, win_length=4)
+        for pos in [1, 2, 7, 3, 13, 4, 19]:
+            game.make_move(pos)
+        self.assertEqual(game.winner, 'X')
+
+    def test_reset_keeps_board_size(self):
+        """Reset should keep a custom board geometry."""
+        game = type(self.game)(size=4, win_length=3)
+        game.make_move(16)
+        game.reset()
+        self.assertEqual(len(game.get_available_moves()), 16)
+        self.assertEqual(game.win_length, 3)
+
+    def test_invalid_win_length(self):
+        """Win length longer than the board should be rejected."""
+        with self.assertRaises(ValueError):
+            type(self.game)(size=3, win_length=4)
+
+    def test_copy_is_independent(self):
+        """A copy should have the same moves but its own board."""
+        game = type(self.game)(size=4, win_length=3)
+        for pos in [1, 6, 11]:
+            game.make_move(pos)
+        clone = game.copy()
+        self.assertIs(type(clone), type(game))
+        self.assertEqual(dict(clone.board), dict(game.board))
+        self.assertEqual(clone.current_player, game.current_player)
+        clone.make_move(2)
+        self.assertEqual(game.board[2], ' ')
+
+
+class TestBitboardTicTacToe(TestTicTacToe):
+    """Run the full game suite against the bitboard engine."""
+
+    def setUp(self):
+        """Set up a fresh bitboard game for each test."""
+        self.game = BitboardTicTacToe()
+
+    def test_board_view_writes_through(self):
+        """Writing to the board view should update the bitmasks."""
+        self.game.board[3] = 'O'
+        self.assertEqual(self.game.bits['O'], 0b100)
+        self.assertNotIn(3, self.game.get_available_moves())
+        self.game.board[3] = ' '
+        self.assertEqual(self.game.bits['O'], 0)
+
+    def test_board_copy_matches_dict_engine(self):
+        """Board copies should match the dict engine move for move."""
+        reference = TicTacToe()
+        for pos in [5, 1, 9, 3, 2]:
+            reference.make_move(pos)
+            self.game.make_move(pos)
+        self.assertEqual(self.game.get_board_copy(), reference.get_board_copy())
+        self.assertEqual(self.game.get_winning_combo('O'),
+                         reference.get_winning_combo('O'))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,57 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+try:
+    import pygame
+    import gui_pygame
+except ImportError:
+    pygame = None
+
+
+@unittest.skipIf(pygame is None, "pygame is not installed")
+class TestPygameRendering(unittest.TestCase):
+
+    def setUp(self):
+        pygame.display.init()
+        self.addCleanup(pygame.display.quit)
+        self.screen = pygame.display.set_mode((gui_pygame.WIDTH, gui_pygame.HEIGHT))
+
+    def test_particle_pool_reuses_particles(self):
+        """Bursts should recycle pooled particles, never allocate new ones."""
+        pool = gui_pygame.ParticlePool(capacity=10)
+        particles = set(map(id, pool.free))
+        pool.burst(100, 100, 50)
+        self.assertEqual(len(pool.active), 10)
+
+        pool.update(2.0)  # Every particle expires
+        self.assertEqual(pool.active, [])
+        pool.burst(100, 100, 5)
+        self.assertTrue({id(p) for p in pool.active} <= particles)
+
+    def test_only_changed_regions_are_updated(self):
+        """Unchanged regions should not be sent to the display again."""
+        renderer = gui_pygame.SceneRenderer(self.screen)
+        pool = gui_pygame.ParticlePool(capacity=0)
+        rect = gui_pygame.cell_rect(5)
+        fill = lambda surface, r: surface.fill((255, 0, 0), r)
+
+        self.assertTrue(renderer.region(5, "X", rect, fill))
+        self.assertEqual(renderer.present(pool), 1)
+        self.assertFalse(renderer.region(5, "X", rect, fill))
+        self.assertEqual(renderer.present(pool), 0)
+
+    def test_particles_are_erased_next_frame(self):
+        """A particle's old rect should be restored from the scene."""
+        renderer = gui_pygame.SceneRenderer(self.screen)
+        pool = gui_pygame.ParticlePool(capacity=3)
+        pool.burst(300, 300, 3)
+        self.assertEqual(renderer.present(pool), 3)
+        pool.update(2.0)
+        self.assertEqual(renderer.present(pool), 3)  # Old rects cleaned up
+        self.assertEqual(renderer.present(pool), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
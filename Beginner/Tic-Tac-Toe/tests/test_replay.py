@@ -0,0 +1,92 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from opening_book import get_opening_book
+from replay import analyze_moves, analyze_records, decode_moves, encode_moves, main
+from scores import ScoreTracker
+
+
+class TestReplay(unittest.TestCase):
+
+    def setUp(self):
+        self.book = get_opening_book()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_sequence_round_trip(self):
+        """Moves should encode to one character each on small boards."""
+        moves = [5, 1, 9, 3, 2, 8, 7, 4, 6]
+        self.assertEqual(encode_moves(moves), "408217635")
+        self.assertEqual(decode_moves(encode_moves(moves)), moves)
+
+        gomoku = [113, 1, 225, 16]
+        seq = encode_moves(gomoku, 225)
+        self.assertEqual(len(seq), 8)
+        self.assertEqual(decode_moves(seq, 225), gomoku)
+
+    def test_blunder_is_flagged(self):
+        """Only moves that worsen the outcome should count as blunders."""
+        # O's edge reply to a corner opening loses; the later missed block
+        # at 3 changes nothing since O was already lost
+        notes = analyze_moves([1, 4, 2, 5, 3], self.book)
+        self.assertEqual([n["blunder"] for n in notes],
+                         [False, True, False, False, False])
+        self.assertEqual(notes[1]["best_moves"], [5])
+        self.assertEqual(notes[3]["best_moves"], [3])
+        self.assertEqual(notes[4]["value"], 10)
+
+    def test_illegal_sequence_is_rejected(self):
+        """Replaying an occupied cell should raise ValueError."""
+        with self.assertRaises(ValueError):
+            analyze_moves([5, 5], self.book)
+
+    def test_recorded_games_are_analyzed(self):
+        """Sequences stored by ScoreTracker should replay from the log."""
+        tracker = ScoreTracker(os.path.join(self.tmp.name, "stats.json"),
+                               os.path.join(self.tmp.name, "log.jsonl"))
+        tracker.record_game("Ann", "Bob", "Ann", 5, "PvP", [1, 4, 2, 5, 3])
+        tracker.record_game("Ann", "Bob", "Ann", 5, "PvP", [1, 4, 2, 5, 3])
+        tracker.record_game("Ann", "Cy", None, 9, "PvP")
+
+        record = next(tracker.iter_games())
+        self.assertEqual(record["seq"], "03142")
+
+        report = analyze_records(tracker.iter_games(), self.book)
+        self.assertEqual(report["games"], 2)
+        self.assertEqual(report["skipped"], 1)
+        self.assertEqual(report["players"]["Bob"], {"moves": 4, "blunders": 2})
+        self.assertEqual(report["players"]["Ann"], {"moves": 6, "blunders": 0})
+
+        only_cy = analyze_records(tracker.iter_games(), self.book, player="Cy")
+        self.assertEqual(only_cy["games"], 0)
+
+    def test_main_only_reads_the_log(self):
+        """Replaying a log must not touch it or any stats snapshot."""
+        log = os.path.join(self.tmp.name, "log.jsonl")
+        tracker = ScoreTracker(os.path.join(self.tmp.name, "stats.json"), log)
+        tracker.record_game("Ann", "Bob", "Ann", 5, "PvP", [1, 4, 2, 5, 3])
+        with open(log, 'rb') as f:
+            before = f.read()
+
+        # A default snapshot from an older version in the working directory
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.addCleanup(os.chdir, cwd)
+        with open("game_stats.json", "w") as f:
+            json.dump({"log_offset": 10 ** 6, "games": [{"winner": "Cy"}]}, f)
+
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(main(["--log", log, "--json"]), 0)
+        self.assertEqual(json.loads(out.getvalue())["games"], 1)
+        with open(log, 'rb') as f:
+            self.assertEqual(f.read(), before)
+        with open("game_stats.json") as f:
+            self.assertIn("games", json.load(f))
+
+
+if __name__ == '__main__':
+    unittest.main()
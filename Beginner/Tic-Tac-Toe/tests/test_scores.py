@@ -0,0 +1,149 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import date
+
+import scores
+from leaderboard import Leaderboard
+from scores import ScoreTracker
+
+
+class TestScoreTracker(unittest.TestCase):
+
+    def setUp(self):
+        """Keep the snapshot and log in a temporary directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.stats_file = os.path.join(self.tmp.name, "game_stats.json")
+        self.log_file = os.path.join(self.tmp.name, "game_log.jsonl")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def tracker(self):
+        return ScoreTracker(self.stats_file, self.log_file)
+
+    def test_record_appends_one_line(self):
+        """Each game should add exactly one log line."""
+        tracker = self.tracker()
+        tracker.record_game("Ann", "Bob", "Ann", 5, "PvP")
+        tracker.record_game("Ann", "Bob", None, 9, "PvP")
+        with open(self.log_file, 'rb') as f:
+            self.assertEqual(len(f.readlines()), 2)
+        self.assertEqual([g["id"] for g in tracker.iter_games()], [1, 2])
+        self.assertEqual(tracker.stats["players"]["Ann"]["wins"], 1)
+        self.assertEqual(tracker.stats["players"]["Bob"]["draws"], 1)
+
+    def test_restart_replays_log_after_snapshot(self):
+        """Aggregates should survive a restart between snapshots."""
+        tracker = self.tracker()
+        tracker.record_games([("Ann", "Bob", "Bob", 6, "PvP")] * 3)
+        self.assertFalse(os.path.exists(self.stats_file))
+
+        reloaded = self.tracker()
+        self.assertEqual(reloaded.stats["total_games"], 3)
+        self.assertEqual(reloaded.stats["players"]["Bob"]["win_streak"], 3)
+
+    def test_snapshot_written_periodically(self):
+        """The snapshot should cover the log once the interval is reached."""
+        tracker = self.tracker()
+        tracker.record_games([("Ann", "Bob", None, 9, "PvP")] * scores.SNAPSHOT_INTERVAL)
+        with open(self.stats_file) as f:
+            snapshot = json.load(f)
+        self.assertEqual(snapshot["total_games"], scores.SNAPSHOT_INTERVAL)
+        self.assertEqual(snapshot["log_offset"], os.path.getsize(self.log_file))
+        self.assertNotIn("games", snapshot)
+
+    def test_partial_log_line_discarded(self):
+        """A torn write at the end of the log should be dropped on load."""
+        tracker = self.tracker()
+        tracker.record_game("Ann", "Bob", "Ann", 5, "PvP")
+        with open(self.log_file, 'ab') as f:
+            f.write(b'{"id":2,"player1":"An')
+
+        reloaded = self.tracker()
+        self.assertEqual(reloaded.stats["total_games"], 1)
+        reloaded.record_game("Ann", "Bob", "Ann", 5, "PvP")
+        self.assertEqual([g["id"] for g in reloaded.iter_games()], [1, 2])
+
+    def test_legacy_stats_file_migrated(self):
+        """Games stored inline by older versions should move to the log."""
+        legacy = {
+            "players": {"Ann": {"wins": 1, "losses": 0, "draws": 0,
+                                "total_games": 1, "win_streak": 1,
+                                "best_streak": 1, "created_at": "x"}},
+            "games": [{"id": 1, "player1": "Ann", "player2": "Bob",
+                       "winner": "Ann", "moves": 5, "mode": "PvP",
+                       "timestamp": "2026-01-01 00:00:00"}],
+            "total_games": 1,
+        }
+        with open(self.stats_file, 'w') as f:
+            json.dump(legacy, f)
+
+        tracker = self.tracker()
+        self.assertEqual(tracker.stats["players"]["Ann"]["wins"], 1)
+        self.assertEqual(len(list(tracker.iter_games())), 1)
+        self.assertEqual(self.tracker().stats["total_games"], 1)
+
+
+class TestLeaderboard(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tracker = ScoreTracker(os.path.join(self.tmp.name, "stats.json"),
+                                    os.path.join(self.tmp.name, "log.jsonl"))
+        self.tracker.record_games([
+            ("Ann", "Bob", "Ann", 5, "PvP"),
+            ("Ann", "Cy", "Ann", 5, "PvP"),
+            ("Bob", "Cy", "Bob", 7, "PvP"),
+            ("Cy", "Dee", None, 9, "PvP"),
+        ])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_rankings_follow_recorded_games(self):
+        """Top-K and rank lookups should reflect every recorded game."""
+        board = self.tracker.leaderboard
+        self.assertEqual([name for _, name, _ in board.top("wins", 2)], ["Ann", "Bob"])
+        self.assertEqual(board.rank("Cy"), 3)
+        self.assertEqual(board.rank("Dee", "win_rate"), 4)
+
+        self.tracker.record_games([("Dee", "Ann", "Dee", 5, "PvP")] * 3)
+        self.assertEqual(board.rank("Dee"), 1)
+        self.assertEqual(board.rank("Dee", "streak"), 1)
+
+    def test_pagination(self):
+        """Pages should continue the ranking where the last one stopped."""
+        board = self.tracker.leaderboard
+        first = board.page("wins", 1, 3)
+        second = board.page("wins", 2, 3)
+        self.assertEqual([rank for rank, _, _ in first + second], [1, 2, 3, 4])
+
+    def test_matches_full_sort(self):
+        """Incremental order should equal sorting the whole table."""
+        board = Leaderboard()
+        players = {}
+        for i in range(50):
+            stats = {"wins": i % 7, "losses": i % 5, "draws": 0,
+                     "total_games": i % 7 + i % 5, "win_streak": 0,
+                     "best_streak": i % 3}
+            players[f"p{i}"] = stats
+            board.update(f"p{i}", stats)
+        expected = sorted(players, key=lambda n: (-players[n]["wins"], n))
+        ranked = [name for _, name, _ in board.top("wins", 50)]
+        self.assertEqual([players[n]["wins"] for n in ranked],
+                         [players[n]["wins"] for n in expected])
+
+    def test_time_window(self):
+        """Windowed stats should only count games inside the window."""
+        board = self.tracker.leaderboard
+        board.record_day("2000-01-01", "Ann", 1)
+        self.assertEqual(board.window(7)["Ann"]["wins"], 2)
+        self.assertEqual(board.window(7)["Ann"]["losses"], 0)
+        self.assertEqual(board.window_top("wins", 1, 30)[0][1], "Ann")
+        self.assertEqual(board.window(7, today=date(2000, 1, 3))["Ann"]["losses"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
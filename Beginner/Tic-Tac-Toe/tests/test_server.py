@@ -0,0 +1,120 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from loadtest import load_test
+from scores import ScoreTracker
+from server import GameServer, ResultWriter
+
+
+class TestServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.tracker = ScoreTracker(os.path.join(self.tmp.name, "stats.json"),
+                                    os.path.join(self.tmp.name, "log.jsonl"))
+        self.server = GameServer(tracker=self.tracker, flush_interval=0.05)
+        self.port = await self.server.start("127.0.0.1", 0)
+        self.reader, self.writer = await asyncio.open_connection("127.0.0.1", self.port)
+
+    async def asyncTearDown(self):
+        self.writer.close()
+        await self.server.close()
+
+    async def send(self, message):
+        self.writer.write(json.dumps(message).encode() + b'\n')
+        await self.writer.drain()
+        return json.loads(await self.reader.readline())
+
+    async def test_match_is_played_and_recorded(self):
+        """A full match against HardAI should end and reach the stats store."""
+        state = await self.send({"type": "new", "ai": "HardAI", "name": "Alice"})
+        self.assertEqual(state["board"], "." * 9)
+        while not state["over"]:
+            state = await self.send({"type": "move",
+                                     "position": state["board"].index('.') + 1})
+        self.assertNotEqual(state["winner"], 'X')
+
+        await self.server.close()
+        self.assertEqual(self.server.matches_finished, 1)
+        record = next(self.tracker.iter_games())
+        self.assertEqual(record["player1"], "Alice")
+        self.assertEqual(record["mode"], "Network")
+        self.assertEqual(len(record["seq"]), record["moves"])
+
+    async def test_ai_opens_when_playing_x(self):
+        """Choosing O should get a board with the AI's first move on it."""
+        state = await self.send({"type": "new", "ai": "EasyAI", "symbol": "O"})
+        self.assertEqual(state["board"].count('X'), 1)
+        self.assertEqual(state["turn"], 'O')
+        self.assertEqual(state["board"][state["ai_move"] - 1], 'X')
+
+    async def test_bad_requests_get_errors(self):
+        """Invalid messages should be answered with an error, not a disconnect."""
+        for message in ({"type": "move", "position": 1},
+                        {"type": "new", "ai": "NoSuchAI"},
+                        {"type": "new", "ai": "HardAI", "size": 5},
+                        {"type": "dance"}):
+            self.assertEqual((await self.send(message))["type"], "error")
+
+        await self.send({"type": "new", "ai": "EasyAI"})
+        await self.send({"type": "move", "position": 5})
+        reply = await self.send({"type": "move", "position": 5})
+        self.assertIn("Illegal move", reply["message"])
+        reply = await self.send({"type": "move", "position": True})
+        self.assertIn("Illegal move", reply["message"])
+
+    async def test_oversized_message_closes_cleanly(self):
+        """A line over the stream limit gets an error, then the connection ends."""
+        self.writer.write(b'x' * 100_000 + b'\n')
+        await self.writer.drain()
+        reply = json.loads(await self.reader.readline())
+        self.assertEqual(reply, {"type": "error", "message": "Message too long"})
+        self.assertEqual(await self.reader.readline(), b'')
+
+    async def test_close_ends_open_connections(self):
+        """Closing the server should end connected clients' handlers."""
+        await self.send({"type": "new", "ai": "EasyAI"})
+        await asyncio.wait_for(self.server.close(), 5)
+        self.assertEqual(self.server.connections, 0)
+        self.assertEqual(await self.reader.readline(), b'')
+
+    async def test_load_test(self):
+        """The load-test client should report every match."""
+        report = await load_test("127.0.0.1", self.port, matches=20,
+                                 concurrency=5, ai="ImpossibleAI", seed=1)
+        self.assertEqual(report["client_wins"], 0)
+        self.assertEqual(report["ai_wins"] + report["draws"], 20)
+        self.assertGreater(report["latency"]["p50_ms"], 0)
+
+        await self.server.close()
+        self.assertEqual(self.tracker.stats["total_games"], 20)
+
+
+class TestResultWriter(unittest.IsolatedAsyncioTestCase):
+
+    async def test_results_are_batched(self):
+        """Results should be written in batches, with the rest on close."""
+        with tempfile.TemporaryDirectory() as tmp:
+            tracker = ScoreTracker(os.path.join(tmp, "stats.json"),
+                                   os.path.join(tmp, "log.jsonl"))
+            writer = ResultWriter(tracker, batch_size=2, flush_interval=60)
+            writer.start()
+            for _ in range(5):
+                writer.add(("Ann", "Bob", "Ann", 5, "Network", [1, 4, 2, 5, 3], 3))
+            await asyncio.sleep(0.1)
+            self.assertEqual(writer.recorded, 5)
+            self.assertEqual(writer.batches, 1)
+
+            writer.add(("Ann", "Bob", None, 9, "Network"))
+            await writer.close()
+            self.assertEqual(writer.recorded, 6)
+            self.assertEqual(ScoreTracker(tracker.stats_file,
+                                          tracker.log_file).stats["total_games"], 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
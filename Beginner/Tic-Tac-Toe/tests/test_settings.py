@@ -0,0 +1,56 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from settings import DEFAULT_SETTINGS, SettingsStore
+
+
+class TestSettingsStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "settings.json")
+        self.store = SettingsStore(self.path)
+
+    def test_defaults_without_file(self):
+        """A missing file should give the defaults and write nothing."""
+        self.assertEqual(self.store.all(), DEFAULT_SETTINGS)
+        self.assertFalse(self.store.save())
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_reads_are_served_from_memory(self):
+        """The file should be parsed once, not on every read."""
+        with open(self.path, 'w') as f:
+            json.dump({"board_style": "minimal"}, f)
+        with mock.patch("settings.json.load", wraps=json.load) as load:
+            for _ in range(5):
+                self.assertEqual(self.store.get("board_style"), "minimal")
+            self.assertEqual(load.call_count, 1)
+
+    def test_writes_only_when_dirty(self):
+        """Setting an unchanged value should not rewrite the file."""
+        self.store["show_hints"] = False
+        self.assertTrue(self.store.save())
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+        self.store["show_hints"] = False
+        self.assertFalse(self.store.dirty)
+        self.assertFalse(self.store.save())
+        with open(self.path) as f:
+            self.assertFalse(json.load(f)["show_hints"])
+
+    def test_external_changes_are_picked_up(self):
+        """Another writer's change should show up via the mtime check."""
+        self.assertEqual(self.store.get("color_theme"), "default")
+        other = SettingsStore(self.path)
+        other["color_theme"] = "neon"
+        other.save()
+        os.utime(self.path, ns=(1, 1))
+        self.assertEqual(self.store.get("color_theme"), "neon")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+
+import scores
+from scores import ScoreTracker
+from simulate import simulate, percentile
+
+
+class TestSimulate(unittest.TestCase):
+
+    def setUp(self):
+        """Point the stats file at a temporary directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.old_files = (scores.STATS_FILE, scores.GAMES_LOG_FILE)
+        scores.STATS_FILE = os.path.join(self.tmp.name, "game_stats.json")
+        scores.GAMES_LOG_FILE = os.path.join(self.tmp.name, "game_log.jsonl")
+
+    def tearDown(self):
+        scores.STATS_FILE, scores.GAMES_LOG_FILE = self.old_files
+        self.tmp.cleanup()
+
+    def test_perfect_players_always_draw(self):
+        """Two minimax AIs should draw every game."""
+        report = simulate("HardAI", "ImpossibleAI", 20, workers=1)
+        self.assertEqual(report["draw_rate"], 1.0)
+        self.assertEqual(report["latency"]["X"]["moves"], 100)
+        self.assertGreater(report["games_per_second"], 0)
+
+    def test_results_recorded_in_bulk(self):
+        """Every simulated game should land in the stats store."""
+        tracker = ScoreTracker()
+        simulate("EasyAI", "EasyAI", 30, workers=1, chunk_size=7,
+                 seed=1, score_tracker=tracker)
+        self.assertEqual(tracker.stats["total_games"], 30)
+        self.assertEqual(ScoreTracker().stats["total_games"], 30)
+        x_stats = tracker.stats["players"]["Easy AI 🤖 (X)"]
+        self.assertEqual(x_stats["total_games"], 30)
+
+    def test_unknown_ai_rejected(self):
+        """Only AI classes from ai.py should be accepted."""
+        with self.assertRaises(ValueError):
+            simulate("NoSuchAI", "EasyAI", 1, workers=1)
+        with self.assertRaises(ValueError):
+            simulate("EasyAI", "ImpossibleAI", 1, workers=1, size=4)
+
+    def test_percentile(self):
+        """Nearest-rank percentiles of a sorted list."""
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([], 50), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+from ai import HardAI, ImpossibleAI, TranspositionTable
+from benchmark import reachable_positions
+from game import TicTacToe
+from opening_book import NUM_ENTRIES, OpeningBook, board_index, solve_game_tree
+
+try:
+    import solver
+except ImportError:
+    solver = None
+
+
+@unittest.skipIf(solver is None, "numpy is not installed")
+class TestVectorizedSolver(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.masks, cls.scores = solver.solve_tables()
+
+    def test_matches_recursive_solver(self):
+        """The vectorized table should equal the recursive solution."""
+        self.assertEqual(solver.solve_positions(), solve_game_tree())
+        self.assertEqual(self.scores[0], 0)
+
+    def test_layers(self):
+        """Layers should hold every reachable position by move count."""
+        layers = solver.reachable_layers()
+        self.assertEqual([len(layer) for layer in layers[:4]], [1, 9, 72, 252])
+        self.assertEqual(sum(map(len, layers)), 5478)
+
+    def test_search_ais_play_solved_moves(self):
+        """HardAI and ImpossibleAI searches should pick a best move everywhere."""
+        for cls in (HardAI, ImpossibleAI):
+            table = TranspositionTable()
+            for moves in reachable_positions():
+                game = TicTacToe()
+                for pos in moves:
+                    game.make_move(pos)
+                ai = cls(game.current_player, table=table, use_book=False)
+                move = ai.get_move(game)
+                mask = int(self.masks[board_index(game.board)])
+                self.assertTrue(mask >> (move - 1) & 1,
+                                f"{cls.__name__} played {move} after {moves}")
+
+    def test_in_memory_book(self):
+        """A book solved in memory should hold the solver's table."""
+        book = OpeningBook.solve()
+        for index in range(NUM_ENTRIES):
+            self.assertEqual(book.lookup_index(index),
+                             (self.masks[index], self.scores[index]))
+
+        game = TicTacToe()
+        for pos in (1, 2):
+            game.make_move(pos)
+        self.assertEqual(book.best_moves(game, 'X'), [4, 5, 7])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from startup_benchmark import find_regressions, measure_startup, parse_importtime
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       138 |        138 |   time
+import time:       612 |        612 |     _colorize
+import time:      2642 |       3254 |   display
+import time:       357 |       3749 | main
+"""
+
+
+class TestStartup(unittest.TestCase):
+
+    def test_parse_importtime(self):
+        """Each import line should give its name, times and nesting depth."""
+        self.assertEqual(parse_importtime(SAMPLE), [
+            ("time", 138, 138, 1),
+            ("_colorize", 612, 612, 2),
+            ("display", 2642, 3254, 1),
+            ("main", 357, 3749, 0),
+        ])
+
+    def test_cli_defers_heavy_imports(self):
+        """Importing main should load no AI, stats, settings or GUI module."""
+        report = measure_startup("main", runs=1)
+        self.assertEqual(report["eager_imports"], [])
+        self.assertGreater(report["import_ms_median"], 0)
+        self.assertEqual(find_regressions(report, {}), [])
+
+    def test_regressions(self):
+        """Slower imports past the threshold and eager imports should fail."""
+        report = {"import_ms_median": 20.0, "eager_imports": ["ai"]}
+        messages = find_regressions(report, {"import_ms_median": 10.0}, 0.25)
+        self.assertEqual(len(messages), 2)
+        self.assertEqual(find_regressions({"import_ms_median": 11.0,
+                                           "eager_imports": []},
+                                          {"import_ms_median": 10.0}), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
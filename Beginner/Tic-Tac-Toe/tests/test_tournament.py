@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+
+from scores import ScoreTracker
+from tournament import (Elo, Glicko, entrant_name, parse_entrant, run_tournament,
+                        swiss_pairings)
+
+
+class TestTournament(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.tracker = ScoreTracker(os.path.join(self.tmp.name, "stats.json"),
+                                    os.path.join(self.tmp.name, "log.jsonl"))
+
+    def test_parse_entrant(self):
+        """Entrant specs should give a class name and literal keyword arguments."""
+        self.assertEqual(parse_entrant("HardAI"), ("HardAI", {}))
+        self.assertEqual(parse_entrant("MCTSAI:iterations=200,seed=1"),
+                         ("MCTSAI", {"iterations": 200, "seed": 1}))
+        self.assertEqual(entrant_name("MCTSAI:iterations=5"),
+                         "MCTS AI 🤖 (Monte Carlo) [iterations=5]")
+        with self.assertRaises(ValueError):
+            parse_entrant("NoSuchAI")
+        with self.assertRaises(ValueError):
+            parse_entrant("MCTSAI:iterations")
+
+    def test_elo_and_glicko(self):
+        """Winners should gain rating, and Glicko deviations should shrink."""
+        elo = Elo()
+        for _ in range(10):
+            elo.update("a", "b", 1)
+        self.assertGreater(elo.rating("a"), 1500)
+        self.assertAlmostEqual(elo.rating("a") + elo.rating("b"), 3000)
+
+        glicko = Glicko()
+        glicko.add_results("a", "b", 10, 8.0)
+        glicko.end_period()
+        (r_a, rd_a), (r_b, rd_b) = glicko.rating("a"), glicko.rating("b")
+        self.assertGreater(r_a, 1500)
+        self.assertLess(r_b, 1500)
+        self.assertLess(rd_a, 350)
+        self.assertAlmostEqual(rd_a, rd_b)
+
+    def test_swiss_pairings(self):
+        """Swiss should avoid repeat pairings and rotate the bye."""
+        entrants = ["a", "b", "c", "d", "e"]
+        standings = {e: -i for i, e in enumerate(entrants)}
+        played = {frozenset(("a", "b")): 1, frozenset(("e",)): 1}
+        pairings = swiss_pairings(entrants, played, standings)
+        self.assertEqual(pairings, [("a", "c"), ("b", "e")])
+
+    def test_round_robin(self):
+        """A small tournament should rate the perfect AIs above EasyAI."""
+        report = run_tournament(["EasyAI", "HardAI", "ImpossibleAI"], rounds=2,
+                                games=50, workers=1, seed=1, chunk_size=20,
+                                score_tracker=self.tracker, record=True)
+        self.assertEqual(report["games"], 300)
+        standings = {row["entrant"]: row for row in report["standings"]}
+        self.assertEqual(report["standings"][-1]["entrant"], "EasyAI")
+        self.assertEqual(standings["HardAI"]["losses"], 0)
+        self.assertEqual(sum(row["points"] for row in report["standings"]), 300)
+
+        ratings = ScoreTracker(self.tracker.stats_file,
+                               self.tracker.log_file).stats["ratings"]
+        self.assertLess(ratings["elo"]["Easy AI 🤖"], 1500)
+        self.assertIn("rd", ratings["glicko"]["Hard AI 🤖 (Unbeatable)"])
+        self.assertEqual(self.tracker.stats["total_games"], 300)
+        record = next(self.tracker.iter_games())
+        self.assertEqual(record["mode"], "Tournament")
+        self.assertEqual(len(record["seq"]), record["moves"])
+
+    def test_invalid_tournaments(self):
+        """Unknown formats, one entrant and 3x3-only AIs on 4x4 are rejected."""
+        with self.assertRaises(ValueError):
+            run_tournament(["EasyAI", "HardAI"], tournament_format="knockout")
+        with self.assertRaises(ValueError):
+            run_tournament(["EasyAI", "EasyAI"])
+        with self.assertRaises(ValueError):
+            run_tournament(["EasyAI", "HardAI:use_book=False"], size=4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,393 @@
+"""
+Tournaments between the AI engines, with Elo and Glicko ratings.
+
+Entrants are AI class names from ai.py, optionally with constructor
+arguments after a colon (``MCTSAI:iterations=200,seed=1``). Each round
+every pairing plays a match of ``--games`` games with colours alternating.
+Round-robin pairs every entrant with every other; Swiss pairs entrants
+with similar scores, avoiding repeat pairings while it can.
+
+Games are played headless in worker processes. The workers never import
+display.py, and the ratings are updated as each chunk of results arrives:
+Elo after every game, Glicko once per round (one rating period). The
+ratings and final standings are written to the stats store; ``--record``
+also logs every game:
+
+    python tournament.py --rounds 10 --games 10000
+    python tournament.py --format swiss --rounds 4 EasyAI MediumAI HardAI \\
+        "MCTSAI:iterations=200"
+"""
+
+import argparse
+import ast
+import json
+import math
+import os
+import random
+import sys
+import time
+from array import array
+from itertools import combinations
+from multiprocessing import Pool
+
+from game import BitboardTicTacToe
+from replay import encode_moves
+from simulate import check_board_size, resolve_ai
+
+DEFAULT_ENTRANTS = ("EasyAI", "MediumAI", "HardAI", "ImpossibleAI")
+FORMATS = ("round-robin", "swiss")
+
+# Games per worker task; a match is split into chunks of this size
+CHUNK_SIZE = 2000
+
+
+def parse_entrant(spec):
+    """
+    Parse ``ClassName[:key=value,...]`` into ``(class_name, kwargs)``.
+
+    Values are Python literals where they parse as one, else strings.
+    Raises ValueError for an unknown class or a malformed argument.
+    """
+    class_name, _, arg_text = spec.partition(':')
+    resolve_ai(class_name)
+    kwargs = {}
+    for item in filter(None, arg_text.split(',')):
+        key, sep, value = item.partition('=')
+        if not sep:
+            raise ValueError(f"Expected key=value in {spec!r}, got {item!r}")
+        try:
+            kwargs[key.strip()] = ast.literal_eval(value.strip())
+        except (ValueError, SyntaxError):
+            kwargs[key.strip()] = value.strip()
+    return class_name, kwargs
+
+
+def _build_ai(spec, symbol):
+    class_name, kwargs = parse_entrant(spec)
+    return resolve_ai(class_name)(symbol, **kwargs)
+
+
+def entrant_name(spec):
+    """Return the display name an entrant is rated and recorded under."""
+    class_name, kwargs = parse_entrant(spec)
+    name = resolve_ai(class_name)('X', **kwargs).name
+    if kwargs:
+        name += " [" + ", ".join(f"{k}={v}" for k, v in kwargs.items()) + "]"
+    return name
+
+
+def _play_match(task):
+    """
+    Play one chunk of a match in a worker process.
+
+    Entrant A plays X in even-numbered games and O in odd ones. Returns the
+    task key, each game's result for A (1 win, 0 draw, -1 loss) as a byte
+    array, and when ``record`` is set the ``(moves, sequence)`` per game.
+    """
+    key, spec_a, spec_b, games, first_game, size, win_length, seed, record = task
+    if seed is not None:
+        random.seed(seed)
+
+    ais = {('A', 'X'): _build_ai(spec_a, 'X'), ('A', 'O'): _build_ai(spec_a, 'O'),
+           ('B', 'X'): _build_ai(spec_b, 'X'), ('B', 'O'): _build_ai(spec_b, 'O')}
+    results = array('b')
+    records = [] if record else None
+
+    game = BitboardTicTacToe(size, win_length)
+    for number in range(first_game, first_game + games):
+        a_symbol = 'X' if number % 2 == 0 else 'O'
+        players = {'X': ais[('A', 'X')] if a_symbol == 'X' else ais[('B', 'X')],
+                   'O': ais[('B', 'O')] if a_symbol == 'X' else ais[('A', 'O')]}
+        game.reset()
+        while not game.game_over:
+            game.make_move(players[game.current_player].get_move(game))
+
+        if game.winner is None:
+            results.append(0)
+        else:
+            results.append(1 if game.winner == a_symbol else -1)
+        if record:
+            records.append((game.move_count,
+                            encode_moves([pos for pos, _ in game.move_history],
+                                         game.num_cells)))
+    return key, first_game, results.tobytes(), records
+
+
+class Elo:
+    """Elo ratings updated after every game."""
+
+    def __init__(self, k=16, initial=1500.0):
+        self.k = k
+        self.initial = initial
+        self.ratings = {}
+
+    def rating(self, player):
+        return self.ratings.get(player, self.initial)
+
+    def expected(self, a, b):
+        """Expected score of ``a`` against ``b``."""
+        return 1 / (1 + 10 ** ((self.rating(b) - self.rating(a)) / 400))
+
+    def update(self, a, b, score):
+        """Apply one game; ``score`` is a's result (1, 0.5 or 0)."""
+        delta = self.k * (score - self.expected(a, b))
+        self.ratings[a] = self.rating(a) + delta
+        self.ratings[b] = self.rating(b) - delta
+
+
+class Glicko:
+    """
+    Glicko ratings with rating deviation, one rating period per round.
+
+    Results are collected per opponent during a period, so a period's cost
+    depends on the number of pairings, not games. end_period() applies
+    them all at once.
+    """
+
+    Q = math.log(10) / 400
+
+    def __init__(self, initial=1500.0, rd=350.0, c=30.0):
+        self.initial = initial
+        self.max_rd = rd
+        self.c = c
+        self.ratings = {}
+        self._period = {}
+
+    def rating(self, player):
+        return self.ratings.get(player, (self.initial, self.max_rd))
+
+    def add_results(self, a, b, games, score):
+        """Add ``games`` games between a and b in which a scored ``score``."""
+        for player, opponent, points in ((a, b, score), (b, a, games - score)):
+            totals = self._period.setdefault(player, {}).setdefault(opponent, [0, 0.0])
+            totals[0] += games
+            totals[1] += points
+
+    def _g(self, rd):
+        return 1 / math.sqrt(1 + 3 * (self.Q * rd / math.pi) ** 2)
+
+    def end_period(self):
+        """Update every rating from the results of the period."""
+        q = self.Q
+        updated = {}
+        for player, opponents in self._period.items():
+            r, rd = self.rating(player)
+            rd = min(math.sqrt(rd ** 2 + self.c ** 2), self.max_rd)
+            d_inv = 0.0
+            gain = 0.0
+            for opponent, (games, points) in opponents.items():
+                r_j, rd_j = self.rating(opponent)
+                g = self._g(rd_j)
+                e = 1 / (1 + 10 ** (-g * (r - r_j) / 400))
+                d_inv += q ** 2 * games * g ** 2 * e * (1 - e)
+                gain += g * (points - games * e)
+            precision = 1 / rd ** 2 + d_inv
+            updated[player] = (r + q / precision * gain, math.sqrt(1 / precision))
+        self.ratings.update(updated)
+        self._period = {}
+
+
+def round_robin_pairings(entrants, played=None, standings=None):
+    """Every entrant against every other."""
+    return list(combinations(entrants, 2))
+
+
+def swiss_pairings(entrants, played, standings):
+    """
+    Pair entrants with neighbours in the standings.
+
+    Each entrant, from the top, meets the highest-ranked remaining entrant
+    it has met least often. With an odd field the lowest-ranked entrant
+    with the fewest byes sits out; ``played`` counts byes under
+    ``frozenset((entrant,))``.
+    """
+    ranked = sorted(entrants, key=lambda e: standings[e], reverse=True)
+    if len(ranked) % 2:
+        ranked.remove(min(reversed(ranked),
+                          key=lambda e: played.get(frozenset((e,)), 0)))
+    pairings = []
+    while len(ranked) > 1:
+        first = ranked.pop(0)
+        opponent = min(ranked, key=lambda e: (played.get(frozenset((first, e)), 0),
+                                              ranked.index(e)))
+        ranked.remove(opponent)
+        pairings.append((first, opponent))
+    return pairings
+
+
+PAIRINGS = {"round-robin": round_robin_pairings, "swiss": swiss_pairings}
+
+
+def run_tournament(entrants=DEFAULT_ENTRANTS, rounds=1, games=1000,
+                   tournament_format="round-robin", workers=None, size=3,
+                   win_length=None, seed=None, chunk_size=CHUNK_SIZE,
+                   score_tracker=None, record=False):
+    """
+    Run a tournament and return a report dict.
+
+    ``entrants`` are entrant specs (see parse_entrant). With a
+    ``score_tracker`` the final ratings are stored in its snapshot, and
+    with ``record`` every game is logged through ``record_games``.
+    """
+    if tournament_format not in PAIRINGS:
+        raise ValueError(f"Unknown format: {tournament_format}")
+    if len(set(entrants)) < 2:
+        raise ValueError("A tournament needs at least two different entrants")
+    for spec in entrants:
+        check_board_size(parse_entrant(spec)[0], size)
+    names = {spec: entrant_name(spec) for spec in entrants}
+    if len(set(names.values())) < len(names):
+        raise ValueError("Entrants must have different names")
+    workers = workers or os.cpu_count() or 1
+
+    elo = Elo()
+    glicko = Glicko()
+    standings = {spec: {"points": 0.0, "wins": 0, "losses": 0, "draws": 0,
+                        "games": 0} for spec in entrants}
+    played = {}
+    total_games = 0
+    task_seed = seed
+
+    start = time.perf_counter()
+    with Pool(workers) as pool:
+        for round_number in range(1, rounds + 1):
+            points = {spec: (standings[spec]["points"], elo.rating(names[spec]))
+                      for spec in entrants}
+            pairings = PAIRINGS[tournament_format](entrants, played, points)
+            paired = {spec for pair in pairings for spec in pair}
+            for spec in entrants:
+                if spec not in paired:
+                    played[frozenset((spec,))] = played.get(frozenset((spec,)), 0) + 1
+
+            tasks = []
+            for key, (a, b) in enumerate(pairings):
+                played[frozenset((a, b))] = played.get(frozenset((a, b)), 0) + 1
+                for first in range(0, games, chunk_size):
+                    count = min(chunk_size, games - first)
+                    tasks.append((key, a, b, count, first, size, win_length,
+                                  task_seed, record))
+                    if task_seed is not None:
+                        task_seed += 1
+
+            for key, first, raw, records in pool.imap_unordered(_play_match, tasks):
+                a, b = pairings[key]
+                name_a, name_b = names[a], names[b]
+                results = array('b')
+                results.frombytes(raw)
+
+                score = 0.0
+                for result in results:
+                    game_score = (result + 1) / 2
+                    elo.update(name_a, name_b, game_score)
+                    score += game_score
+                wins, losses = results.count(1), results.count(-1)
+                draws = len(results) - wins - losses
+                glicko.add_results(name_a, name_b, len(results), score)
+                for spec, w, l, s in ((a, wins, losses, score),
+                                      (b, losses, wins, len(results) - score)):
+                    row = standings[spec]
+                    row["points"] += s
+                    row["wins"] += w
+                    row["losses"] += l
+                    row["draws"] += draws
+                    row["games"] += len(results)
+                total_games += len(results)
+
+                if record and score_tracker is not None:
+                    batch = []
+                    for number, result, (moves, sequence) in zip(
+                            range(first, first + len(results)), results, records):
+                        x_name, o_name = ((name_a, name_b) if number % 2 == 0
+                                          else (name_b, name_a))
+                        winner = {1: name_a, -1: name_b}.get(result)
+                        batch.append((x_name, o_name, winner, moves, "Tournament",
+                                      sequence, size))
+                    score_tracker.record_games(batch)
+            glicko.end_period()
+    elapsed = time.perf_counter() - start
+
+    table = []
+    for spec in entrants:
+        name = names[spec]
+        rating, rd = glicko.rating(name)
+        table.append({"entrant": spec, "name": name, **standings[spec],
+                      "elo": elo.rating(name), "glicko": rating, "glicko_rd": rd})
+    table.sort(key=lambda row: (-row["elo"], -row["points"]))
+
+    if score_tracker is not None:
+        score_tracker.set_ratings({
+            "elo": {row["name"]: round(row["elo"], 1) for row in table},
+            "glicko": {row["name"]: {"rating": round(row["glicko"], 1),
+                                     "rd": round(row["glicko_rd"], 1)}
+                       for row in table},
+        })
+
+    return {
+        "format": tournament_format,
+        "board": f"{size}x{size}",
+        "rounds": rounds,
+        "games_per_match": games,
+        "workers": workers,
+        "games": total_games,
+        "elapsed_s": elapsed,
+        "games_per_second": total_games / elapsed if elapsed else 0.0,
+        "standings": table,
+    }
+
+
+def print_report(report):
+    """Print the final standings."""
+    print(f"\n  {report['format'].title()} tournament, {report['board']} board: "
+          f"{report['rounds']} rounds x {report['games_per_match']} games per match\n")
+    print(f"  {'#':>2}  {'Entrant':<28}{'Elo':>7}{'Glicko':>8}{'RD':>6}"
+          f"{'W':>9}{'D':>9}{'L':>9}{'Pts %':>7}")
+    for rank, row in enumerate(report["standings"], 1):
+        pct = row["points"] / row["games"] if row["games"] else 0.0
+        print(f"  {rank:>2}  {row['entrant']:<28}{row['elo']:>7.0f}"
+              f"{row['glicko']:>8.0f}{row['glicko_rd']:>6.1f}{row['wins']:>9}"
+              f"{row['draws']:>9}{row['losses']:>9}{pct:>7.1%}")
+    print(f"\n  {report['games']} games in {report['elapsed_s']:.2f}s "
+          f"({report['games_per_second']:.0f} games/s on {report['workers']} workers)\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rate the AI engines in a tournament.")
+    parser.add_argument("entrants", nargs="*", default=list(DEFAULT_ENTRANTS),
+                        help="AI class names, optionally ClassName:key=value,...")
+    parser.add_argument("--format", choices=FORMATS, default="round-robin")
+    parser.add_argument("-r", "--rounds", type=int, default=1)
+    parser.add_argument("-g", "--games", type=int, default=1000,
+                        help="Games per match (per pairing per round)")
+    parser.add_argument("-w", "--workers", type=int, default=None)
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--win-length", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--no-save", action="store_true",
+                        help="Don't write ratings to the stats store")
+    parser.add_argument("--record", action="store_true",
+                        help="Also log every game in the stats store")
+    parser.add_argument("--json", action="store_true",
+                        help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    tracker = None
+    if not args.no_save:
+        from scores import ScoreTracker
+        tracker = ScoreTracker()
+
+    try:
+        report = run_tournament(args.entrants, args.rounds, args.games, args.format,
+                                args.workers, args.size, args.win_length, args.seed,
+                                score_tracker=tracker, record=args.record)
+    except (ValueError, TypeError) as e:
+        parser.error(str(e))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())